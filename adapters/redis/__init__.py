@@ -0,0 +1,5 @@
+"""Redis adapter for Aletheia Deep Research."""
+
+from .redis_database import RedisDatabase
+
+__all__ = ["RedisDatabase"]
@@ -0,0 +1,322 @@
+from datetime import datetime
+import json
+import logging
+import time
+from typing import Any
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from ports.database_port import DatabasePort
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 86400
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_POOL_TIMEOUT_SECONDS = 5.0
+MAX_LOG_ENTRIES = 10_000
+
+
+def _encode_fields(document: dict[str, Any]) -> dict[str, str]:
+    """JSON-encode each field so nested values survive the flat Redis hash."""
+    return {key: json.dumps(value, default=str) for key, value in document.items()}
+
+
+def _decode_fields(fields: dict[str, str]) -> dict[str, Any]:
+    """Inverse of _encode_fields."""
+    return {key: json.loads(value) for key, value in fields.items()}
+
+
+class RedisDatabase(DatabasePort):
+    """
+    Redis implementation of DatabasePort.
+
+    Tasks and reports are hashes that expire after ``ttl_seconds``, so memory stays
+    bounded and every API/worker process sees the same state. Sorted sets scored by
+    creation time back the list operations; logs are a capped list.
+    """
+
+    def __init__(
+        self,
+        connection_url: str,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        pool_timeout: float = DEFAULT_POOL_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize Redis client settings.
+
+        Args:
+            connection_url: Redis connection URL
+            ttl_seconds: Expiry for task and report records
+            max_connections: Size of the shared connection pool
+            pool_timeout: Seconds a command waits for a free pooled connection before failing
+        """
+        self.connection_url = connection_url
+        self.ttl_seconds = ttl_seconds
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.client: Redis | None = None
+        self._initialized = False
+
+    async def initialize(self):
+        """Initialize the Redis connection."""
+        if self._initialized:
+            return
+
+        try:
+            # Blocking pool: under a burst, commands wait for a connection instead of failing
+            # with MaxConnectionsError (which would surface as "task not found" or a lost update)
+            pool = BlockingConnectionPool.from_url(
+                self.connection_url,
+                decode_responses=True,
+                max_connections=self.max_connections,
+                timeout=self.pool_timeout,
+            )
+            # from_pool hands the pool to the client, so close() also disconnects its sockets
+            self.client = Redis.from_pool(pool)
+            await self.client.ping()
+            self._initialized = True
+            logger.info("Redis task store initialized")
+
+        except Exception as e:
+            logger.error(f"Failed to initialize Redis: {e}")
+            raise
+
+    async def _put(self, kind: str, record_id: str, document: dict[str, Any], created: float | None = None) -> None:
+        """Write hash fields, refresh the TTL and (on create) index the record by creation time."""
+        key = f"{kind}:{record_id}"
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=_encode_fields(document))
+            pipe.expire(key, self.ttl_seconds)
+            if created is not None:
+                pipe.zadd(f"{kind}s:by_created", {record_id: created})
+                pipe.zremrangebyscore(f"{kind}s:by_created", 0, created - self.ttl_seconds)
+            await pipe.execute()
+
+    async def _get(self, kind: str, record_id: str) -> dict[str, Any] | None:
+        fields = await self.client.hgetall(f"{kind}:{record_id}")
+        return _decode_fields(fields) if fields else None
+
+    async def _list(self, kind: str, limit: int, skip: int, status: str | None = None) -> list[dict[str, Any]]:
+        """List records newest first, skipping index entries whose hash has expired."""
+        index = f"{kind}s:by_created"
+        if status is None:
+            record_ids = await self.client.zrevrange(index, skip, skip + limit - 1)
+        else:
+            record_ids = await self.client.zrevrange(index, 0, -1)
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for record_id in record_ids:
+                pipe.hgetall(f"{kind}:{record_id}")
+            rows = await pipe.execute()
+
+        records = [_decode_fields(fields) for fields in rows if fields]
+        if status is not None:
+            records = [record for record in records if record.get("status") == status][skip : skip + limit]
+        return records
+
+    # === Task Operations ===
+
+    async def create_task(self, task_id: str, task_data: dict[str, Any]) -> bool:
+        """Create a new task record."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            now = datetime.utcnow()
+            task_document = {"task_id": task_id, "created_at": now, "updated_at": now, **task_data}
+            await self._put("task", task_id, task_document, created=time.time())
+            logger.info(f"Task created: {task_id}")
+            return True
+
+        except RedisError as e:
+            logger.error(f"Failed to create task {task_id}: {e}")
+            return False
+
+    async def get_task(self, task_id: str) -> dict[str, Any] | None:
+        """Retrieve a task by ID."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            return await self._get("task", task_id)
+
+        except RedisError as e:
+            logger.error(f"Failed to get task {task_id}: {e}")
+            return None
+
+    async def update_task(self, task_id: str, task_data: dict[str, Any]) -> bool:
+        """Update an existing task."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            if not await self.client.exists(f"task:{task_id}"):
+                return False
+
+            await self._put("task", task_id, {**task_data, "updated_at": datetime.utcnow()})
+            logger.info(f"Task updated: {task_id}")
+            return True
+
+        except RedisError as e:
+            logger.error(f"Failed to update task {task_id}: {e}")
+            return False
+
+    async def delete_task(self, task_id: str) -> bool:
+        """Delete a task by ID."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.delete(f"task:{task_id}")
+                pipe.zrem("tasks:by_created", task_id)
+                deleted, _ = await pipe.execute()
+
+            if deleted:
+                logger.info(f"Task deleted: {task_id}")
+                return True
+            return False
+
+        except RedisError as e:
+            logger.error(f"Failed to delete task {task_id}: {e}")
+            return False
+
+    async def list_tasks(
+        self,
+        status: str | None = None,
+        limit: int = 100,
+        skip: int = 0
+    ) -> list[dict[str, Any]]:
+        """List tasks with optional filtering."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            return await self._list("task", limit, skip, status=status)
+
+        except RedisError as e:
+            logger.error(f"Failed to list tasks: {e}")
+            return []
+
+    # === Report Operations ===
+
+    async def create_report(self, task_id: str, report_data: dict[str, Any]) -> bool:
+        """Create or update a research report."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            now = datetime.utcnow()
+            report_document = {"task_id": task_id, "created_at": now, "updated_at": now, **report_data}
+            await self._put("report", task_id, report_document, created=time.time())
+            logger.info(f"Report created/updated for task: {task_id}")
+            return True
+
+        except RedisError as e:
+            logger.error(f"Failed to create report for task {task_id}: {e}")
+            return False
+
+    async def get_report(self, task_id: str) -> dict[str, Any] | None:
+        """Retrieve a report by task ID."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            return await self._get("report", task_id)
+
+        except RedisError as e:
+            logger.error(f"Failed to get report for task {task_id}: {e}")
+            return None
+
+    async def list_reports(
+        self,
+        limit: int = 100,
+        skip: int = 0
+    ) -> list[dict[str, Any]]:
+        """List all reports."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            return await self._list("report", limit, skip)
+
+        except RedisError as e:
+            logger.error(f"Failed to list reports: {e}")
+            return []
+
+    # === Log Operations ===
+
+    async def create_log(self, log_data: dict[str, Any]) -> bool:
+        """Create a log entry."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            log_document = {"timestamp": datetime.utcnow().isoformat(), **log_data}
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.rpush("logs", json.dumps(log_document, default=str))
+                pipe.ltrim("logs", -MAX_LOG_ENTRIES, -1)
+                await pipe.execute()
+            return True
+
+        except RedisError as e:
+            logger.error(f"Failed to create log: {e}")
+            return False
+
+    async def get_logs(
+        self,
+        task_id: str | None = None,
+        level: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        limit: int = 100,
+        skip: int = 0
+    ) -> list[dict[str, Any]]:
+        """Retrieve logs with optional filtering."""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            logs = []
+            for raw in reversed(await self.client.lrange("logs", 0, -1)):
+                log = json.loads(raw)
+                log["timestamp"] = datetime.fromisoformat(log["timestamp"])
+
+                if task_id and log.get("task_id") != task_id:
+                    continue
+                if level and log.get("level") != level:
+                    continue
+                if start_time and log["timestamp"] < start_time:
+                    continue
+                if end_time and log["timestamp"] > end_time:
+                    continue
+                logs.append(log)
+
+            return logs[skip : skip + limit]
+
+        except RedisError as e:
+            logger.error(f"Failed to get logs: {e}")
+            return []
+
+    # === Health Check ===
+
+    async def health_check(self) -> bool:
+        """Check if the database is available and healthy."""
+        try:
+            if not self._initialized:
+                await self.initialize()
+
+            return await self.client.ping()
+
+        except RedisError as e:
+            logger.error(f"Redis health check failed: {e}")
+            return False
+
+    async def close(self) -> None:
+        """Close database connections."""
+        if self.client:
+            await self.client.aclose()
+            logger.info("Redis connection closed")
+            self._initialized = False
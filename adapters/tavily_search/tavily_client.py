@@ -3,18 +3,60 @@ import hashlib
 import os
 from typing import Any
 
-from tavily import TavilyClient
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
 
 from domain.models.evidence import Evidence, EvidenceSource
 from ports.search_port import SearchPort
 
+TAVILY_API_URL = "https://api.tavily.com"
+
 
 class TavilySearchAdapter(SearchPort):
     def __init__(self):
         self.api_key = os.getenv("TAVILY_API_KEY")
         if not self.api_key or self.api_key == "pon_tu_api_key_aqui":
             raise ValueError("TAVILY_API_KEY environment variable not set or is a placeholder.")
-        self.client = TavilyClient(api_key=self.api_key)
+        # Keep-alive pool for the synchronous search, search_news and get_source_content calls, so repeat calls skip the TCP+TLS handshake
+        self.client = httpx.Client(
+            base_url=TAVILY_API_URL,
+            http2=H2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        # asearch has its own async pool, with a separate connection limit to the same host, so parallel sub-tasks run as coroutines instead of threads
+        self.async_client = httpx.AsyncClient(
+            base_url=TAVILY_API_URL,
+            http2=H2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+
+    def _post(self, endpoint: str, **payload: Any) -> dict[str, Any]:
+        """POST a Tavily API request over the pooled client and return the decoded body."""
+        response = self.client.post(endpoint, json={"api_key": self.api_key, **payload})
+        response.raise_for_status()
+        return response.json()
+
+    async def _apost(self, endpoint: str, **payload: Any) -> dict[str, Any]:
+        """POST a Tavily API request over the pooled async client and return the decoded body."""
+        response = await self.async_client.post(endpoint, json={"api_key": self.api_key, **payload})
+        response.raise_for_status()
+        return response.json()
+
+    def close(self) -> None:
+        """Close pooled connections to the Tavily API."""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the async client's pooled connections to the Tavily API."""
+        await self.async_client.aclose()
 
     def search(self, query: str, max_results: int = 10, **kwargs: Any) -> list[Evidence]:
         """
@@ -22,7 +64,20 @@ class TavilySearchAdapter(SearchPort):
         """
         try:
             search_depth = kwargs.get("search_depth", "advanced")
-            response = self.client.search(query=query, search_depth=search_depth, max_results=max_results)
+            response = self._post("/search", query=query, search_depth=search_depth, max_results=max_results)
+            results = response.get("results", [])
+            return self._convert_to_evidence(results, query)
+        except Exception as e:
+            print(f"Error during Tavily search: {e}")
+            return []
+
+    async def asearch(self, query: str, max_results: int = 10, **kwargs: Any) -> list[Evidence]:
+        """
+        Perform a web search on the event loop and return evidence.
+        """
+        try:
+            search_depth = kwargs.get("search_depth", "advanced")
+            response = await self._apost("/search", query=query, search_depth=search_depth, max_results=max_results)
             results = response.get("results", [])
             return self._convert_to_evidence(results, query)
         except Exception as e:
@@ -35,7 +90,7 @@ class TavilySearchAdapter(SearchPort):
         """
         try:
             # Tavily has news search capability
-            response = self.client.search(query=query, search_depth="advanced", max_results=max_results, topic="news")
+            response = self._post("/search", query=query, search_depth="advanced", max_results=max_results, topic="news")
             results = response.get("results", [])
             return self._convert_to_evidence(results, query)
         except Exception as e:
@@ -56,7 +111,7 @@ class TavilySearchAdapter(SearchPort):
         """
         try:
             # Tavily can extract content from URLs
-            response = self.client.extract(urls=[url])
+            response = self._post("/extract", urls=[url])
             if response and "results" in response:
                 return response["results"][0].get("content", "")
         except Exception as e:
@@ -69,7 +124,7 @@ class TavilySearchAdapter(SearchPort):
         """
         try:
             # Test with a simple search
-            response = self.client.search(query="test", max_results=1)
+            response = self._post("/search", query="test", max_results=1)
             return "results" in response
         except Exception:
             return False
@@ -8,6 +8,8 @@ from enum import Enum
 import json
 import logging
 import os
+import queue
+import threading
 import time
 from typing import Any
 import uuid
@@ -100,6 +102,11 @@ class EventLogger:
         self.session_id = str(uuid.uuid4())
         self._setup_file_logging()
 
+        # Events are appended to the NDJSON file by a background writer so callers never wait on disk I/O
+        self._write_queue: queue.SimpleQueue[ResearchEvent | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+
     def _setup_file_logging(self):
         """Setup file-based event logging."""
         self.artifacts_dir = os.getenv("ARTIFACTS_DIR", "./runs")
@@ -143,17 +150,52 @@ class EventLogger:
 
         # Log to standard logger
         level = logging.ERROR if error else logging.INFO
-        logger.log(level, f"[{event_type.value}] {task_id or 'no-task'}: {data}")
+        logger.log(level, "[%s] %s: %s", event_type.value, task_id or "no-task", data)
 
         return event
 
     def _write_event_to_file(self, event: ResearchEvent):
-        """Write event to NDJSON file."""
-        try:
-            with open(self.events_file, "a", encoding="utf-8") as f:
-                f.write(event.to_json() + "\n")
-        except Exception as e:
-            logger.error(f"Failed to write event to file: {e}")
+        """Queue event for the background NDJSON writer, starting it if needed."""
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._drain_write_queue, name="event-writer", daemon=True)
+                    self._writer.start()
+        self._write_queue.put(event)
+
+    def _drain_write_queue(self):
+        """Append queued events to the NDJSON file, one write per batch, until close() sends the sentinel."""
+        while True:
+            event = self._write_queue.get()
+            if event is None:
+                return
+            batch = [event]
+            # Pick up everything queued meanwhile so a burst of events costs one file open
+            while True:
+                try:
+                    event = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is None:
+                    break
+                batch.append(event)
+
+            try:
+                with open(self.events_file, "a", encoding="utf-8") as f:
+                    f.write("".join(e.to_json() + "\n" for e in batch))
+            except Exception as e:
+                logger.error("Failed to write event to file: %s", e)
+
+            if event is None:
+                return
+
+    def close(self, timeout: float = 5.0):
+        """Write out queued events and stop the background writer; the next event starts a new one."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                self._write_queue.put(None)
+                writer.join(timeout)
 
     def log_research_started(self, task_id: str, query: str, config: dict[str, Any]):
         """Log research process start."""
@@ -0,0 +1,27 @@
+"""
+Logging setup for Aletheia Deep Research.
+Routes log records through a queue so handler I/O never blocks the event loop.
+"""
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import os
+import queue
+
+
+def setup_logging() -> QueueListener:
+    """
+    Configure root logging with a QueueHandler drained by a background QueueListener.
+
+    The level comes from LOG_LEVEL (default INFO). Returns the started listener;
+    call stop() on shutdown to flush pending records.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), handlers=[QueueHandler(log_queue)])
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -15,9 +15,13 @@ from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 
 logger = logging.getLogger(__name__)
 
+# Probe and polling endpoints hit every few seconds; no server spans for these
+DEFAULT_EXCLUDED_URLS = "/health$,/tasks/[^/]+/status$,/deep-research/[^/]+$"
+
 
 class TelemetryManager:
     """Manages OpenTelemetry configuration and tracing for Aletheia."""
@@ -55,8 +59,9 @@ class TelemetryManager:
                 }
             )
 
-            # Create tracer provider
-            self.tracer_provider = TracerProvider(resource=resource)
+            # Create tracer provider; child spans follow the root's sampling decision so traces stay whole
+            sampler = ParentBased(root=TraceIdRatioBased(float(os.getenv("OTEL_TRACES_SAMPLER_ARG", "0.1"))))
+            self.tracer_provider = TracerProvider(resource=resource, sampler=sampler)
             trace.set_tracer_provider(self.tracer_provider)
 
             # Configure exporters
@@ -86,7 +91,7 @@ class TelemetryManager:
         if otlp_endpoint:
             try:
                 otlp_exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
-                otlp_processor = BatchSpanProcessor(otlp_exporter)
+                otlp_processor = self._batch_processor(otlp_exporter)
                 self.tracer_provider.add_span_processor(otlp_processor)
                 logger.info(f"OTLP exporter configured for {otlp_endpoint}")
             except Exception as e:
@@ -95,9 +100,23 @@ class TelemetryManager:
         # Console exporter for development
         if os.getenv("ENVIRONMENT") == "development":
             console_exporter = ConsoleSpanExporter()
-            console_processor = BatchSpanProcessor(console_exporter)
+            console_processor = self._batch_processor(console_exporter)
             self.tracer_provider.add_span_processor(console_processor)
 
+    @staticmethod
+    def _batch_processor(exporter) -> BatchSpanProcessor:
+        """Create a batch processor sized for API burst traffic, tunable via OTEL_BSP_* env vars."""
+        max_queue_size = int(os.getenv("OTEL_BSP_MAX_QUEUE_SIZE", "4096"))
+        # The SDK rejects batches larger than the queue, so a small queue override shrinks the batch too
+        max_export_batch_size = min(int(os.getenv("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "256")), max_queue_size)
+        return BatchSpanProcessor(
+            exporter,
+            max_queue_size=max_queue_size,
+            max_export_batch_size=max_export_batch_size,
+            schedule_delay_millis=int(os.getenv("OTEL_BSP_SCHEDULE_DELAY", "1000")),
+            export_timeout_millis=int(os.getenv("OTEL_BSP_EXPORT_TIMEOUT", "10000")),
+        )
+
     def _setup_instrumentation(self) -> None:
         """Setup automatic instrumentation."""
         try:
@@ -108,12 +127,13 @@ class TelemetryManager:
             logger.warning(f"Failed to instrument HTTPX: {e}")
 
     def instrument_fastapi(self, app) -> None:
-        """Instrument FastAPI application."""
+        """Instrument FastAPI application, skipping health checks and status polls."""
         if not self.initialized:
             self.setup_tracing()
 
         try:
-            FastAPIInstrumentor.instrument_app(app)
+            excluded_urls = os.getenv("OTEL_PYTHON_FASTAPI_EXCLUDED_URLS", DEFAULT_EXCLUDED_URLS)
+            FastAPIInstrumentor.instrument_app(app, excluded_urls=excluded_urls)
             logger.info("FastAPI instrumentation enabled")
         except Exception as e:
             logger.warning(f"Failed to instrument FastAPI: {e}")
@@ -124,6 +144,11 @@ class TelemetryManager:
             self.setup_tracing()
         return self.tracer or trace.NoOpTracer()
 
+    def shutdown(self) -> None:
+        """Export buffered spans and stop the span processors."""
+        if self.tracer_provider:
+            self.tracer_provider.shutdown()
+
 
 # Global telemetry manager instance
 telemetry_manager = TelemetryManager()
@@ -152,14 +177,25 @@ def trace_operation(name: str, attributes: dict[str, Any | None] = None, tracer:
             raise
 
 
-def trace_async_operation(operation_name: str, attributes: dict[str, Any | None] = None):
-    """Decorator for tracing async operations."""
+def trace_async_operation(operation_name: str, attributes: dict[str, Any | None] = None, link_kwarg: str | None = None):
+    """
+    Decorator for tracing async operations.
+
+    When ``link_kwarg`` is set, the wrapper pops that keyword argument from the call and,
+    if it holds a valid SpanContext, links the operation span to it. Background work keeps
+    a pointer back to the request span that scheduled it.
+    """
 
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             tracer = get_tracer()
-            with tracer.start_as_current_span(operation_name) as span:
+            links = None
+            if link_kwarg:
+                parent_ctx = kwargs.pop(link_kwarg, None)
+                if parent_ctx is not None and parent_ctx.is_valid:
+                    links = [trace.Link(parent_ctx)]
+            with tracer.start_as_current_span(operation_name, links=links) as span:
                 # Add attributes
                 if attributes:
                     for key, value in attributes.items():
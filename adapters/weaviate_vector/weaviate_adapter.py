@@ -1,11 +1,79 @@
-from datetime import datetime
+from datetime import datetime, timezone
+import importlib.util
+import logging
 import os
+import re
+import sys
+from typing import Any
 
 import weaviate
+from weaviate.batch.requests import ObjectsBatchRequest
+from weaviate.util import generate_uuid5
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from domain.models.evidence import Evidence, EvidenceSource
 from ports.vector_store_port import VectorStorePort
 
+logger = logging.getLogger(__name__)
+
+# Stored property names, in the order produced by _evidence_values
+_EVIDENCE_KEYS = (
+    "evidence_id",
+    "excerpt",
+    "source_url",
+    "source_title",
+    "fetched_at",
+    "hash",
+    "tool_call_id",
+    "score",
+    "tags",
+    "cit_key",
+)
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokens(text: str) -> set[str]:
+    """Lowercased word tokens, ignoring punctuation, for the mock keyword index."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _to_epoch(fetched_at: datetime) -> int:
+    """Convert a (naive UTC or aware) datetime to epoch seconds for storage."""
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    return int(fetched_at.timestamp())
+
+
+def _evidence_values(evidence: Evidence) -> tuple:
+    """Project evidence onto _EVIDENCE_KEYS; tag strings are interned since they repeat across objects."""
+    return (
+        evidence.id,
+        evidence.excerpt,
+        evidence.source.url,
+        evidence.source.title,
+        _to_epoch(evidence.source.fetched_at),
+        evidence.hash or "",
+        evidence.tool_call_id or "",
+        evidence.score or 0.0,
+        [sys.intern(tag) for tag in evidence.tags],
+        evidence.cit_key or "",
+    )
+
+
+def _from_stored(fetched_at: int | float | str) -> datetime:
+    """Rebuild a naive UTC datetime from a stored value (epoch, or ISO string for legacy objects)."""
+    if isinstance(fetched_at, str):
+        return datetime.fromisoformat(fetched_at)
+    return datetime.utcfromtimestamp(fetched_at)
+
 
 class WeaviateVectorAdapter(VectorStorePort):
     """Weaviate implementation of VectorStorePort using v3 API."""
@@ -14,9 +82,26 @@ class WeaviateVectorAdapter(VectorStorePort):
         self.host = os.getenv("WEAVIATE_HOST", "http://localhost:8080")
         self.mock_mode = force_mock
         self.client = None
+        # gRPC search transport (weaviate-client[grpc]) for nearVector searches. The client only falls back to
+        # GraphQL when the port is unreachable at startup; search_similar retries failed gRPC calls over GraphQL
+        grpc_port = os.getenv("WEAVIATE_GRPC_PORT")
+        self.grpc_port = int(grpc_port) if grpc_port else None
+
+        # Optional client-side embeddings: when set, objects carry their own vectors
+        # and Weaviate never runs a vectorizer module
+        self.embedding_model = os.getenv("WEAVIATE_EMBEDDING_MODEL")
+        self._embedder: Any = None
+        if self.embedding_model and importlib.util.find_spec("sentence_transformers") is None:
+            logger.warning("WEAVIATE_EMBEDDING_MODEL is set but sentence-transformers is not installed. Using server-side vectorization.")
+            self.embedding_model = None
+
+        # fetched_at dataType per known collection; classes created before epoch storage use "text"
+        self._fetched_at_types: dict[str, str] = {}
 
         # Mock storage for when Weaviate is not available
         self.mock_store: dict[str, list[dict]] = {}
+        # Inverted keyword index for mock search: collection -> token -> row indexes
+        self._mock_index: dict[str, dict[str, set[int]]] = {}
 
         # Skip connection if force_mock is enabled
         if force_mock:
@@ -24,14 +109,15 @@ class WeaviateVectorAdapter(VectorStorePort):
 
         try:
             # Try to connect to Weaviate using v3 API
-            self.client = weaviate.Client(url=self.host)
+            additional_config = weaviate.Config(grpc_port_experimental=self.grpc_port) if self.grpc_port else None
+            self.client = weaviate.Client(url=self.host, additional_config=additional_config)
             # Test connection
             if not self.health_check():
-                print(f"Warning: Could not connect to Weaviate at {self.host}. Using mock mode.")
+                logger.warning("Could not connect to Weaviate at %s. Using mock mode.", self.host)
                 self.mock_mode = True
                 self.client = None
         except Exception as e:
-            print(f"Warning: Weaviate connection failed: {e}. Using mock mode.")
+            logger.warning("Weaviate connection failed: %s. Using mock mode.", e)
             self.mock_mode = True
             self.client = None
 
@@ -44,58 +130,98 @@ class WeaviateVectorAdapter(VectorStorePort):
             # Create collection if it doesn't exist
             self.create_collection(collection_name)
 
-            # Prepare data object (using evidence_id instead of id - reserved in Weaviate)
-            data_object = {
-                "evidence_id": evidence.id,
-                "excerpt": evidence.excerpt,
-                "source_url": evidence.source.url,
-                "source_title": evidence.source.title,
-                "fetched_at": evidence.source.fetched_at.isoformat(),
-                "hash": evidence.hash or "",
-                "tool_call_id": evidence.tool_call_id or "",
-                "score": evidence.score or 0.0,
-                "tags": evidence.tags or [],
-                "cit_key": evidence.cit_key or "",
-            }
-
-            # Insert object with vector (Weaviate will auto-vectorize based on excerpt)
-            self.client.data_object.create(data_object=data_object, class_name=collection_name, uuid=evidence.id)
+            # Insert object with its precomputed vector, or let Weaviate vectorize the excerpt
+            vectors = self._embed([evidence.excerpt])
+            self.client.data_object.create(
+                data_object=self._data_object(evidence, collection_name),
+                class_name=collection_name,
+                uuid=generate_uuid5(evidence.id),
+                vector=vectors[0] if vectors else None,
+            )
 
-            print(f"Stored evidence {evidence.id} in Weaviate collection {collection_name}")
+            logger.debug("Stored evidence %s in Weaviate collection %s", evidence.id, collection_name)
             return True
 
         except Exception as e:
-            print(f"Error storing evidence in Weaviate: {e}")
+            logger.warning("Error storing evidence in Weaviate: %s", e)
             return False
 
+    def store_evidence_batch(self, evidence_list: list[Evidence], collection_name: str = "default") -> int:
+        """Store evidence in one /batch/objects request, embedding all excerpts together."""
+        if not evidence_list:
+            return 0
+        if self.mock_mode:
+            return sum(self._mock_store_evidence(evidence, collection_name) for evidence in evidence_list)
+
+        try:
+            self.create_collection(collection_name)
+
+            vectors = self._embed([evidence.excerpt for evidence in evidence_list])
+            batch = ObjectsBatchRequest()
+            for i, evidence in enumerate(evidence_list):
+                batch.add(
+                    self._data_object(evidence, collection_name),
+                    collection_name,
+                    uuid=generate_uuid5(evidence.id),
+                    vector=vectors[i] if vectors else None,
+                )
+
+            # Sent on the client's connection rather than through client.batch, whose object queue is
+            # shared by every thread storing evidence
+            response = self.client._connection.post(path="/batch/objects", weaviate_object=batch.get_request_body())
+            response.raise_for_status()
+
+            # The request succeeds as a whole even when single objects are rejected
+            failed = 0
+            for item in response.json():
+                errors = item.get("result", {}).get("errors")
+                if errors:
+                    failed += 1
+                    logger.warning("Error storing evidence %s in Weaviate: %s", item.get("properties", {}).get("evidence_id"), errors)
+
+            logger.debug("Stored %d/%d evidence items in Weaviate collection %s", len(evidence_list) - failed, len(evidence_list), collection_name)
+            return len(evidence_list) - failed
+
+        except Exception as e:
+            logger.warning("Error storing evidence batch in Weaviate: %s", e)
+            return 0
+
+    def _data_object(self, evidence: Evidence, collection_name: str) -> dict:
+        """Stored properties for evidence (evidence_id rather than the reserved id)."""
+        data_object = dict(zip(_EVIDENCE_KEYS, _evidence_values(evidence), strict=True))
+        if self._fetched_at_types.get(collection_name) == "text":
+            # Collection names derive from the query, so older classes with an ISO-string schema are reused
+            data_object["fetched_at"] = evidence.source.fetched_at.isoformat()
+        return data_object
+
     def search_similar(self, query: str, collection_name: str = "default", limit: int = 5) -> list[Evidence]:
         """Search for similar evidence using semantic search."""
         if self.mock_mode:
             return self._mock_search_similar(query, collection_name, limit)
 
         try:
-            # Perform semantic search using nearText
-            response = (
-                self.client.query.get(
-                    collection_name,
-                    [
-                        "evidence_id",
-                        "excerpt",
-                        "source_url",
-                        "source_title",
-                        "fetched_at",
-                        "hash",
-                        "tool_call_id",
-                        "score",
-                        "tags",
-                        "cit_key",
-                    ],
-                )
-                .with_near_text({"concepts": [query]})
-                .with_additional(["score"])
-                .with_limit(limit)
-                .do()
-            )
+            # Perform semantic search using nearVector with local embeddings, nearText otherwise
+            query_builder = self.client.query.get(collection_name, list(_EVIDENCE_KEYS))
+            vectors = self._embed([query])
+            if vectors and self.grpc_port:
+                # The v3 client only takes its gRPC path for nearVector queries without _additional fields,
+                # so results carry the stored evidence score instead of a search score
+                query_builder = query_builder.with_near_vector({"vector": vectors[0]}).with_limit(limit)
+                response = query_builder.do()
+                if "errors" in response:
+                    # A failed gRPC call comes back as {"errors": [...]} instead of raising
+                    logger.warning("Weaviate gRPC search failed, retrying over GraphQL: %s", response["errors"])
+                    response = self._run_query(query_builder.with_additional(["score"]))
+            else:
+                if vectors:
+                    query_builder = query_builder.with_near_vector({"vector": vectors[0]})
+                else:
+                    query_builder = query_builder.with_near_text({"concepts": [query]})
+                query_builder = query_builder.with_additional(["score"]).with_limit(limit)
+                response = self._run_query(query_builder)
+
+            if "errors" in response:
+                logger.warning("Weaviate search returned errors: %s", response["errors"])
 
             # Convert results to Evidence objects
             results = []
@@ -106,35 +232,60 @@ class WeaviateVectorAdapter(VectorStorePort):
                         source=EvidenceSource(
                             url=obj["source_url"],
                             title=obj["source_title"],
-                            fetched_at=datetime.fromisoformat(obj["fetched_at"]),
+                            fetched_at=_from_stored(obj["fetched_at"]),
                         ),
                         excerpt=obj["excerpt"],
                         hash=obj.get("hash") or None,
                         tool_call_id=obj.get("tool_call_id") or None,
-                        score=obj.get("_additional", {}).get("score", obj.get("score", 0.0)),
+                        score=float(obj.get("_additional", {}).get("score", obj.get("score", 0.0))),
                         tags=obj.get("tags", []),
                         cit_key=obj.get("cit_key") or None,
                     )
                     results.append(evidence)
 
-            print(f"Found {len(results)} similar evidence items for query: {query}")
+            logger.debug("Found %d similar evidence items for query: %s", len(results), query)
             return results
 
         except Exception as e:
-            print(f"Error searching in Weaviate: {e}")
+            logger.warning("Error searching in Weaviate: %s", e)
             return []
 
+    def _embed(self, texts: list[str]) -> list[list[float]] | None:
+        """Embed texts in one batch with the local model, or None when Weaviate vectorizes server-side."""
+        if not self.embedding_model:
+            return None
+
+        if self._embedder is None:
+            from sentence_transformers import SentenceTransformer
+
+            self._embedder = SentenceTransformer(self.embedding_model)
+
+        return self._embedder.encode(texts, batch_size=64, normalize_embeddings=True).tolist()
+
+    def _run_query(self, query_builder) -> dict:
+        """Run a query over GraphQL, decoding the response with orjson when it is installed."""
+        # Same request GraphQL.do() sends; posting it directly also keeps GetBuilder.do() from taking the gRPC path
+        response = self.client._connection.post(path="/graphql", weaviate_object={"query": query_builder.build()})
+        response.raise_for_status()
+        return orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+
     def create_collection(self, collection_name: str) -> bool:
         """Create a Weaviate collection/class."""
         if self.mock_mode:
             self.mock_store[collection_name] = []
+            self._mock_index[collection_name] = {}
             return True
 
         try:
-            # Check if collection already exists
+            if collection_name in self._fetched_at_types:
+                return True
+
+            # Check if collection already exists, remembering how it stores fetched_at
             schema = self.client.schema.get()
             for class_obj in schema.get("classes", []):
                 if class_obj["class"] == collection_name:
+                    data_types = {prop["name"]: prop["dataType"][0] for prop in class_obj.get("properties", [])}
+                    self._fetched_at_types[collection_name] = data_types.get("fetched_at", "int")
                     return True
 
             # Create collection with schema
@@ -146,7 +297,7 @@ class WeaviateVectorAdapter(VectorStorePort):
                     {"name": "excerpt", "dataType": ["text"]},
                     {"name": "source_url", "dataType": ["text"]},
                     {"name": "source_title", "dataType": ["text"]},
-                    {"name": "fetched_at", "dataType": ["text"]},
+                    {"name": "fetched_at", "dataType": ["int"]},
                     {"name": "hash", "dataType": ["text"]},
                     {"name": "tool_call_id", "dataType": ["text"]},
                     {"name": "score", "dataType": ["number"]},
@@ -154,29 +305,33 @@ class WeaviateVectorAdapter(VectorStorePort):
                     {"name": "cit_key", "dataType": ["text"]},
                 ],
             }
+            if self.embedding_model:
+                class_definition["vectorizer"] = "none"
 
             self.client.schema.create_class(class_definition)
-            print(f"Created Weaviate collection: {collection_name}")
+            self._fetched_at_types[collection_name] = "int"
+            logger.debug("Created Weaviate collection: %s", collection_name)
             return True
 
         except Exception as e:
-            print(f"Error creating Weaviate collection: {e}")
+            logger.warning("Error creating Weaviate collection: %s", e)
             return False
 
     def delete_collection(self, collection_name: str) -> bool:
         """Delete a Weaviate collection."""
         if self.mock_mode:
-            if collection_name in self.mock_store:
-                del self.mock_store[collection_name]
+            self.mock_store.pop(collection_name, None)
+            self._mock_index.pop(collection_name, None)
             return True
 
         try:
+            self._fetched_at_types.pop(collection_name, None)
             self.client.schema.delete_class(collection_name)
-            print(f"Deleted Weaviate collection: {collection_name}")
+            logger.debug("Deleted Weaviate collection: %s", collection_name)
             return True
 
         except Exception as e:
-            print(f"Error deleting Weaviate collection: {e}")
+            logger.warning("Error deleting Weaviate collection: %s", e)
             return False
 
     def health_check(self) -> bool:
@@ -194,25 +349,18 @@ class WeaviateVectorAdapter(VectorStorePort):
     # Mock methods for when Weaviate is not available
     def _mock_store_evidence(self, evidence: Evidence, collection_name: str) -> bool:
         """Mock storage for testing without Weaviate."""
-        if collection_name not in self.mock_store:
-            self.mock_store[collection_name] = []
+        rows = self.mock_store.setdefault(collection_name, [])
+        index = self._mock_index.setdefault(collection_name, {})
 
         # Convert evidence to dict for storage
-        evidence_dict = {
-            "evidence_id": evidence.id,
-            "excerpt": evidence.excerpt,
-            "source_url": evidence.source.url,
-            "source_title": evidence.source.title,
-            "fetched_at": evidence.source.fetched_at.isoformat(),
-            "hash": evidence.hash,
-            "tool_call_id": evidence.tool_call_id,
-            "score": evidence.score,
-            "tags": evidence.tags,
-            "cit_key": evidence.cit_key,
-        }
-
-        self.mock_store[collection_name].append(evidence_dict)
-        print(f"[MOCK] Stored evidence {evidence.id} in collection {collection_name}")
+        evidence_dict = dict(zip(_EVIDENCE_KEYS, _evidence_values(evidence), strict=True))
+
+        row = len(rows)
+        rows.append(evidence_dict)
+        for token in _tokens(evidence.excerpt):
+            index.setdefault(token, set()).add(row)
+
+        logger.debug("[MOCK] Stored evidence %s in collection %s", evidence.id, collection_name)
         return True
 
     def _mock_search_similar(self, query: str, collection_name: str, limit: int) -> list[Evidence]:
@@ -220,30 +368,32 @@ class WeaviateVectorAdapter(VectorStorePort):
         if collection_name not in self.mock_store:
             return []
 
-        # Simple keyword matching for mock
-        results = []
-        query_lower = query.lower()
-
-        for evidence_dict in self.mock_store[collection_name]:
-            if query_lower in evidence_dict["excerpt"].lower():
-                evidence = Evidence(
-                    id=evidence_dict["evidence_id"],
-                    source=EvidenceSource(
-                        url=evidence_dict["source_url"],
-                        title=evidence_dict["source_title"],
-                        fetched_at=datetime.fromisoformat(evidence_dict["fetched_at"]),
-                    ),
-                    excerpt=evidence_dict["excerpt"],
-                    hash=evidence_dict["hash"],
-                    tool_call_id=evidence_dict["tool_call_id"],
-                    score=evidence_dict["score"],
-                    tags=evidence_dict["tags"],
-                    cit_key=evidence_dict["cit_key"],
-                )
-                results.append(evidence)
+        # Keyword matching for mock: rows containing every query token
+        index = self._mock_index.get(collection_name, {})
+        tokens = _tokens(query)
+        if not tokens:
+            return []
+        matches = set.intersection(*(index.get(token, set()) for token in tokens))
 
-                if len(results) >= limit:
-                    break
+        rows = self.mock_store[collection_name]
+        results = []
+        for row in sorted(matches)[:limit]:
+            evidence_dict = rows[row]
+            evidence = Evidence(
+                id=evidence_dict["evidence_id"],
+                source=EvidenceSource(
+                    url=evidence_dict["source_url"],
+                    title=evidence_dict["source_title"],
+                    fetched_at=_from_stored(evidence_dict["fetched_at"]),
+                ),
+                excerpt=evidence_dict["excerpt"],
+                hash=evidence_dict["hash"] or None,
+                tool_call_id=evidence_dict["tool_call_id"] or None,
+                score=evidence_dict["score"],
+                tags=evidence_dict["tags"],
+                cit_key=evidence_dict["cit_key"] or None,
+            )
+            results.append(evidence)
 
-        print(f"[MOCK] Found {len(results)} similar evidence items for query: {query}")
+        logger.debug("[MOCK] Found %d similar evidence items for query: %s", len(results), query)
         return results
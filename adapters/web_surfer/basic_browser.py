@@ -6,6 +6,8 @@ from typing import Any
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from bs4 import BeautifulSoup
@@ -19,6 +21,8 @@ from ports.browser_port import BrowserPort
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+
 
 class BasicBrowserAdapter(BrowserPort):
     """Basic browser implementation using requests and BeautifulSoup."""
@@ -28,16 +32,38 @@ class BasicBrowserAdapter(BrowserPort):
         self.session.headers.update(
             {"User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) " "AppleWebKit/537.36 (KHTML, like Gecko) " "Chrome/91.0.4472.124 Safari/537.36")}
         )
+        # gzip/deflate are decoded natively by urllib3; br would need the optional brotli package
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+
+        # Keep-alive pool sized for concurrent fetches, with retries on transient GET failures
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+        )
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.timeout = 30
+        # Pages are parsed from at most this many bytes; the tail of huge pages is never downloaded
+        self.max_content_bytes = 2_000_000
 
         if not BS4_AVAILABLE:
             logger.warning("BeautifulSoup4 not available. Install with: pip install beautifulsoup4")
 
+    def _fetch_content(self, url: str) -> bytes:
+        """Fetch a page body, stopping after max_content_bytes of decoded content."""
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            return response.raw.read(self.max_content_bytes, decode_content=True)
+
     def navigate_to(self, url: str) -> bool:
         """Navigate to a specific URL."""
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            # Only the status matters here, so the body is never read
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
             return True
         except Exception as e:
             logger.error(f"Failed to navigate to {url}: {e}")
@@ -50,24 +76,16 @@ class BasicBrowserAdapter(BrowserPort):
             return None
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(self._fetch_content(url), "html.parser")
 
             # Remove script and style elements
             for script in soup(["script", "style"]):
                 script.decompose()
 
-            # Get text content
-            text = soup.get_text()
-
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = "\\n".join(chunk for chunk in chunks if chunk)
+            # Get text content with whitespace collapsed in a single regex pass
+            text = _WS_RE.sub(" ", soup.get_text()).strip()
 
-            return text if text else None
+            return text or None
 
         except Exception as e:
             logger.error(f"Error extracting text from {url}: {e}")
@@ -81,11 +99,10 @@ class BasicBrowserAdapter(BrowserPort):
 
         try:
             # Get page title if possible
-            response = self.session.get(url, timeout=self.timeout)
             title = url
 
             if BS4_AVAILABLE:
-                soup = BeautifulSoup(response.content, "html.parser")
+                soup = BeautifulSoup(self._fetch_content(url), "html.parser")
                 title_tag = soup.find("title")
                 if title_tag:
                     title = title_tag.get_text().strip()
@@ -131,10 +148,7 @@ class BasicBrowserAdapter(BrowserPort):
             return []
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(self._fetch_content(url), "html.parser")
             links = []
 
             for link in soup.find_all("a", href=True):
@@ -164,10 +178,7 @@ class BasicBrowserAdapter(BrowserPort):
             return False
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(self._fetch_content(url), "html.parser")
             element = soup.select_one(selector)
 
             return element is not None
@@ -2,7 +2,8 @@
 WebSocket Progress Manager for real-time research updates.
 
 This manager handles WebSocket connections and broadcasts progress updates
-to clients monitoring research tasks.
+to clients monitoring research tasks, either over a WebSocket or through a
+subscriber queue drained by the Server-Sent Events endpoint.
 """
 
 from __future__ import annotations
@@ -11,10 +12,13 @@ import asyncio
 from dataclasses import asdict, dataclass
 from datetime import datetime
 import json
+import logging
 from typing import Any
 
 from fastapi import WebSocket
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ProgressUpdate:
@@ -22,7 +26,7 @@ class ProgressUpdate:
 
     task_id: str
     timestamp: str
-    event_type: str  # started, iteration, evidence, evaluation, gap_analysis, refinement, completed, failed
+    event_type: str  # started, iteration, evidence, evaluation, gap_analysis, refinement, completed, failed, status
     message: str
     data: dict[str, Any] | None = None
 
@@ -69,6 +73,8 @@ class ProgressManager:
 
         # Store active WebSocket connections per task_id
         self._connections: dict[str, list[WebSocket]] = {}
+        # Store SSE subscriber queues per task_id
+        self._subscribers: dict[str, list[asyncio.Queue[ProgressUpdate]]] = {}
         # Create lock when event loop is available
         self._lock = asyncio.Lock()
         self._initialized = True
@@ -82,7 +88,7 @@ class ProgressManager:
                 self._connections[task_id] = []
             self._connections[task_id].append(websocket)
 
-        print(f"📡 WebSocket connected for task {task_id} (total: {len(self._connections[task_id])})")
+        logger.debug("WebSocket connected for task %s (total: %d)", task_id, len(self._connections[task_id]))
 
     async def disconnect(self, websocket: WebSocket, task_id: str):
         """Remove a WebSocket connection."""
@@ -90,12 +96,33 @@ class ProgressManager:
             if task_id in self._connections:
                 if websocket in self._connections[task_id]:
                     self._connections[task_id].remove(websocket)
-                    print(f"📡 WebSocket disconnected for task {task_id} (remaining: {len(self._connections[task_id])})")
+                    logger.debug("WebSocket disconnected for task %s (remaining: %d)", task_id, len(self._connections[task_id]))
 
                 # Clean up empty lists
                 if not self._connections[task_id]:
                     del self._connections[task_id]
 
+    async def subscribe(self, task_id: str) -> asyncio.Queue[ProgressUpdate]:
+        """Register a queue that receives every update broadcast for a task."""
+        queue: asyncio.Queue[ProgressUpdate] = asyncio.Queue()
+
+        async with self._lock:
+            self._subscribers.setdefault(task_id, []).append(queue)
+
+        logger.debug("Subscriber added for task %s (total: %d)", task_id, len(self._subscribers[task_id]))
+        return queue
+
+    async def unsubscribe(self, queue: asyncio.Queue[ProgressUpdate], task_id: str):
+        """Remove a subscriber queue."""
+        async with self._lock:
+            if task_id in self._subscribers:
+                if queue in self._subscribers[task_id]:
+                    self._subscribers[task_id].remove(queue)
+
+                # Clean up empty lists
+                if not self._subscribers[task_id]:
+                    del self._subscribers[task_id]
+
     async def broadcast(self, update: ProgressUpdate):
         """
         Broadcast a progress update to all clients watching this task.
@@ -105,8 +132,12 @@ class ProgressManager:
         task_id = update.task_id
 
         async with self._lock:
+            # Queues are unbounded and drained by their SSE streams, so this never blocks
+            for queue in self._subscribers.get(task_id, ()):
+                queue.put_nowait(update)
+
             if task_id not in self._connections:
-                # No one is watching this task
+                # No WebSocket is watching this task
                 return
 
             connections = self._connections[task_id].copy()
@@ -118,7 +149,7 @@ class ProgressManager:
             try:
                 await websocket.send_text(update.to_json())
             except Exception as e:
-                print(f"⚠️  Failed to send to WebSocket: {e}")
+                logger.warning("Failed to send to WebSocket: %s", e)
                 failed_connections.append(websocket)
 
         # Remove failed connections
@@ -130,11 +161,11 @@ class ProgressManager:
 
     def has_listeners(self, task_id: str) -> bool:
         """Check if anyone is listening to updates for this task."""
-        return task_id in self._connections and len(self._connections[task_id]) > 0
+        return bool(self._connections.get(task_id) or self._subscribers.get(task_id))
 
     def get_connection_count(self, task_id: str) -> int:
-        """Get the number of active connections for a task."""
-        return len(self._connections.get(task_id, []))
+        """Get the number of active WebSocket connections and SSE subscribers for a task."""
+        return len(self._connections.get(task_id, [])) + len(self._subscribers.get(task_id, []))
 
 
 # Global singleton instance
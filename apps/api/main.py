@@ -1,66 +1,209 @@
+import asyncio
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from functools import lru_cache
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+from logging.handlers import QueueListener
+import math
 import os
 import time
 import uuid
 
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, FastAPI, HTTPException, WebSocket, WebSocketDisconnect, status
-from pydantic import BaseModel, Field
+from fastapi import BackgroundTasks, FastAPI, Header, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from opentelemetry import propagate, trace
+from pydantic import BaseModel, ConfigDict, Field
 
 from adapters.mongodb import MongoDBDatabase
-from adapters.telemetry.tracing import TelemetryManager, setup_telemetry
-from adapters.websocket.progress_manager import get_progress_manager
+from adapters.telemetry.events import get_event_logger
+from adapters.telemetry.log_config import setup_logging
+from adapters.telemetry.tracing import TelemetryManager, setup_telemetry, trace_async_operation
+from adapters.websocket.progress_manager import ProgressUpdate, get_progress_manager
+from domain.services.evaluation_svc import EvaluationService
 from domain.services.iterative_research_svc import IterativeResearchOrchestrator
 from domain.services.planner_svc import PlannerService
 from domain.services.research_svc import ResearchService
 from domain.services.writer_svc import WriterService
 from ports.database_port import DatabasePort
 
+try:
+    from adapters.redis import RedisDatabase
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import orjson  # noqa: F401  (required by ORJSONResponse)
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from arq import ArqRedis, create_pool
+    from arq.connections import RedisSettings
+
+    ARQ_AVAILABLE = True
+except ImportError:
+    ARQ_AVAILABLE = False
+
 # Load environment variables from .env file
 load_dotenv()
 
+pipeline_logger = logging.getLogger("aletheia.pipeline")
+
 # Global telemetry manager
 telemetry_manager: TelemetryManager | None = None
 
+# Background log listener, started in lifespan
+log_listener: QueueListener | None = None
+
+# Tracer resolved once at startup; a no-op tracer until telemetry is set up
+TRACER: trace.Tracer = trace.NoOpTracer()
+
 # Global database instance
 db: DatabasePort | None = None
 
+# Global job queue; when set, pipelines run in worker processes (apps/worker/main.py)
+job_queue: "ArqRedis | None" = None
+
+
+@dataclass(frozen=True)
+class PipelineServices:
+    """Agent services shared by every pipeline run in this process."""
+
+    planner: PlannerService
+    researcher: ResearchService
+    evaluator: EvaluationService
+    writer: WriterService
 
-@asynccontextmanager
-async def lifespan(_app: FastAPI):
-    """Lifespan event handler for startup and shutdown."""
-    # Startup
-    global telemetry_manager, db
-    telemetry_manager = setup_telemetry()
 
-    # Initialize MongoDB if configured
+# Built once per process so model clients and vector store connections are reused across tasks
+services: PipelineServices | None = None
+
+
+def get_services() -> PipelineServices:
+    """Return the process-wide agent services, building them on first use."""
+    global services
+    if services is None:
+        services = PipelineServices(
+            planner=PlannerService(),
+            researcher=ResearchService(),
+            evaluator=EvaluationService(),
+            writer=WriterService(),
+        )
+    return services
+
+
+async def init_database() -> DatabasePort | None:
+    """Connect the configured database (MongoDB, else Redis), or return None to use in-memory storage."""
     mongodb_url = os.getenv("MONGODB_URL")
-    mongodb_database = os.getenv("MONGODB_DATABASE", "aletheia")
+    redis_url = os.getenv("REDIS_URL")
 
     if mongodb_url:
+        mongodb_database = os.getenv("MONGODB_DATABASE", "aletheia")
         try:
-            db = MongoDBDatabase(mongodb_url, mongodb_database)
-            await db.initialize()
+            database = MongoDBDatabase(mongodb_url, mongodb_database)
+            await database.initialize()
             print(f"✅ MongoDB initialized: {mongodb_database}")
+            return database
         except Exception as e:
             print(f"⚠️  MongoDB initialization failed: {e}")
-            print("📝 Falling back to in-memory storage")
-            db = None
+    elif redis_url and REDIS_AVAILABLE:
+        try:
+            database = RedisDatabase(
+                redis_url,
+                ttl_seconds=int(os.getenv("REDIS_TASK_TTL", "86400")),
+                max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "20")),
+            )
+            await database.initialize()
+            print("✅ Redis task store initialized")
+            return database
+        except Exception as e:
+            print(f"⚠️  Redis initialization failed: {e}")
     else:
-        print("📝 No MongoDB URL configured, using in-memory storage")
-        db = None
+        print("📝 No MongoDB or Redis URL configured, using in-memory storage")
+        return None
+
+    print("📝 Falling back to in-memory storage")
+    return None
+
+
+async def init_job_queue() -> "ArqRedis | None":
+    """Connect the Redis job queue if ALETHEIA_JOB_QUEUE=arq, or return None to run pipelines in-process."""
+    # Opt-in: with the queue on, this process only enqueues, so a worker deployment must exist
+    if os.getenv("ALETHEIA_JOB_QUEUE", "").lower() != "arq":
+        return None
+
+    redis_url = os.getenv("REDIS_URL")
+    if not redis_url:
+        print("⚠️  ALETHEIA_JOB_QUEUE=arq needs REDIS_URL. Running research in-process.")
+        return None
+
+    if not ARQ_AVAILABLE:
+        print("⚠️  REDIS_URL is set but arq is not installed. Running research in-process.")
+        return None
+
+    if db is None:
+        # Workers cannot see this process's in-memory task dicts
+        print("⚠️  Job queue needs a shared task store (MongoDB or Redis). Running research in-process.")
+        return None
+
+    try:
+        queue = await create_pool(RedisSettings.from_dsn(redis_url))
+        print("✅ Job queue connected, research runs on workers")
+        return queue
+    except Exception as e:
+        print(f"⚠️  Job queue connection failed: {e}. Running research in-process.")
+        return None
+
+
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    """Lifespan event handler for startup and shutdown."""
+    # Startup
+    global log_listener, telemetry_manager, TRACER, db, job_queue
+    log_listener = setup_logging()
+    telemetry_manager = setup_telemetry()
+    TRACER = telemetry_manager.get_tracer()
+    db = await init_database()
+    job_queue = await init_job_queue()
+    if job_queue is None:
+        # Pipelines run in this process; connect the agent services before the first request
+        await asyncio.to_thread(get_services)
+
+    # Build the OpenAPI schema now so the first /docs visit doesn't pay for it
+    app_.openapi()
 
     yield
 
     # Shutdown
+    if services:
+        services.researcher.close()
+        await services.researcher.aclose()
+
+    if job_queue:
+        await job_queue.close()
+        print("✅ Job queue connection closed")
+
     if db:
         await db.close()
-        print("✅ MongoDB connection closed")
+        print("✅ Database connection closed")
+
+    get_event_logger().close()
+    telemetry_manager.shutdown()
+    log_listener.stop()
 
 
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
     title="Aletheia Deep Research API",
     description="""
     ## 🔍 API para análisis e investigación profunda
@@ -109,12 +252,30 @@ app = FastAPI(
     ],
 )
 
+# Compress large JSON/markdown responses (reports are tens of KB of text)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+REPORT_STREAM_CHUNK_CHARS = 64 * 1024
+# Idle interval after which an event stream sends a keep-alive comment and re-reads the task store
+SSE_KEEPALIVE_SECONDS = 15.0
+
+# Serialized report poll responses (LRU of expiry, body, ETag). Terminal states never change and are kept
+# until evicted; in-progress states live for RESPONSE_CACHE_ACTIVE_TTL so polling bursts hit the store once
+_RESPONSE_CACHE: OrderedDict[str, tuple[float, bytes, str]] = OrderedDict()
+RESPONSE_CACHE_SIZE = 2048
+RESPONSE_CACHE_ACTIVE_TTL = float(os.getenv("ALETHEIA_RESPONSE_CACHE_TTL", "1"))
+
 # --- Data Models ---
 
+# Request/response models are never mutated after validation
+_API_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
 
 class ResearchRequest(BaseModel):
     """Solicitud para investigación estándar con procesamiento paralelo optimizado."""
 
+    model_config = _API_MODEL_CONFIG
+
     query: str = Field(
         ...,
         description="Consulta de investigación",
@@ -131,6 +292,8 @@ class ResearchRequest(BaseModel):
 class DeepResearchRequest(BaseModel):
     """Solicitud para investigación iterativa profunda usando patrón Together AI."""
 
+    model_config = _API_MODEL_CONFIG
+
     query: str = Field(
         ...,
         description="Consulta principal de investigación profunda",
@@ -149,10 +312,12 @@ class DeepResearchRequest(BaseModel):
 class TaskStatus(BaseModel):
     """Estado de una tarea de investigación."""
 
+    model_config = _API_MODEL_CONFIG
+
     task_id: str = Field(
         ...,
         description="Identificador único de la tarea",
-        example="550e8400-e29b-41d4-a716-446655440000",
+        example="550e8400e29b41d4a716446655440000",
     )
     status: str = Field(..., description="Estado actual de la tarea", example="completed")
     details: str | None = Field(
@@ -165,6 +330,8 @@ class TaskStatus(BaseModel):
 class Report(BaseModel):
     """Reporte de investigación estándar."""
 
+    model_config = _API_MODEL_CONFIG
+
     status: str = Field(..., description="Estado del reporte", example="completed")
     report_md: str | None = Field(None, description="Contenido del reporte en Markdown")
     sources_bib: str | None = Field(
@@ -178,6 +345,8 @@ class Report(BaseModel):
 class DeepResearchReport(BaseModel):
     """Reporte de investigación profunda con métricas de calidad."""
 
+    model_config = _API_MODEL_CONFIG
+
     status: str = Field(..., description="Estado del reporte", example="completed")
     report_md: str | None = Field(None, description="Contenido del reporte final en Markdown")
     sources_bib: str | None = Field(None, description="Bibliografía de fuentes consultadas")
@@ -197,66 +366,189 @@ class DeepResearchReport(BaseModel):
 class Traces(BaseModel):
     """Artefactos de trazabilidad y observabilidad."""
 
+    model_config = _API_MODEL_CONFIG
+
     manifest_json: str = Field(..., description="Manifiesto de la ejecución")
     events_ndjson: str = Field(..., description="Eventos de trazabilidad en formato NDJSON")
     otel_export_json: str = Field(..., description="Exportación de trazas OpenTelemetry")
 
 
+# Fixed placeholder artifacts for /traces, serialized once instead of validated on every request
+_TRACES_BODY = Traces.model_construct(
+    manifest_json='{"version": "0.1.0", "seed": 123}',
+    events_ndjson='{"event": "mock_event", "timestamp": "2025-09-10T21:00:00Z"}',
+    otel_export_json='{"trace_id": "mock_trace_id"}',
+).model_dump_json().encode()
+
 # --- In-Memory Task Store ---
-tasks = {}
-deep_research_tasks = {}
+# Used when no database is configured; bounded so a long-lived process does not accumulate every task it has run
+TASK_STORE_SIZE = 10_000
+TASK_STORE_TTL_SECONDS = 86_400
+tasks: TTLCache = TTLCache(maxsize=TASK_STORE_SIZE, ttl=TASK_STORE_TTL_SECONDS)
+deep_research_tasks: TTLCache = TTLCache(maxsize=TASK_STORE_SIZE, ttl=TASK_STORE_TTL_SECONDS)
 
 # --- Performance Optimizations ---
-_health_check_cache = {"status": "healthy", "api_keys": {}, "last_check": 0}
+# (monotonic deadline, serialized cached response); replaced as a whole so reads never see a partial update
+_health_snapshot: tuple[float, bytes] = (0.0, b"")
 HEALTH_CACHE_TTL = 30  # Cache health status for 30 seconds
 
 
-@lru_cache(maxsize=128)
-def get_api_keys_status():
-    """Cached API key validation to avoid repeated environment checks."""
-    saptiva_key = os.getenv("SAPTIVA_API_KEY")
-    tavily_key = os.getenv("TAVILY_API_KEY")
+# (env key values, status) of the last API key check
+_api_keys_status_cache: tuple[tuple[str | None, str | None], dict[str, bool]] | None = None
+
+
+def get_api_keys_status() -> dict[str, bool]:
+    """API key validation, recomputed only when the key environment variables change."""
+    global _api_keys_status_cache
+    env_keys = (os.getenv("SAPTIVA_API_KEY"), os.getenv("TAVILY_API_KEY"))
+    if _api_keys_status_cache is None or _api_keys_status_cache[0] != env_keys:
+        saptiva_key, tavily_key = env_keys
+        api_status = {
+            "saptiva_available": bool(saptiva_key and saptiva_key != "pon_tu_api_key_aqui"),
+            "tavily_available": bool(tavily_key and tavily_key != "pon_tu_api_key_aqui"),
+        }
+        _api_keys_status_cache = (env_keys, api_status)
+    return _api_keys_status_cache[1]
+
+
+def _trace_carrier() -> dict[str, str]:
+    """W3C trace headers for the current span, so queued jobs can link back to the request that enqueued them."""
+    carrier: dict[str, str] = {}
+    propagate.inject(carrier)
+    return carrier
+
+
+async def _record_task_outcome(task_id: str, task_data: dict, message: str, report: dict | None = None, level: str = "INFO"):
+    """
+    Persist a task's terminal state with one round of concurrent writes for the report and log entry.
+    The status update goes last, so pollers that see "completed" can already read the report.
+    """
+    writes = [db.create_log({"task_id": task_id, "level": level, "message": message})]
+    if report is not None:
+        writes.append(db.create_report(task_id, report))
+    await asyncio.gather(*writes)
+    await db.update_task(task_id, task_data)
+
+
+# --- Report Response Cache ---
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+
+def _now() -> float:
+    """Monotonic clock for response cache expiry."""
+    return time.monotonic()
+
+
+def _etag(payload: bytes) -> str:
+    """Weak validator for a serialized response body; weak because the gzip middleware may re-encode it in transit."""
+    return f'W/"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+
+def _json_response(payload: bytes, etag: str, if_none_match: str | None) -> Response:
+    """Return payload tagged with its ETag, or an empty 304 when the poller already holds it."""
+    headers = {"ETag": etag}
+    # If-None-Match uses weak comparison: opaque tags match with or without the W/ prefix
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")} if if_none_match else set()
+    if "*" in tags or etag.removeprefix("W/") in tags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+def _cached_response(key: str, if_none_match: str | None = None) -> Response | None:
+    """Return the cached serialized response for key if it has not expired."""
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, payload, etag = entry
+    if expires_at < _now():
+        _RESPONSE_CACHE.pop(key, None)
+        return None
+    _RESPONSE_CACHE.move_to_end(key)
+    return _json_response(payload, etag, if_none_match)
+
+
+def _cache_response(key: str, model: BaseModel, terminal: bool, if_none_match: str | None = None) -> Response:
+    """Serialize and tag model once, cache the body (indefinitely for terminal states) and return it."""
+    payload = model.model_dump_json().encode()
+    etag = _etag(payload)
+    expires_at = math.inf if terminal else _now() + RESPONSE_CACHE_ACTIVE_TTL
+    _RESPONSE_CACHE[key] = (expires_at, payload, etag)
+    _RESPONSE_CACHE.move_to_end(key)
+    if len(_RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+    return _json_response(payload, etag, if_none_match)
+
+
+def _invalidate_cached_responses(task_id: str):
+    """Drop cached in-progress poll responses once a task reaches a terminal state."""
+    _RESPONSE_CACHE.pop(f"report:{task_id}", None)
+    _RESPONSE_CACHE.pop(f"deep:{task_id}", None)
+
+
+async def _publish_task_status(task_id: str, task_status: str):
+    """Push a task status transition to progress subscribers, so event streams need not poll the store."""
+    await get_progress_manager().broadcast(ProgressUpdate.create(task_id, "status", f"Task {task_status}", {"status": task_status}))
 
-    saptiva_available = saptiva_key and saptiva_key != "pon_tu_api_key_aqui"
-    tavily_available = tavily_key and tavily_key != "pon_tu_api_key_aqui"
 
-    return {"saptiva_available": saptiva_available, "tavily_available": tavily_available}
+async def _drop_run_collection(task_id: str):
+    """Drop the per-run evidence collection so the shared vector store does not grow across runs."""
+    if services is None:
+        return
+    try:
+        await asyncio.to_thread(services.researcher.delete_collection, f"research_{task_id}")
+    except Exception as e:
+        pipeline_logger.warning("[%s] Could not drop research collection: %s", task_id, e)
 
 
 # --- Real Research Pipeline (Optimized Async Version) ---
-async def run_real_research_pipeline(task_id: str, query: str):
+# (query, scope) -> task_id of the in-process research run for it; identical requests join that run
+_in_flight_research: dict[tuple[str, str | None], str] = {}
+
+
+@trace_async_operation("research.pipeline", link_kwarg="parent_ctx")
+async def run_real_research_pipeline(task_id: str, query: str, dedupe_key: tuple[str, str | None] | None = None):
     """
     Orchestrates the research process: Plan -> Research -> Write.
     Optimized async version with parallel processing.
+
+    dedupe_key is set when start_research registered this run in _in_flight_research;
+    it is unregistered once the run ends.
     """
+    span = trace.get_current_span()
+    span.set_attribute("task.id", task_id)
+
     # Update task status to running
     if db:
         await db.update_task(task_id, {"status": "running", "query": query})
     else:
         tasks[task_id] = {"status": "running", "report": None}
 
-    print(f"🚀 Starting optimized research for task {task_id} with query: '{query}'")
+    pipeline_logger.info("[%s] Starting research for query: %r", task_id, query)
 
     try:
-        # Initialize services once
-        planner = PlannerService()
-        researcher = ResearchService()
-        writer = WriterService()
+        pipeline_services = services or await asyncio.to_thread(get_services)
+        planner = pipeline_services.planner
+        researcher = pipeline_services.researcher
+        writer = pipeline_services.writer
 
         # 1. Plan
-        print(f"[{task_id}] Creating research plan...")
-        research_plan = planner.create_plan(query)
-        print(f"[{task_id}] ✅ Plan created with {len(research_plan.sub_tasks)} sub-tasks.")
-
-        # 2. Research (Using parallel execution)
-        print(f"[{task_id}] 🔍 Starting parallel research execution...")
-        evidence_list = await researcher.execute_plan_parallel(research_plan)
-        print(f"[{task_id}] ✅ Research completed with {len(evidence_list)} pieces of evidence.")
+        research_plan = await asyncio.to_thread(planner.create_plan, query)
+        pipeline_logger.info("[%s] Plan created with %d sub-tasks", task_id, len(research_plan.sub_tasks))
+        span.add_event("plan_created", {"subtasks": len(research_plan.sub_tasks)})
+
+        # 2. Research (Using parallel execution); evidence streams in as each sub-task completes
+        evidence_list = []
+        async for evidence in researcher.stream_evidence(research_plan, collection_name=f"research_{task_id}"):
+            if not evidence_list:
+                span.add_event("first_evidence")
+            evidence_list.append(evidence)
+        pipeline_logger.info("[%s] Research completed with %d pieces of evidence", task_id, len(evidence_list))
+        span.add_event("research_completed", {"evidence_count": len(evidence_list)})
 
         # 3. Write
-        print(f"[{task_id}] 📝 Generating report...")
-        report_content = writer.write_report(query, evidence_list)
-        print(f"[{task_id}] ✅ Report generated.")
+        report_content = await asyncio.to_thread(writer.write_report, query, evidence_list, f"research_{task_id}")
+        pipeline_logger.info("[%s] Report generated", task_id)
+        span.add_event("report_generated", {"report_length": len(report_content)})
 
         # 4. Store result
         task_data = {
@@ -266,111 +558,260 @@ async def run_real_research_pipeline(task_id: str, query: str):
         }
 
         if db:
-            await db.update_task(task_id, task_data)
-            # Store report in separate collection
-            await db.create_report(task_id, {"content": report_content, "query": query})
-            # Create log entry
-            await db.create_log({
-                "task_id": task_id,
-                "level": "INFO",
-                "message": f"Research completed successfully with {len(evidence_list)} evidence sources"
-            })
+            await _record_task_outcome(
+                task_id,
+                task_data,
+                f"Research completed successfully with {len(evidence_list)} evidence sources",
+                report={"content": report_content, "query": query},
+            )
         else:
             tasks[task_id] = {**task_data, "report": report_content}
 
-        print(f"🎉 Research completed for task {task_id}")
+        pipeline_logger.info("[%s] Research completed", task_id)
 
     except Exception as e:
-        print(f"❌ Error during research pipeline for task {task_id}: {e}")
+        pipeline_logger.error("[%s] Research pipeline failed: %s", task_id, e)
+        span.record_exception(e)
 
         if db:
-            await db.update_task(task_id, {"status": "failed", "error": str(e)})
-            await db.create_log({
-                "task_id": task_id,
-                "level": "ERROR",
-                "message": f"Research failed: {str(e)}"
-            })
+            await _record_task_outcome(task_id, {"status": "failed", "error": str(e)}, f"Research failed: {str(e)}", level="ERROR")
         else:
             tasks[task_id] = {"status": "failed", "report": f"An error occurred: {e}"}
 
+    finally:
+        if dedupe_key is not None:
+            _in_flight_research.pop(dedupe_key, None)
+        _invalidate_cached_responses(task_id)
+        await _drop_run_collection(task_id)
 
-# --- Backward Compatibility Sync Version ---
-def run_real_research_pipeline_sync(task_id: str, query: str):
-    """
-    Synchronous wrapper for backward compatibility.
-    """
-    import asyncio
 
-    asyncio.run(run_real_research_pipeline(task_id, query))
+# --- Deep Research Pipeline (Together AI Pattern) ---
+_deep_research_slots = asyncio.Semaphore(int(os.getenv("ALETHEIA_MAX_DEEP_CONCURRENCY", "4")))
 
 
-# --- Deep Research Pipeline (Together AI Pattern) ---
-async def run_deep_research_pipeline(task_id: str, request: DeepResearchRequest):
+@trace_async_operation("deep_research.pipeline", link_kwarg="parent_ctx")
+async def run_deep_research_pipeline(task_id: str, request: DeepResearchRequest, holds_slot: bool = False):
     """
     Orchestrates the iterative deep research process using Together AI pattern.
+
+    holds_slot is set when start_deep_research claimed a concurrency slot for this run;
+    it is released once the run ends. Queued worker runs are bounded by WORKER_MAX_JOBS instead.
     """
-    # Update task status to running
-    if db:
-        await db.update_task(task_id, {"status": "running", "query": request.query})
-    else:
-        deep_research_tasks[task_id] = {"status": "running", "result": None}
+    try:
+        span = trace.get_current_span()
+        span.set_attribute("task.id", task_id)
 
-    print(f"Starting deep research for task {task_id} with query: '{request.query}'")
+        # Update task status to running
+        if db:
+            await db.update_task(task_id, {"status": "running", "query": request.query})
+        else:
+            deep_research_tasks[task_id] = {"status": "running", "result": None}
+        await _publish_task_status(task_id, "running")
+        final_status = None
 
-    try:
-        # Initialize iterative research orchestrator
-        orchestrator = IterativeResearchOrchestrator(
-            max_iterations=request.max_iterations,
-            min_completion_score=request.min_completion_score,
-            budget=request.budget,
-        )
+        pipeline_logger.info("[%s] Starting deep research for query: %r", task_id, request.query)
 
-        # Execute deep research with task_id for WebSocket updates
-        tracer = telemetry_manager.get_tracer() if telemetry_manager else None
-        result = await orchestrator.execute_deep_research(request.query, tracer=tracer, task_id=task_id)
+        try:
+            # Initialize iterative research orchestrator with the shared agent services
+            pipeline_services = services or await asyncio.to_thread(get_services)
+            orchestrator = IterativeResearchOrchestrator(
+                max_iterations=request.max_iterations,
+                min_completion_score=request.min_completion_score,
+                budget=request.budget,
+                planner=pipeline_services.planner,
+                researcher=pipeline_services.researcher,
+                evaluator=pipeline_services.evaluator,
+                writer=pipeline_services.writer,
+            )
 
-        # Store result
-        summary = orchestrator.get_research_summary(result)
+            # Execute deep research with task_id for WebSocket updates
+            result = await orchestrator.execute_deep_research(
+                request.query, tracer=TRACER, task_id=task_id, collection_name=f"research_{task_id}"
+            )
 
-        if db:
-            await db.update_task(task_id, {
-                "status": "completed",
-                "summary": summary
-            })
-            # Store deep research report
-            await db.create_report(task_id, {
-                "content": result.final_report,
-                "summary": summary,
-                "query": request.query,
-                "type": "deep_research"
-            })
-            # Create log entry
-            await db.create_log({
-                "task_id": task_id,
-                "level": "INFO",
-                "message": "Deep research completed successfully"
-            })
-        else:
-            deep_research_tasks[task_id] = {
-                "status": "completed",
-                "result": result,
-                "summary": summary,
-            }
+            # Store result
+            summary = orchestrator.get_research_summary(result)
+
+            if db:
+                await _record_task_outcome(
+                    task_id,
+                    {"status": "completed", "summary": summary},
+                    "Deep research completed successfully",
+                    report={"content": result.final_report, "summary": summary, "query": request.query, "type": "deep_research"},
+                )
+            else:
+                deep_research_tasks[task_id] = {
+                    "status": "completed",
+                    "result": result,
+                    "summary": summary,
+                }
+            final_status = "completed"
 
-        print(f"Deep research completed for task {task_id}")
+            pipeline_logger.info("[%s] Deep research completed", task_id)
+            span.add_event("deep_research_completed", {"evidence_count": summary["total_evidence"], "iterations": summary["iterations"]})
 
-    except Exception as e:
-        print(f"Error during deep research pipeline for task {task_id}: {e}")
+        except Exception as e:
+            pipeline_logger.error("[%s] Deep research pipeline failed: %s", task_id, e)
+            span.record_exception(e)
+
+            if db:
+                await _record_task_outcome(task_id, {"status": "failed", "error": str(e)}, f"Deep research failed: {str(e)}", level="ERROR")
+            else:
+                deep_research_tasks[task_id] = {"status": "failed", "error": f"An error occurred: {e}"}
+            final_status = "failed"
+
+        finally:
+            _invalidate_cached_responses(task_id)
+            # Published after invalidation, so a stream that reads the report next sees the terminal state
+            if final_status:
+                await _publish_task_status(task_id, final_status)
+            await _drop_run_collection(task_id)
 
-        if db:
-            await db.update_task(task_id, {"status": "failed", "error": str(e)})
-            await db.create_log({
-                "task_id": task_id,
-                "level": "ERROR",
-                "message": f"Deep research failed: {str(e)}"
-            })
-        else:
-            deep_research_tasks[task_id] = {"status": "failed", "error": f"An error occurred: {e}"}
+    finally:
+        if holds_slot:
+            _deep_research_slots.release()
+
+
+# --- OpenAPI Response Examples ---
+_OPENAPI_RESPONSES_HEALTH = {
+    200: {
+        "description": "Sistema funcionando correctamente",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "healthy",
+                    "service": "Aletheia Deep Research API",
+                    "version": "0.7.0",
+                    "api_keys": {"saptiva_available": True, "tavily_available": True},
+                    "cached": False,
+                    "timestamp": 1726179600.0,
+                }
+            }
+        },
+    }
+}
+
+_OPENAPI_RESPONSES_RESEARCH = {
+    202: {
+        "description": "Tarea de investigación aceptada y en ejecución",
+        "content": {
+            "application/json": {
+                "example": {
+                    "task_id": "550e8400e29b41d4a716446655440000",
+                    "status": "accepted",
+                    "details": ("Research task has been accepted and is running with optimized " "parallel processing."),
+                }
+            }
+        },
+    },
+    400: {"description": "Parámetros de solicitud inválidos"},
+    500: {"description": "Error interno del servidor"},
+}
+
+_OPENAPI_RESPONSES_TASK_STATUS = {
+    200: {
+        "description": "Estado de la tarea recuperado exitosamente",
+        "content": {
+            "application/json": {
+                "example": {
+                    "task_id": "550e8400e29b41d4a716446655440000",
+                    "status": "completed",
+                    "details": "Research completed with 15 evidence sources",
+                }
+            }
+        },
+    },
+    304: {"description": "Sin cambios desde el ETag enviado en If-None-Match"},
+    404: {"description": "Tarea no encontrada"},
+}
+
+_OPENAPI_RESPONSES_REPORT = {
+    200: {
+        "description": "Reporte recuperado exitosamente",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "completed",
+                    "report_md": "# Resumen Ejecutivo de la Investigación",
+                    "sources_bib": "Generated from 15 evidence sources",
+                    "metrics_json": '{"mock_metric": 1.0}',
+                }
+            }
+        },
+    },
+    304: {"description": "Sin cambios desde el ETag enviado en If-None-Match"},
+    404: {"description": "Reporte no encontrado"},
+}
+
+_OPENAPI_RESPONSES_REPORT_RAW = {
+    200: {"content": {"text/markdown": {}}, "description": "Reporte en Markdown"},
+    404: {"description": "Tarea o reporte no encontrado"},
+}
+
+_OPENAPI_RESPONSES_TRACES = {
+    200: {
+        "description": "Trazas recuperadas exitosamente",
+        "content": {
+            "application/json": {
+                "example": {
+                    "manifest_json": ('{"version": "0.7.0", "task_type": "research", ' '"started_at": "2025-09-12T10:00:00Z"}'),
+                    "events_ndjson": ('{"event": "task_started", "timestamp": "2025-09-12T10:00:00Z"}'),
+                    "otel_export_json": ('{"trace_id": "abc123", "spans": ' '[{"name": "research_task", "duration_ms": 1250}]}'),
+                }
+            }
+        },
+    },
+    404: {"description": "Tarea no encontrada"},
+}
+
+_OPENAPI_RESPONSES_DEEP_RESEARCH = {
+    202: {
+        "description": "Tarea de investigación profunda aceptada",
+        "content": {
+            "application/json": {
+                "example": {
+                    "task_id": "deep-550e8400e29b41d4a716446655440000",
+                    "status": "accepted",
+                    "details": "Deep research task accepted with parallel processing. Configuration: 5 iterations, 0.85 min score.",
+                }
+            }
+        },
+    },
+    400: {"description": "Parámetros de configuración inválidos"},
+    429: {"description": "Demasiadas investigaciones profundas en curso; reintentar con backoff"},
+    500: {"description": "Error interno del servidor"},
+}
+
+_OPENAPI_RESPONSES_DEEP_RESEARCH_REPORT = {
+    200: {
+        "description": "Reporte de investigación profunda recuperado exitosamente",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "completed",
+                    "report_md": "# Impacto de AI Act en Startups Europeas\n\n## Análisis Profundo\n...",
+                    "sources_bib": "Generated from 42 evidence sources",
+                    "research_summary": {
+                        "iterations_completed": 3,
+                        "gaps_identified": ["regulatory_compliance", "market_impact"],
+                        "key_findings": [
+                            "High compliance costs",
+                            "Market consolidation likely",
+                        ],
+                    },
+                    "quality_metrics": {
+                        "completion_level": 0.95,
+                        "quality_score": 0.88,
+                        "evidence_count": 42,
+                        "execution_time": 127.3,
+                    },
+                }
+            }
+        },
+    },
+    304: {"description": "Sin cambios desde el ETag enviado en If-None-Match"},
+    404: {"description": "Tarea de investigación profunda no encontrada"},
+}
 
 
 # --- API Endpoints ---
@@ -381,59 +822,36 @@ async def run_deep_research_pipeline(task_id: str, request: DeepResearchRequest)
     tags=["health"],
     summary="Estado del sistema",
     description="Verifica el estado de salud de la API y la disponibilidad de servicios externos",
-    responses={
-        200: {
-            "description": "Sistema funcionando correctamente",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "healthy",
-                        "service": "Aletheia Deep Research API",
-                        "version": "0.7.0",
-                        "api_keys": {"saptiva_available": True, "tavily_available": True},
-                        "cached": False,
-                        "timestamp": 1726179600.0,
-                    }
-                }
-            },
-        }
-    },
+    responses=_OPENAPI_RESPONSES_HEALTH,
 )
 async def health_check():
     """
     Health check endpoint for Docker and monitoring.
     Optimized with caching to reduce response time.
     """
-    current_time = time.time()
-
-    # Return cached response if within TTL
-    if current_time - _health_check_cache["last_check"] < HEALTH_CACHE_TTL:
-        return {
-            "status": _health_check_cache["status"],
-            "service": "Aletheia Deep Research API",
-            "version": "0.2.0",
-            "api_keys": _health_check_cache["api_keys"],
-            "cached": True,
-        }
+    global _health_snapshot
+    deadline, cached_body = _health_snapshot
+    now = time.monotonic()
+
+    # Return the pre-serialized cached response if within TTL
+    if now < deadline:
+        return Response(content=cached_body, media_type="application/json")
 
-    # Perform actual health check
+    # Perform actual health check; the refresh never awaits, so concurrent probes cannot interleave here
     api_status = get_api_keys_status()
     health_status = "healthy" if api_status["saptiva_available"] or api_status["tavily_available"] else "degraded"
-
-    # Update cache
-    _health_check_cache["status"] = health_status
-    _health_check_cache["api_keys"] = api_status
-    _health_check_cache["last_check"] = current_time
-
-    return {
+    response = {
         "status": health_status,
         "service": "Aletheia Deep Research API",
         "version": "0.2.0",
         "api_keys": api_status,
-        "cached": False,
-        "timestamp": current_time,
     }
 
+    # Update cache
+    _health_snapshot = (now + HEALTH_CACHE_TTL, json.dumps({**response, "cached": True}, separators=(",", ":")).encode())
+
+    return {**response, "cached": False, "timestamp": time.time()}
+
 
 @app.post(
     "/research",
@@ -449,22 +867,7 @@ async def health_check():
     - **Múltiples fuentes**: Integración con Tavily y Saptiva APIs
     - **Alta disponibilidad**: Continúa funcionando aunque algunas APIs no estén disponibles
     """,
-    responses={
-        202: {
-            "description": "Tarea de investigación aceptada y en ejecución",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "task_id": "550e8400-e29b-41d4-a716-446655440000",
-                        "status": "accepted",
-                        "details": ("Research task has been accepted and is running with optimized " "parallel processing."),
-                    }
-                }
-            },
-        },
-        400: {"description": "Parámetros de solicitud inválidos"},
-        500: {"description": "Error interno del servidor"},
-    },
+    responses=_OPENAPI_RESPONSES_RESEARCH,
 )
 async def start_research(request: ResearchRequest, background_tasks: BackgroundTasks):
     """
@@ -474,24 +877,46 @@ async def start_research(request: ResearchRequest, background_tasks: BackgroundT
     api_status = get_api_keys_status()
 
     if not api_status["saptiva_available"]:
-        print("Warning: SAPTIVA_API_KEY is not set. The planner and writer will use mock data.")
+        pipeline_logger.warning("SAPTIVA_API_KEY is not set. The planner and writer will use mock data.")
 
     if not api_status["tavily_available"]:
-        print("Warning: TAVILY_API_KEY is not set. The research step will be skipped.")
+        pipeline_logger.warning("TAVILY_API_KEY is not set. The research step will be skipped.")
+
+    # Identical requests share one in-process run; checked and registered before any await
+    dedupe_key = None
+    if job_queue is None:
+        dedupe_key = (request.query, request.scope)
+        if existing_task_id := _in_flight_research.get(dedupe_key):
+            return TaskStatus(
+                task_id=existing_task_id,
+                status="accepted",
+                details="An identical research task is already running; returning its task id.",
+            )
 
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
+    if dedupe_key is not None:
+        _in_flight_research[dedupe_key] = task_id
 
-    # Create initial task record
-    if db:
-        await db.create_task(task_id, {
-            "status": "accepted",
-            "query": request.query,
-            "started_at": time.time()
-        })
+    try:
+        # Create initial task record
+        if db:
+            await db.create_task(task_id, {
+                "status": "accepted",
+                "query": request.query,
+                "started_at": time.time()
+            })
+        else:
+            tasks[task_id] = {"status": "accepted", "started_at": time.time()}
+    except BaseException:
+        if dedupe_key is not None:
+            _in_flight_research.pop(dedupe_key, None)
+        raise
+
+    if job_queue:
+        await job_queue.enqueue_job("run_research_job", task_id, request.query, trace_carrier=_trace_carrier(), _job_id=task_id)
     else:
-        tasks[task_id] = {"status": "accepted", "started_at": time.time()}
-
-    background_tasks.add_task(run_real_research_pipeline, task_id, request.query)
+        parent_ctx = trace.get_current_span().get_span_context()
+        background_tasks.add_task(run_real_research_pipeline, task_id, request.query, dedupe_key=dedupe_key, parent_ctx=parent_ctx)
 
     return TaskStatus(
         task_id=task_id,
@@ -506,25 +931,13 @@ async def start_research(request: ResearchRequest, background_tasks: BackgroundT
     tags=["tasks"],
     summary="Consultar estado de tarea",
     description="Obtiene el estado actual de una tarea de investigación específica",
-    responses={
-        200: {
-            "description": "Estado de la tarea recuperado exitosamente",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "task_id": "550e8400-e29b-41d4-a716-446655440000",
-                        "status": "completed",
-                        "details": "Research completed with 15 evidence sources",
-                    }
-                }
-            },
-        },
-        404: {"description": "Tarea no encontrada"},
-    },
+    responses=_OPENAPI_RESPONSES_TASK_STATUS,
 )
-async def get_task_status(task_id: str):
+async def get_task_status(task_id: str, if_none_match: str | None = Header(None)):
     """
     Get the current status of a research task.
+
+    Responses carry an ETag; a poll sending it back in If-None-Match gets an empty 304 while the status is unchanged.
     """
     # Try to get task from database first, fallback to in-memory
     if db:
@@ -535,11 +948,12 @@ async def get_task_status(task_id: str):
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return TaskStatus(
+    payload = TaskStatus(
         task_id=task_id,
         status=task["status"],
         details=task.get("report", task.get("error", "")),
-    )
+    ).model_dump_json().encode()
+    return _json_response(payload, _etag(payload), if_none_match)
 
 
 @app.get(
@@ -548,27 +962,17 @@ async def get_task_status(task_id: str):
     tags=["reports"],
     summary="Obtener reporte de investigación",
     description=("Recupera el resultado completo de una tarea de investigación " "incluyendo el reporte y fuentes"),
-    responses={
-        200: {
-            "description": "Reporte recuperado exitosamente",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "completed",
-                        "report_md": "# Resumen Ejecutivo de la Investigación",
-                        "sources_bib": "Generated from 15 evidence sources",
-                        "metrics_json": '{"mock_metric": 1.0}',
-                    }
-                }
-            },
-        },
-        404: {"description": "Reporte no encontrado"},
-    },
+    responses=_OPENAPI_RESPONSES_REPORT,
 )
-async def get_report(task_id: str):
+async def get_report(task_id: str, if_none_match: str | None = Header(None)):
     """
     Retrieves the status and result of a research task.
     """
+    cache_key = f"report:{task_id}"
+    cached = _cached_response(cache_key, if_none_match)
+    if cached is not None:
+        return cached
+
     # Get task and report from database or in-memory
     if db:
         task = await db.get_task(task_id)
@@ -577,28 +981,64 @@ async def get_report(task_id: str):
 
         if task["status"] == "completed":
             report = await db.get_report(task_id)
-            return Report(
+            result = Report(
                 status="completed",
                 report_md=report.get("content") if report else None,
                 sources_bib=task.get("sources"),
                 metrics_json='{"mock_metric": 1.0}',
             )
         else:
-            return Report(status=task["status"], report_md=task.get("error"))
+            result = Report(status=task["status"], report_md=task.get("error"))
     else:
         task = tasks.get(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
 
         if task["status"] == "completed":
-            return Report(
+            result = Report(
                 status="completed",
                 report_md=task.get("report"),
                 sources_bib=task.get("sources"),
                 metrics_json='{"mock_metric": 1.0}',
             )
         else:
-            return Report(status=task["status"], report_md=task.get("report"))
+            result = Report(status=task["status"], report_md=task.get("report"))
+
+    return _cache_response(cache_key, result, terminal=task["status"] in TERMINAL_STATUSES, if_none_match=if_none_match)
+
+
+@app.get(
+    "/reports/{task_id}/raw",
+    tags=["reports"],
+    summary="Descargar reporte en Markdown",
+    description="Transmite el reporte Markdown de una tarea completada (estándar o profunda) sin envolverlo en JSON",
+    response_class=StreamingResponse,
+    responses=_OPENAPI_RESPONSES_REPORT_RAW,
+)
+async def get_report_raw(task_id: str):
+    """
+    Streams the markdown report of a completed research or deep research task.
+    """
+    if db:
+        task = await db.get_task(task_id)
+        report = await db.get_report(task_id) if task and task["status"] == "completed" else None
+        content = report.get("content") if report else None
+    else:
+        task = tasks.get(task_id) or deep_research_tasks.get(task_id)
+        content = None
+        if task and task["status"] == "completed":
+            content = task["result"].final_report if "result" in task else task.get("report")
+
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if content is None:
+        raise HTTPException(status_code=404, detail="Report not available")
+
+    async def iter_report():
+        for start in range(0, len(content), REPORT_STREAM_CHUNK_CHARS):
+            yield content[start : start + REPORT_STREAM_CHUNK_CHARS].encode()
+
+    return StreamingResponse(iter_report(), media_type="text/markdown; charset=utf-8")
 
 
 @app.get(
@@ -614,21 +1054,7 @@ async def get_report(task_id: str):
     - **Eventos**: Log de eventos en formato NDJSON para análisis
     - **OpenTelemetry**: Trazas de rendimiento y monitoreo
     """,
-    responses={
-        200: {
-            "description": "Trazas recuperadas exitosamente",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "manifest_json": ('{"version": "0.7.0", "task_type": "research", ' '"started_at": "2025-09-12T10:00:00Z"}'),
-                        "events_ndjson": ('{"event": "task_started", "timestamp": "2025-09-12T10:00:00Z"}'),
-                        "otel_export_json": ('{"trace_id": "abc123", "spans": ' '[{"name": "research_task", "duration_ms": 1250}]}'),
-                    }
-                }
-            },
-        },
-        404: {"description": "Tarea no encontrada"},
-    },
+    responses=_OPENAPI_RESPONSES_TRACES,
 )
 async def get_traces(task_id: str):
     """
@@ -637,11 +1063,7 @@ async def get_traces(task_id: str):
     if task_id not in tasks:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return Traces(
-        manifest_json='{"version": "0.1.0", "seed": 123}',
-        events_ndjson='{"event": "mock_event", "timestamp": "2025-09-10T21:00:00Z"}',
-        otel_export_json='{"trace_id": "mock_trace_id"}',
-    )
+    return Response(content=_TRACES_BODY, media_type="application/json")
 
 
 # --- Deep Research Endpoints (Together AI Pattern) ---
@@ -668,37 +1090,41 @@ async def get_traces(task_id: str):
     - Evidence count tracking
     - Execution time monitoring
     """,
-    responses={
-        202: {
-            "description": "Tarea de investigación profunda aceptada",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "task_id": "deep-550e8400-e29b-41d4-a716-446655440000",
-                        "status": "accepted",
-                        "details": "Deep research task accepted with parallel processing. Configuration: 5 iterations, 0.85 min score.",
-                    }
-                }
-            },
-        },
-        400: {"description": "Parámetros de configuración inválidos"},
-        500: {"description": "Error interno del servidor"},
-    },
+    responses=_OPENAPI_RESPONSES_DEEP_RESEARCH,
 )
 async def start_deep_research(request: DeepResearchRequest, background_tasks: BackgroundTasks):
     """
     Starts a new iterative deep research task using Together AI pattern with performance optimizations.
     """
+    # Back-pressure: claim an in-process slot before accepting, so a burst beyond the cap gets 429
+    # instead of queueing behind the semaphore; queued workers bound their own concurrency
+    holds_slot = False
+    if not job_queue:
+        if _deep_research_slots.locked():
+            raise HTTPException(status_code=429, detail="Too many deep research jobs in flight; retry with backoff")
+        await _deep_research_slots.acquire()  # returns immediately, a slot is free
+        holds_slot = True
+
+    try:
+        return await _accept_deep_research(request, background_tasks, holds_slot)
+    except BaseException:
+        if holds_slot:
+            _deep_research_slots.release()
+        raise
+
+
+async def _accept_deep_research(request: DeepResearchRequest, background_tasks: BackgroundTasks, holds_slot: bool) -> TaskStatus:
+    """Record a new deep research task and hand it to the job queue or a background task."""
     # Use cached API key status for better performance
     api_status = get_api_keys_status()
 
     if not api_status["saptiva_available"]:
-        print("Warning: SAPTIVA_API_KEY is not set. Some agents will use mock data.")
+        pipeline_logger.warning("SAPTIVA_API_KEY is not set. Some agents will use mock data.")
 
     if not api_status["tavily_available"]:
-        print("Warning: TAVILY_API_KEY is not set. Research will be limited.")
+        pipeline_logger.warning("TAVILY_API_KEY is not set. Research will be limited.")
 
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
 
     # Create initial task record
     if db:
@@ -716,7 +1142,11 @@ async def start_deep_research(request: DeepResearchRequest, background_tasks: Ba
     else:
         deep_research_tasks[task_id] = {"status": "accepted", "started_at": time.time()}
 
-    background_tasks.add_task(run_deep_research_pipeline, task_id, request)
+    if job_queue:
+        await job_queue.enqueue_job("run_deep_research_job", task_id, request.model_dump(), trace_carrier=_trace_carrier(), _job_id=task_id)
+    else:
+        parent_ctx = trace.get_current_span().get_span_context()
+        background_tasks.add_task(run_deep_research_pipeline, task_id, request, holds_slot=holds_slot, parent_ctx=parent_ctx)
 
     return TaskStatus(
         task_id=task_id,
@@ -743,46 +1173,20 @@ async def start_deep_research(request: DeepResearchRequest, background_tasks: Ba
     - **Métricas de calidad**: Scores de completitud y evidencia
     - **Bibliografia**: Referencias de todas las fuentes consultadas
     """,
-    responses={
-        200: {
-            "description": "Reporte de investigación profunda recuperado exitosamente",
-            "content": {
-                "application/json": {
-                    "example": {
-                        "status": "completed",
-                        "report_md": "# Impacto de AI Act en Startups Europeas\n\n## Análisis Profundo\n...",
-                        "sources_bib": "Generated from 42 evidence sources",
-                        "research_summary": {
-                            "iterations_completed": 3,
-                            "gaps_identified": ["regulatory_compliance", "market_impact"],
-                            "key_findings": [
-                                "High compliance costs",
-                                "Market consolidation likely",
-                            ],
-                        },
-                        "quality_metrics": {
-                            "completion_level": 0.95,
-                            "quality_score": 0.88,
-                            "evidence_count": 42,
-                            "execution_time": 127.3,
-                        },
-                    }
-                }
-            },
-        },
-        404: {"description": "Tarea de investigación profunda no encontrada"},
-    },
+    responses=_OPENAPI_RESPONSES_DEEP_RESEARCH_REPORT,
 )
-async def get_deep_research_report(task_id: str):
+async def get_deep_research_report(task_id: str, if_none_match: str | None = Header(None)):
     """
     Retrieves the status and result of a deep research task.
+
+    Responses carry an ETag; a poll sending it back in If-None-Match gets an empty 304 while the report is unchanged.
     """
-    # Get task from database or in-memory
-    if db:
-        task = await db.get_task(task_id)
-    else:
-        task = deep_research_tasks.get(task_id)
+    cache_key = f"deep:{task_id}"
+    cached = _cached_response(cache_key, if_none_match)
+    if cached is not None:
+        return cached
 
+    task = await _load_deep_task(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Deep research task not found")
 
@@ -793,7 +1197,7 @@ async def get_deep_research_report(task_id: str):
             result = task.get("result")
             summary = task.get("summary", {})
 
-            return DeepResearchReport(
+            deep_report = DeepResearchReport(
                 status="completed",
                 report_md=report.get("content") if report else str(result),
                 sources_bib="Generated from deep research",
@@ -809,7 +1213,7 @@ async def get_deep_research_report(task_id: str):
             result = task["result"]
             summary = task["summary"]
 
-            return DeepResearchReport(
+            deep_report = DeepResearchReport(
                 status="completed",
                 report_md=result.final_report,
                 sources_bib=f"Generated from {result.total_evidence_count} evidence sources",
@@ -821,10 +1225,89 @@ async def get_deep_research_report(task_id: str):
                     "execution_time": result.execution_time_seconds,
                 },
             )
+
     elif task["status"] == "failed":
-        return DeepResearchReport(status="failed", report_md=f"Deep research failed: {task.get('error', 'Unknown error')}")
+        deep_report = DeepResearchReport(status="failed", report_md=f"Deep research failed: {task.get('error', 'Unknown error')}")
     else:
-        return DeepResearchReport(status=task["status"])
+        deep_report = DeepResearchReport(status=task["status"])
+
+    return _cache_response(cache_key, deep_report, terminal=task["status"] in TERMINAL_STATUSES, if_none_match=if_none_match)
+
+
+async def _load_deep_task(task_id: str) -> dict | None:
+    """Get a deep research task from the database or in-memory store."""
+    if db:
+        return await db.get_task(task_id)
+    return deep_research_tasks.get(task_id)
+
+
+def _sse_frame(event: str, data: str) -> bytes:
+    """Encode one Server-Sent Events frame; data is single-line JSON."""
+    return f"event: {event}\ndata: {data}\n\n".encode()
+
+
+@app.get(
+    "/deep-research/{task_id}/events",
+    tags=["deep-research"],
+    summary="Stream de eventos de investigación profunda",
+    description="""
+    Transmite el progreso de una investigación profunda como Server-Sent Events (`text/event-stream`)
+    en una sola respuesta HTTP, en lugar de consultar `/deep-research/{task_id}` periódicamente.
+
+    ### 📡 Eventos:
+    - `status`: Cambio de estado de la tarea, `{"status": "running"}`
+    - `progress`: Actualización del orquestador (mismo formato que el WebSocket)
+    - `completed` / `failed`: Reporte final (mismo cuerpo que `GET /deep-research/{task_id}`); el stream termina
+    """,
+    response_class=StreamingResponse,
+    responses={404: {"description": "Tarea de investigación profunda no encontrada"}},
+)
+async def stream_deep_research_events(task_id: str):
+    """
+    Streams status transitions, progress updates and the final report of a deep research task.
+    """
+    progress_manager = get_progress_manager()
+    # Subscribe before reading the task, so a transition between the two is not missed
+    queue = await progress_manager.subscribe(task_id)
+    task = await _load_deep_task(task_id)
+    if not task:
+        await progress_manager.unsubscribe(queue, task_id)
+        raise HTTPException(status_code=404, detail="Deep research task not found")
+
+    async def iter_events():
+        try:
+            current = task["status"]
+            yield _sse_frame("status", json.dumps({"status": current}))
+            while current not in TERMINAL_STATUSES:
+                try:
+                    update = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except TimeoutError:
+                    # Queued worker runs broadcast in another process; re-read the store so the stream still ends
+                    latest = await _load_deep_task(task_id)
+                    if not latest:
+                        return
+                    if latest["status"] == current:
+                        yield b": keep-alive\n\n"
+                        continue
+                    current = latest["status"]
+                    yield _sse_frame("status", json.dumps({"status": current}))
+                    continue
+
+                if update.event_type == "status":
+                    current = update.data["status"]
+                    yield _sse_frame("status", json.dumps(update.data))
+                else:
+                    yield _sse_frame("progress", update.to_json())
+
+            report = await get_deep_research_report(task_id, if_none_match=None)
+            yield _sse_frame(current, report.body.decode())
+        finally:
+            await progress_manager.unsubscribe(queue, task_id)
+
+    # An explicit Content-Encoding makes the gzip middleware pass frames through as they are written
+    # instead of holding them in its compression buffer until the stream ends
+    headers = {"Cache-Control": "no-cache", "Content-Encoding": "identity", "X-Accel-Buffering": "no"}
+    return StreamingResponse(iter_events(), media_type="text/event-stream", headers=headers)
 
 
 # --- WebSocket Endpoint for Real-Time Progress ---
@@ -850,7 +1333,7 @@ async def websocket_progress(websocket: WebSocket, task_id: str):
     ### Update Format:
     ```json
     {
-        "task_id": "550e8400-...",
+        "task_id": "550e8400...",
         "timestamp": "2025-10-22T10:30:00Z",
         "event_type": "iteration",
         "message": "Starting iteration 2/3",
@@ -869,9 +1352,8 @@ async def websocket_progress(websocket: WebSocket, task_id: str):
     - `report_generation`: Final report being generated
     - `completed`: Research completed successfully
     - `failed`: Research failed with error
+    - `status`: Task status changed (`running`, `completed`, `failed`)
     """
-    import asyncio
-
     progress_manager = get_progress_manager()
 
     try:
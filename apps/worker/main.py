@@ -0,0 +1,68 @@
+"""
+Research job worker.
+
+Runs the research pipelines enqueued by the API when ALETHEIA_JOB_QUEUE=arq and
+REDIS_URL are configured, so any number of worker processes can share one queue:
+
+    arq apps.worker.main.WorkerSettings
+"""
+import asyncio
+import os
+
+from arq.connections import RedisSettings
+from opentelemetry import propagate, trace
+
+from adapters.telemetry.events import get_event_logger
+from adapters.telemetry.log_config import setup_logging
+from adapters.telemetry.tracing import setup_telemetry
+from apps.api import main as api
+
+
+async def startup(ctx: dict) -> None:
+    """Initialize logging, telemetry, the shared task database and the agent services used by the pipelines."""
+    ctx["log_listener"] = setup_logging()
+    api.telemetry_manager = setup_telemetry()
+    api.TRACER = api.telemetry_manager.get_tracer()
+    api.db = await api.init_database()
+    if api.db is None:
+        raise RuntimeError("Research workers require a shared task store (MongoDB or Redis) so results are visible to the API")
+    await asyncio.to_thread(api.get_services)
+
+
+async def shutdown(ctx: dict) -> None:
+    """Close the shared task database and search connections, and flush pending events, spans and log records."""
+    if api.services:
+        api.services.researcher.close()
+        await api.services.researcher.aclose()
+    if api.db:
+        await api.db.close()
+    get_event_logger().close()
+    if api.telemetry_manager:
+        api.telemetry_manager.shutdown()
+    ctx["log_listener"].stop()
+
+
+def _parent_span_context(trace_carrier: dict | None) -> trace.SpanContext:
+    """Recover the enqueuing request's span context from the job's W3C trace headers."""
+    return trace.get_current_span(propagate.extract(trace_carrier or {})).get_span_context()
+
+
+async def run_research_job(_ctx: dict, task_id: str, query: str, trace_carrier: dict | None = None) -> None:
+    """Run the simple research pipeline for an enqueued task."""
+    await api.run_real_research_pipeline(task_id, query, parent_ctx=_parent_span_context(trace_carrier))
+
+
+async def run_deep_research_job(_ctx: dict, task_id: str, request: dict, trace_carrier: dict | None = None) -> None:
+    """Run the deep research pipeline for an enqueued task."""
+    await api.run_deep_research_pipeline(task_id, api.DeepResearchRequest(**request), parent_ctx=_parent_span_context(trace_carrier))
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    functions = [run_research_job, run_deep_research_job]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379"))
+    max_jobs = int(os.getenv("WORKER_MAX_JOBS", "10"))
+    job_timeout = int(os.getenv("WORKER_JOB_TIMEOUT", "3600"))
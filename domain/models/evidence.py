@@ -1,20 +1,24 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+# Evidence is built by adapters from already-typed data, thousands of times per run,
+# so it is a slotted dataclass rather than a validating Pydantic model.
 
 
-class EvidenceSource(BaseModel):
+@dataclass(slots=True)
+class EvidenceSource:
     url: str
     title: str
-    fetched_at: datetime = Field(default_factory=datetime.utcnow)
+    fetched_at: datetime = field(default_factory=datetime.utcnow)
 
 
-class Evidence(BaseModel):
+@dataclass(slots=True)
+class Evidence:
     id: str
     source: EvidenceSource
     excerpt: str
     hash: str | None = None
     tool_call_id: str | None = None
     score: float | None = None
-    tags: list[str] = []
+    tags: list[str] = field(default_factory=list)
     cit_key: str | None = None
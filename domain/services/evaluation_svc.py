@@ -1,4 +1,5 @@
 import json
+import logging
 import os
 
 from adapters.saptiva_model.saptiva_client import SaptivaModelAdapter
@@ -10,6 +11,8 @@ from domain.models.evaluation import (
 )
 from domain.models.evidence import Evidence
 
+logger = logging.getLogger(__name__)
+
 
 class EvaluationService:
     """
@@ -198,7 +201,7 @@ Generate 3-5 refinement queries:
                     reasoning=data.get("reasoning", ""),
                 )
         except Exception as e:
-            print(f"Error parsing evaluation response: {e}")
+            logger.warning("Error parsing evaluation response: %s", e)
 
         # Fallback response
         return CompletionScore(
@@ -232,7 +235,7 @@ Generate 3-5 refinement queries:
                     )
                 return gaps
         except Exception as e:
-            print(f"Error parsing gaps response: {e}")
+            logger.warning("Error parsing gaps response: %s", e)
 
         return []
 
@@ -258,6 +261,6 @@ Generate 3-5 refinement queries:
                     )
                 return queries
         except Exception as e:
-            print(f"Error parsing refinement response: {e}")
+            logger.warning("Error parsing refinement response: %s", e)
 
         return []
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
+import logging
 from typing import Any
 
 from opentelemetry import trace
@@ -24,8 +26,15 @@ from domain.services.planner_svc import PlannerService
 from domain.services.research_svc import ResearchService
 from domain.services.writer_svc import WriterService
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# A score change smaller than this between iterations counts as a plateau
+SCORE_PLATEAU_EPSILON = 0.01
+# Most optimistic per-iteration gain assumed for a plateaued score when projecting whether the threshold is reachable
+MIN_PROJECTED_SCORE_GAIN = 0.05
+
+
+@dataclass(slots=True)
 class ResearchIteration:
     """Represents one iteration of the research process"""
 
@@ -42,7 +51,7 @@ class ResearchIteration:
             self.timestamp = datetime.utcnow()
 
 
-@dataclass
+@dataclass(slots=True)
 class DeepResearchResult:
     """Complete result of iterative deep research process"""
 
@@ -62,20 +71,29 @@ class IterativeResearchOrchestrator:
     Orchestrates multiple research iterations with evaluation and refinement.
     """
 
-    def __init__(self, max_iterations: int = 3, min_completion_score: float = 0.75, budget: int = 100):
+    def __init__(
+        self,
+        max_iterations: int = 3,
+        min_completion_score: float = 0.75,
+        budget: int = 100,
+        planner: PlannerService | None = None,
+        researcher: ResearchService | None = None,
+        evaluator: EvaluationService | None = None,
+        writer: WriterService | None = None,
+    ):
         self.max_iterations = max_iterations
         self.min_completion_score = min_completion_score
         self.budget = budget
 
-        # Initialize all agent services
-        self.planner = PlannerService()
-        self.researcher = ResearchService()
-        self.evaluator = EvaluationService()
-        self.writer = WriterService()
+        # Agent services; callers running many orchestrations pass shared instances
+        self.planner = planner or PlannerService()
+        self.researcher = researcher or ResearchService()
+        self.evaluator = evaluator or EvaluationService()
+        self.writer = writer or WriterService()
 
     @trace_async_operation("deep_research.execute", {"research_type": "iterative"})
     async def execute_deep_research(
-        self, query: str, tracer: trace.Tracer | None = None, task_id: str | None = None
+        self, query: str, tracer: trace.Tracer | None = None, task_id: str | None = None, collection_name: str | None = None
     ) -> DeepResearchResult:
         """
         Execute iterative deep research following Together AI pattern.
@@ -84,16 +102,20 @@ class IterativeResearchOrchestrator:
             query: The research query
             tracer: Optional OpenTelemetry tracer
             task_id: Optional task ID for WebSocket progress updates
+            collection_name: Vector store collection for every iteration's evidence; defaults to
+                one derived from the query. The caller owns (and drops) a collection it passes in.
         """
         start_time = datetime.utcnow()
         iterations = []
         all_evidence = []
+        prev_score: float | None = None
 
         # Initialize event logging
         event_logger = get_event_logger()
         if task_id is None:
             task_id = f"deep_research_{int(start_time.timestamp())}"
         event_logger.set_task_context(task_id)
+        collection_name = collection_name or f"research_{self.researcher._generate_collection_id(query)}"
 
         # Get progress manager for WebSocket updates
         progress_manager = get_progress_manager()
@@ -109,8 +131,8 @@ class IterativeResearchOrchestrator:
             },
         )
 
-        print(f"🚀 Starting iterative deep research for: '{query}'")
-        print(f"📊 Configuration: max_iterations={self.max_iterations}, min_score={self.min_completion_score}")
+        logger.info("Starting iterative deep research for: %r", query)
+        logger.info("Configuration: max_iterations=%d, min_score=%s", self.max_iterations, self.min_completion_score)
 
         # Send start update
         await progress_manager.broadcast(
@@ -128,11 +150,11 @@ class IterativeResearchOrchestrator:
 
         # Initial research iteration
         with trace_operation("deep_research.planning", {"query_length": len(query)}, tracer=tracer) as span:
-            initial_plan = self.planner.create_plan(query)
+            initial_plan = await asyncio.to_thread(self.planner.create_plan, query)
             span.set_attribute("plan.subtask_count", len(initial_plan.sub_tasks))
 
         event_logger.log_plan_created(task_id, query, len(initial_plan.sub_tasks))
-        print(f"📋 Initial plan created with {len(initial_plan.sub_tasks)} sub-tasks")
+        logger.info("Initial plan created with %d sub-tasks", len(initial_plan.sub_tasks))
 
         # Send planning update
         await progress_manager.broadcast(
@@ -145,7 +167,7 @@ class IterativeResearchOrchestrator:
         )
 
         for iteration_num in range(1, self.max_iterations + 1):
-            print(f"\n🔄 === ITERATION {iteration_num} ===")
+            logger.info("Iteration %d", iteration_num)
 
             # Send iteration start update
             await progress_manager.broadcast(
@@ -157,48 +179,65 @@ class IterativeResearchOrchestrator:
                 )
             )
 
-            # Log iteration start
-            iteration_queries = []
+            # Queries for this iteration: the initial plan first, then the previous iteration's refinements
             if iteration_num == 1:
-                iteration_queries = [task.query for task in initial_plan.sub_tasks]
+                queries_executed = [task.query for task in initial_plan.sub_tasks]
             else:
-                iteration_queries = [rq.query for rq in iterations[-1].refinement_queries or []]
+                prev_refinements = iterations[-1].refinement_queries or []
+                queries_executed = [rq.query for rq in prev_refinements]
 
-            event_logger.log_iteration_started(task_id, iteration_num, iteration_queries)
+            # Log iteration start
+            event_logger.log_iteration_started(task_id, iteration_num, queries_executed)
 
-            # Execute research for this iteration with parallel processing
+            # Execute research for this iteration with parallel processing, capped at the remaining evidence budget
+            remaining_budget = self.budget - len(all_evidence)
             if iteration_num == 1:
                 # First iteration: use initial plan with parallel execution
-                iteration_evidence = await self.researcher.execute_plan_parallel(initial_plan)
-                queries_executed = [task.query for task in initial_plan.sub_tasks]
+                iteration_evidence = await self.researcher.execute_plan_parallel(
+                    initial_plan, max_evidence=remaining_budget, collection_name=collection_name
+                )
             else:
                 # Subsequent iterations: use refinement queries with parallel execution
-                refinement_queries = iterations[-1].refinement_queries or []
-                iteration_evidence = await self._execute_refinement_queries_parallel(refinement_queries)
-                queries_executed = [rq.query for rq in refinement_queries]
+                iteration_evidence = await self._execute_refinement_queries_parallel(
+                    prev_refinements, max_evidence=remaining_budget, collection_name=collection_name
+                )
 
             all_evidence.extend(iteration_evidence)
+            new_count = len(iteration_evidence)
+            total_count = len(all_evidence)
 
-            print(f"🔍 Collected {len(iteration_evidence)} new evidence items")
-            print(f"📈 Total evidence: {len(all_evidence)} items")
+            logger.info("Collected %d new evidence items", new_count)
+            logger.info("Total evidence: %d items", total_count)
 
             # Send evidence collection update
             await progress_manager.broadcast(
                 ProgressUpdate.create(
                     task_id,
                     "evidence",
-                    f"Collected {len(iteration_evidence)} new evidence items (total: {len(all_evidence)})",
+                    f"Collected {new_count} new evidence items (total: {total_count})",
                     {
-                        "new_evidence": len(iteration_evidence),
-                        "total_evidence": len(all_evidence),
+                        "new_evidence": new_count,
+                        "total_evidence": total_count,
                         "iteration": iteration_num,
                     },
                 )
             )
 
-            # Evaluate research completeness
-            completion_score = self.evaluator.evaluate_research_completeness(query, all_evidence)
-            print(f"📊 Completion Score: {completion_score.overall_score:.2f} ({completion_score.completion_level})")
+            # Gap analysis needs only the same evidence, so whenever another iteration could follow it runs
+            # alongside the evaluation; its result is discarded if the evaluation ends the research
+            gaps_task = None
+            if iteration_num < self.max_iterations and total_count < self.budget:
+                gaps_task = asyncio.create_task(asyncio.to_thread(self.evaluator.identify_information_gaps, query, all_evidence))
+
+            # Evaluate research completeness; evaluator calls are blocking LLM requests, so run them
+            # off the loop to keep other in-flight research jobs progressing during the barrier
+            try:
+                completion_score = await asyncio.to_thread(self.evaluator.evaluate_research_completeness, query, all_evidence)
+            except BaseException:
+                if gaps_task:
+                    gaps_task.cancel()
+                raise
+            logger.info("Completion score: %.2f (%s)", completion_score.overall_score, completion_score.completion_level)
 
             # Send evaluation update
             await progress_manager.broadcast(
@@ -224,15 +263,36 @@ class IterativeResearchOrchestrator:
 
             # Check if research is complete
             if completion_score.overall_score >= self.min_completion_score:
-                print(f"✅ Research completed! Score {completion_score.overall_score:.2f} meets threshold {self.min_completion_score}")
+                logger.info("Research completed: score %.2f meets threshold %s", completion_score.overall_score, self.min_completion_score)
+                if gaps_task:
+                    gaps_task.cancel()
+                iterations.append(iteration)
+                break
+
+            if len(all_evidence) >= self.budget:
+                logger.info("Evidence budget of %d exhausted, stopping iterations", self.budget)
                 iterations.append(iteration)
                 break
 
+            # Stop once the score has plateaued and even a steady gain over the remaining iterations could not reach
+            # the threshold; further rounds would only spend searches and LLM calls
+            score = completion_score.overall_score
+            if prev_score is not None:
+                delta = score - prev_score
+                projected_max = score + (self.max_iterations - iteration_num) * max(delta, MIN_PROJECTED_SCORE_GAIN)
+                if delta < SCORE_PLATEAU_EPSILON and projected_max < self.min_completion_score:
+                    logger.info("Completion score plateaued at %.2f, threshold %s unreachable; stopping iterations", score, self.min_completion_score)
+                    if gaps_task:
+                        gaps_task.cancel()
+                    iterations.append(iteration)
+                    break
+            prev_score = score
+
             # If not final iteration, identify gaps and generate refinements
-            if iteration_num < self.max_iterations:
-                print("🔍 Identifying information gaps...")
-                gaps = self.evaluator.identify_information_gaps(query, all_evidence)
-                print(f"🎯 Found {len(gaps)} information gaps")
+            if gaps_task:
+                logger.info("Identifying information gaps")
+                gaps = await gaps_task
+                logger.info("Found %d information gaps", len(gaps))
 
                 # Send gap analysis update
                 await progress_manager.broadcast(
@@ -247,8 +307,8 @@ class IterativeResearchOrchestrator:
                     )
                 )
 
-                refinement_queries = self.evaluator.generate_refinement_queries(gaps, query)
-                print(f"🎯 Generated {len(refinement_queries)} refinement queries")
+                refinement_queries = await asyncio.to_thread(self.evaluator.generate_refinement_queries, gaps, query)
+                logger.info("Generated %d refinement queries", len(refinement_queries))
 
                 # Send refinement update
                 await progress_manager.broadcast(
@@ -265,12 +325,12 @@ class IterativeResearchOrchestrator:
 
                 # Log gaps for visibility
                 for gap in gaps[:3]:  # Show top 3 gaps
-                    print(f"   Gap: {gap.gap_type} (Priority: {gap.priority})")
+                    logger.info("Gap: %s (priority %s)", gap.gap_type, gap.priority)
 
             iterations.append(iteration)
 
         # Generate final report
-        print("\n📝 Generating final report...")
+        logger.info("Generating final report")
 
         # Send report generation update
         await progress_manager.broadcast(
@@ -280,7 +340,7 @@ class IterativeResearchOrchestrator:
         )
 
         with trace_operation("deep_research.report_generation", {"evidence_count": len(all_evidence)}, tracer=tracer) as span:
-            final_report = self.writer.write_report(query, all_evidence)
+            final_report = await asyncio.to_thread(self.writer.write_report, query, all_evidence, collection_name)
             span.set_attribute("report.length", len(final_report))
 
         end_time = datetime.utcnow()
@@ -301,9 +361,9 @@ class IterativeResearchOrchestrator:
         # Log research completion with metrics
         event_logger.log_research_completed(task_id, len(all_evidence), result.research_quality_score, execution_time)
 
-        print("\n🎉 Deep research completed!")
-        print(f"📊 Final Stats: {len(all_evidence)} evidence items, {len(iterations)} iterations, {execution_time:.1f}s")
-        print(f"🏆 Quality Score: {result.research_quality_score:.2f} ({result.completion_level})")
+        logger.info("Deep research completed")
+        logger.info("Final stats: %d evidence items, %d iterations, %.1fs", len(all_evidence), len(iterations), execution_time)
+        logger.info("Quality score: %.2f (%s)", result.research_quality_score, result.completion_level)
 
         # Send completion update
         await progress_manager.broadcast(
@@ -323,41 +383,25 @@ class IterativeResearchOrchestrator:
 
         return result
 
-    async def _execute_refinement_queries(self, refinement_queries: list[RefinementQuery]) -> list[Evidence]:
-        """Execute refinement queries to address identified gaps (sequential version)."""
-        if not refinement_queries:
-            return []
-
-        # Convert refinement queries to research sub-tasks
-        sub_tasks = []
-        for i, rq in enumerate(refinement_queries):
-            sub_task = ResearchSubTask(id=f"refinement_{i+1}", query=rq.query, sources=rq.expected_sources)
-            sub_tasks.append(sub_task)
-
-        # Create plan for refinement queries
-        refinement_plan = ResearchPlan(main_query="Refinement research", sub_tasks=sub_tasks)
-
-        # Execute refinement research
-        return self.researcher.execute_plan(refinement_plan)
-
-    async def _execute_refinement_queries_parallel(self, refinement_queries: list[RefinementQuery]) -> list[Evidence]:
+    async def _execute_refinement_queries_parallel(
+        self, refinement_queries: list[RefinementQuery], max_evidence: int | None = None, collection_name: str | None = None
+    ) -> list[Evidence]:
         """Execute refinement queries to address identified gaps with parallel processing."""
         if not refinement_queries:
             return []
 
-        print(f"🔄 Executing {len(refinement_queries)} refinement queries in parallel...")
+        logger.info("Executing %d refinement queries in parallel", len(refinement_queries))
 
         # Convert refinement queries to research sub-tasks
-        sub_tasks = []
-        for i, rq in enumerate(refinement_queries):
-            sub_task = ResearchSubTask(id=f"refinement_{i+1}", query=rq.query, sources=rq.expected_sources)
-            sub_tasks.append(sub_task)
+        sub_tasks = [
+            ResearchSubTask(id=f"refinement_{i+1}", query=rq.query, sources=rq.expected_sources) for i, rq in enumerate(refinement_queries)
+        ]
 
         # Create plan for refinement queries
         refinement_plan = ResearchPlan(main_query="Refinement research", sub_tasks=sub_tasks)
 
         # Execute refinement research with parallel processing
-        return await self.researcher.execute_plan_parallel(refinement_plan)
+        return await self.researcher.execute_plan_parallel(refinement_plan, max_evidence=max_evidence, collection_name=collection_name)
 
     def get_research_summary(self, result: DeepResearchResult) -> dict[str, Any]:
         """Generate a summary of the research process for API responses."""
@@ -1,3 +1,4 @@
+import logging
 import os
 
 import yaml
@@ -5,6 +6,8 @@ import yaml
 from adapters.saptiva_model.saptiva_client import SaptivaModelAdapter
 from domain.models.plan import ResearchPlan, ResearchSubTask
 
+logger = logging.getLogger(__name__)
+
 
 class PlannerService:
     def __init__(self):
@@ -24,7 +27,7 @@ class PlannerService:
             plan_yaml = response.get("content", "")
             return self._parse_plan(query, plan_yaml)
         except Exception as e:
-            print(f"Error generating plan: {e}")
+            logger.error("Error generating plan: %s", e)
             # Return fallback plan
             return ResearchPlan(
                 main_query=query,
@@ -45,7 +48,7 @@ Research Plan (YAML):
         try:
             sub_tasks_data = yaml.safe_load(plan_yaml)
             if not isinstance(sub_tasks_data, list):
-                print(f"Warning: Planner did not return a list of sub-tasks. Got: {sub_tasks_data}")
+                logger.warning("Planner did not return a list of sub-tasks. Got: %r", sub_tasks_data)
                 return ResearchPlan(
                     main_query=main_query,
                     sub_tasks=[ResearchSubTask(id="T01", query=main_query, sources=["web"])],
@@ -54,7 +57,7 @@ Research Plan (YAML):
             sub_tasks = [ResearchSubTask(**task_data) for task_data in sub_tasks_data]
             return ResearchPlan(main_query=main_query, sub_tasks=sub_tasks)
         except (yaml.YAMLError, TypeError) as e:
-            print(f"Error parsing plan YAML: {e}")
+            logger.warning("Error parsing plan YAML: %s", e)
             # Return a plan with a single task to research the original query
             return ResearchPlan(
                 main_query=main_query,
@@ -1,14 +1,23 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import AsyncIterator
+from dataclasses import replace
 import hashlib
+import logging
 import os
 
+from cachetools import TTLCache
+
 from adapters.tavily_search.tavily_client import TavilySearchAdapter
 from adapters.weaviate_vector.weaviate_adapter import WeaviateVectorAdapter
 from domain.models.evidence import Evidence
 from domain.models.plan import ResearchPlan
 from ports.vector_store_port import VectorStorePort
 
+logger = logging.getLogger(__name__)
+
+# Distinct search queries whose results are kept for reuse across runs
+SEARCH_CACHE_SIZE = 1024
+
 
 class ResearchService:
     def __init__(self):
@@ -17,16 +26,27 @@ class ResearchService:
             self.search_adapter = TavilySearchAdapter()
             self.search_enabled = True
         except ValueError as e:
-            print(f"Disabling search functionality: {e}")
+            logger.warning("Disabling search functionality: %s", e)
             self.search_enabled = False
 
+        # Search results by normalized query, so repeated sub-task queries skip the Tavily call; 0 disables
+        search_cache_ttl = int(os.getenv("SEARCH_CACHE_TTL", "86400"))
+        self._search_cache: TTLCache | None = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=search_cache_ttl) if search_cache_ttl > 0 else None
+
+        # Sub-tasks searched concurrently by stream_evidence
+        self.max_parallel_subtasks = max(int(os.getenv("MAX_PARALLEL_SUBTASKS", "5")), 1)
+
+        # Evidence is written to the vector store in batches of up to this many items, by this many concurrent writers
+        self.vector_batch_size = max(int(os.getenv("VECTOR_BATCH_SIZE", "64")), 1)
+        self.vector_batch_concurrency = max(int(os.getenv("VECTOR_BATCH_CONCURRENCY", "2")), 1)
+
         # Initialize vector store based on configuration
         vector_backend = os.getenv("VECTOR_BACKEND", "weaviate").lower()
 
         if vector_backend == "none":
             # Use Weaviate in mock mode (no connection attempts)
             self.vector_store: VectorStorePort = WeaviateVectorAdapter(force_mock=True)
-            print("Vector storage disabled - using mock storage (no Weaviate connection).")
+            logger.info("Vector storage disabled - using mock storage (no Weaviate connection).")
             # Invoke health check to keep interface consistent even in mock mode.
             self.vector_store.health_check()
         else:
@@ -35,9 +55,9 @@ class ResearchService:
 
             # Check if vector store is healthy
             if self.vector_store.health_check():
-                print("Weaviate vector store is healthy and ready.")
+                logger.info("Weaviate vector store is healthy and ready.")
             else:
-                print("Weaviate not available - using mock vector storage.")
+                logger.info("Weaviate not available - using mock vector storage.")
 
     def execute_plan(self, plan: ResearchPlan) -> list[Evidence]:
         """
@@ -45,7 +65,7 @@ class ResearchService:
         Now stores evidence in vector database for RAG.
         """
         if not self.search_enabled:
-            print("ResearchService search is disabled due to missing API key.")
+            logger.warning("ResearchService search is disabled due to missing API key.")
             return []
 
         # Create a collection for this research session
@@ -55,104 +75,172 @@ class ResearchService:
         all_evidence = []
         for task in plan.sub_tasks:
             if "web" in task.sources:
-                print(f"--- Executing Research Sub-Task: {task.query} ---")
+                logger.info("Executing research sub-task: %s", task.query)
                 search_results = self.search_adapter.search(query=task.query)
 
+                # results are already Evidence objects from TavilySearchAdapter
+                # Just update the tool_call_id to track which task they came from
+                tool_call_id = f"tavily:{task.id}"
                 for result in search_results:
-                    # result is already an Evidence object from TavilySearchAdapter
-                    # Just update the tool_call_id to track which task it came from
-                    result.tool_call_id = f"tavily:{task.id}"
-                    evidence = result
-
-                    # Store in vector database
-                    stored = self.vector_store.store_evidence(evidence, collection_name)
-                    if stored:
-                        print(f"Stored evidence {evidence.id} in vector store")
+                    result.tool_call_id = tool_call_id
+                all_evidence.extend(search_results)
 
-                    all_evidence.append(evidence)
-
-        print(f"Research completed. Stored {len(all_evidence)} pieces of evidence in collection {collection_name}")
+        # Store in vector database with batched writes
+        stored = sum(self.vector_store.store_evidence_batch(batch, collection_name) for batch in self._vector_batches(all_evidence))
+        logger.info("Research completed. Stored %d/%d pieces of evidence in collection %s", stored, len(all_evidence), collection_name)
         return all_evidence
 
-    async def execute_plan_parallel(self, plan: ResearchPlan) -> list[Evidence]:
+    async def execute_plan_parallel(
+        self, plan: ResearchPlan, max_evidence: int | None = None, collection_name: str | None = None
+    ) -> list[Evidence]:
         """
-        Executes the research plan with parallel search processing for improved performance.
-        Uses asyncio and ThreadPoolExecutor to run searches concurrently.
+        Executes the research plan concurrently and returns all collected evidence.
+        See stream_evidence for the pipeline, the max_evidence budget and collection_name.
+        """
+        return [evidence async for evidence in self.stream_evidence(plan, max_evidence, collection_name)]
+
+    async def stream_evidence(
+        self, plan: ResearchPlan, max_evidence: int | None = None, collection_name: str | None = None
+    ) -> AsyncIterator[Evidence]:
+        """
+        Executes the research plan as an asyncio pipeline, yielding evidence as each sub-task completes.
+        Sub-tasks flow through a bounded queue to concurrent search workers, which
+        hand evidence to storage workers as soon as each search returns, so vector
+        store writes overlap with the remaining searches and with the consumer.
+
+        When max_evidence is given, remaining sub-tasks are cancelled as soon as
+        that many evidence items have been collected. Every yielded item has been
+        stored once the iterator is exhausted.
+
+        Evidence is stored in collection_name, defaulting to a collection derived from
+        the plan's main query. Callers sharing this service across concurrent runs pass a
+        per-run name and drop it with delete_collection when the run ends.
         """
         if not self.search_enabled:
-            print("ResearchService search is disabled due to missing API key.")
-            return []
+            logger.warning("ResearchService search is disabled due to missing API key.")
+            return
 
         # Create a collection for this research session
-        collection_name = f"research_{self._generate_collection_id(plan.main_query)}"
+        collection_name = collection_name or f"research_{self._generate_collection_id(plan.main_query)}"
         self.vector_store.create_collection(collection_name)
 
         # Filter tasks that need web search
         web_tasks = [task for task in plan.sub_tasks if "web" in task.sources]
 
         if not web_tasks:
-            print("No web search tasks found in plan")
-            return []
-
-        print(f"🚀 Executing {len(web_tasks)} research tasks in parallel...")
-
-        # Execute searches in parallel
-        with ThreadPoolExecutor(max_workers=min(len(web_tasks), 5)) as executor:
-            # Submit all search tasks concurrently
-            search_futures = [executor.submit(self._execute_single_search_task, task) for task in web_tasks]
-
-            # Collect results as they complete
-            all_evidence = []
-            completed_tasks = 0
+            logger.info("No web search tasks found in plan")
+            return
 
-            for future in asyncio.as_completed([asyncio.wrap_future(f) for f in search_futures]):
+        logger.info("Executing %d research tasks in parallel", len(web_tasks))
+
+        plan_q: asyncio.Queue = asyncio.Queue(maxsize=8)
+        # Each sub-task's evidence is stored in batches of up to vector_batch_size items
+        ev_q: asyncio.Queue = asyncio.Queue()
+        out_q: asyncio.Queue = asyncio.Queue()
+        num_researchers = min(len(web_tasks), self.max_parallel_subtasks)
+        num_storers = self.vector_batch_concurrency
+
+        collected = 0
+        completed_tasks = 0
+        stored_count = 0
+        pipeline: list[asyncio.Task] = []
+
+        async def produce_tasks():
+            for task in web_tasks:
+                await plan_q.put(task)
+            for _ in range(num_researchers):
+                await plan_q.put(None)
+
+        async def research_worker():
+            nonlocal completed_tasks, collected
+            while (task := await plan_q.get()) is not None:
                 try:
-                    task_evidence = await future
-                    all_evidence.extend(task_evidence)
-                    completed_tasks += 1
-                    print(f"✅ Task {completed_tasks}/{len(web_tasks)} completed, found {len(task_evidence)} evidence items")
+                    task_evidence = await self._execute_single_search_task(task)
                 except Exception as e:
-                    print(f"❌ Task failed: {e}")
                     completed_tasks += 1
+                    logger.warning("Research task failed: %s", e)
+                    continue
+
+                completed_tasks += 1
+                logger.info("Task %d/%d completed, found %d evidence items", completed_tasks, len(web_tasks), len(task_evidence))
+                if max_evidence is not None:
+                    task_evidence = task_evidence[: max_evidence - collected]
+                collected += len(task_evidence)
+                for batch in self._vector_batches(task_evidence):
+                    ev_q.put_nowait(batch)
+                for evidence in task_evidence:
+                    out_q.put_nowait(evidence)
+
+                if max_evidence is not None and collected >= max_evidence:
+                    logger.info("Evidence budget of %d reached, cancelling remaining sub-tasks", max_evidence)
+                    for other in pipeline:
+                        if other is not asyncio.current_task():
+                            other.cancel()
+                    return
+
+        async def store_worker():
+            nonlocal stored_count
+            while (batch := await ev_q.get()) is not None:
+                try:
+                    stored_count += await asyncio.to_thread(self.vector_store.store_evidence_batch, batch, collection_name)
+                except Exception as e:
+                    logger.warning("Error storing evidence: %s", e)
 
-        # Store all evidence in vector database in parallel
-        await self._store_evidence_batch(all_evidence, collection_name)
-
-        print(f"🎉 Parallel research completed. Stored {len(all_evidence)} pieces of evidence in collection {collection_name}")
-        return all_evidence
+        async def run_searches():
+            await asyncio.gather(*pipeline, return_exceptions=True)
+            out_q.put_nowait(None)
 
-    def _execute_single_search_task(self, task) -> list[Evidence]:
-        """Execute a single search task synchronously."""
-        print(f"🔍 Searching: {task.query}")
-        search_results = self.search_adapter.search(query=task.query)
+        storers = [asyncio.create_task(store_worker()) for _ in range(num_storers)]
+        pipeline.append(asyncio.create_task(produce_tasks()))
+        pipeline.extend(asyncio.create_task(research_worker()) for _ in range(num_researchers))
+        searches = asyncio.create_task(run_searches())
 
-        evidence_list = []
+        try:
+            while (evidence := await out_q.get()) is not None:
+                yield evidence
+        finally:
+            # Consumer may stop early; cancel outstanding searches before draining storage
+            for task in pipeline:
+                task.cancel()
+            await asyncio.gather(searches, return_exceptions=True)
+
+            # Searches are done; signal end-of-stream to storage workers
+            for _ in range(num_storers):
+                ev_q.put_nowait(None)
+            await asyncio.gather(*storers, return_exceptions=True)
+
+            logger.info("Batch storage completed: %d/%d items stored", stored_count, collected)
+            logger.info("Parallel research completed. Stored %d pieces of evidence in collection %s", collected, collection_name)
+
+    async def _execute_single_search_task(self, task) -> list[Evidence]:
+        """Execute a single search task on the event loop, reusing cached results for a repeated query."""
+        search_results = await self._cached_search(task.query)
+
+        # Update tool_call_id to track which task the results came from
+        tool_call_id = f"tavily:{task.id}"
         for result in search_results:
-            # Update tool_call_id to track which task it came from
-            result.tool_call_id = f"tavily:{task.id}"
-            evidence_list.append(result)
+            result.tool_call_id = tool_call_id
 
-        return evidence_list
+        return search_results
 
-    async def _store_evidence_batch(self, evidence_list: list[Evidence], collection_name: str):
-        """Store evidence items in vector database using batch processing."""
-        if not evidence_list:
-            return
-
-        # Use ThreadPoolExecutor for parallel storage operations
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            storage_futures = [executor.submit(self.vector_store.store_evidence, evidence, collection_name) for evidence in evidence_list]
+    async def _cached_search(self, query: str) -> list[Evidence]:
+        """Search for query, serving and storing copies so callers can tag the returned evidence freely."""
+        if self._search_cache is None:
+            logger.info("Searching: %s", query)
+            return await self.search_adapter.asearch(query)
 
-            stored_count = 0
-            for future in asyncio.as_completed([asyncio.wrap_future(f) for f in storage_futures]):
-                try:
-                    stored = await future
-                    if stored:
-                        stored_count += 1
-                except Exception as e:
-                    print(f"⚠️  Error storing evidence: {e}")
+        key = " ".join(query.lower().split())
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            logger.info("Search cache hit: %s", query)
+            return [replace(evidence) for evidence in cached]
 
-            print(f"📦 Batch storage completed: {stored_count}/{len(evidence_list)} items stored")
+        logger.info("Searching: %s", query)
+        results = await self.search_adapter.asearch(query)
+        # Empty results are also what the adapter returns on errors, so they are not cached
+        if results:
+            self._search_cache[key] = [replace(evidence) for evidence in results]
+        return results
 
     def search_existing_evidence(self, query: str, collection_name: str = "default", limit: int = 5) -> list[Evidence]:
         """
@@ -160,6 +248,25 @@ class ResearchService:
         """
         return self.vector_store.search_similar(query, collection_name, limit)
 
+    def delete_collection(self, collection_name: str) -> bool:
+        """Drop a research collection once its run no longer needs it."""
+        return self.vector_store.delete_collection(collection_name)
+
+    def close(self):
+        """Release the search adapter's pooled HTTP connections."""
+        if self.search_enabled:
+            self.search_adapter.close()
+
+    async def aclose(self):
+        """Release the search adapter's pooled async HTTP connections."""
+        if self.search_enabled:
+            await self.search_adapter.aclose()
+
+    def _vector_batches(self, evidence_list: list[Evidence]) -> list[list[Evidence]]:
+        """Split evidence into vector store batches of at most vector_batch_size items."""
+        size = self.vector_batch_size
+        return [evidence_list[i : i + size] for i in range(0, len(evidence_list), size)]
+
     def _generate_collection_id(self, main_query: str) -> str:
         """Generate a unique collection ID based on the main query."""
         return hashlib.sha256(main_query.encode()).hexdigest()[:8]
@@ -1,4 +1,5 @@
 import hashlib
+import logging
 import os
 
 from adapters.saptiva_model.saptiva_client import SaptivaModelAdapter
@@ -6,6 +7,8 @@ from adapters.weaviate_vector.weaviate_adapter import WeaviateVectorAdapter
 from domain.models.evidence import Evidence
 from ports.vector_store_port import VectorStorePort
 
+logger = logging.getLogger(__name__)
+
 
 class WriterService:
     def __init__(self):
@@ -23,13 +26,14 @@ class WriterService:
             # Initialize vector store for RAG
             self.vector_store: VectorStorePort = WeaviateVectorAdapter()
 
-    def write_report(self, query: str, evidence_list: list[Evidence]) -> str:
+    def write_report(self, query: str, evidence_list: list[Evidence], collection_name: str | None = None) -> str:
         """
         Generates a markdown report based on the collected evidence.
-        Now enhanced with RAG retrieval for additional context.
+        Now enhanced with RAG retrieval for additional context from collection_name
+        (by default the collection derived from the query).
         """
         # Get collection name based on query
-        collection_name = f"research_{self._generate_collection_id(query)}"
+        collection_name = collection_name or f"research_{self._generate_collection_id(query)}"
 
         # Enhance evidence with RAG retrieval
         enhanced_evidence = self._enhance_with_rag(query, evidence_list, collection_name)
@@ -47,18 +51,12 @@ class WriterService:
         # Search for additional relevant evidence
         additional_evidence = self.vector_store.search_similar(query, collection_name, limit=10)
 
-        # Deduplicate by hash or ID
-        seen_hashes = set()
-        seen_ids = set()
-
-        # Add original evidence first
-        for ev in evidence_list:
-            seen_ids.add(ev.id)
-            if ev.hash:
-                seen_hashes.add(ev.hash)
+        # Deduplicate by hash or ID, keeping the original evidence first
+        seen_ids = {ev.id for ev in evidence_list}
+        seen_hashes = {ev.hash for ev in evidence_list if ev.hash}
 
         # Add non-duplicate additional evidence
-        enhanced_list = evidence_list.copy()
+        enhanced_list = list(evidence_list)
         for ev in additional_evidence:
             if ev.id not in seen_ids and (not ev.hash or ev.hash not in seen_hashes):
                 enhanced_list.append(ev)
@@ -66,7 +64,7 @@ class WriterService:
                 if ev.hash:
                     seen_hashes.add(ev.hash)
 
-        print(f"Enhanced evidence: {len(evidence_list)} original + {len(enhanced_list) - len(evidence_list)} from RAG = {len(enhanced_list)} total")
+        logger.info("Enhanced evidence: %d original + %d from RAG = %d total", len(evidence_list), len(enhanced_list) - len(evidence_list), len(enhanced_list))
         return enhanced_list
 
     def _build_prompt(self, query: str, evidence_list: list[Evidence]) -> str:
@@ -23,20 +23,42 @@ import json
 import sys
 import time
 
+import httpx
 import requests
 import websockets
 
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
 
 class DeepResearchClient:
     """Cliente para la API de Deep Research"""
 
     def __init__(self, api_url: str = "http://localhost:8000"):
         self.api_url = api_url
+        # Sesión persistente: las consultas de estado reutilizan la misma conexión keep-alive
+        self.session = requests.Session()
+        # Último ETag y estado por tarea: si no cambió, el servidor responde 304 sin cuerpo
+        self._etag_cache: dict[str, tuple[str, dict]] = {}
+
+    def __enter__(self) -> "DeepResearchClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Cierra las conexiones de la sesión"""
+        self.session.close()
 
     def check_health(self) -> bool:
         """Verifica que la API esté corriendo"""
         try:
-            response = requests.get(f"{self.api_url}/health", timeout=5)
+            response = self.session.get(f"{self.api_url}/health", timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
@@ -56,7 +78,7 @@ class DeepResearchClient:
             "budget": budget
         }
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.api_url}/deep-research",
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -67,26 +89,47 @@ class DeepResearchClient:
         return data["task_id"]
 
     def get_status(self, task_id: str) -> dict:
-        """Obtiene el estado de una tarea"""
-        response = requests.get(
+        """Obtiene el estado de una tarea (GET condicional con If-None-Match)"""
+        response = self.session.get(
             f"{self.api_url}/deep-research/{task_id}",
+            headers=self._conditional_headers(task_id),
             timeout=5
         )
+        return self._read_status(task_id, response)
+
+    def _conditional_headers(self, task_id: str) -> dict | None:
+        """If-None-Match con el último ETag conocido de la tarea"""
+        cached = self._etag_cache.get(task_id)
+        return {"If-None-Match": cached[0]} if cached else None
+
+    def _read_status(self, task_id: str, response: requests.Response | httpx.Response) -> dict:
+        """Devuelve el estado de la respuesta, o el guardado si el servidor respondió 304"""
+        cached = self._etag_cache.get(task_id)
+        if response.status_code == 304 and cached:
+            return cached[1]
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[task_id] = (etag, data)
+        return data
 
     def monitor_research(self, task_id: str, max_wait_minutes: int = 10) -> dict | None:
         """Monitorea el progreso de una investigación profunda (método legacy sin WebSocket)"""
-        max_attempts = max_wait_minutes * 12  # Check every 5 seconds
         start_time = time.time()
+        deadline = start_time + max_wait_minutes * 60
+        # Backoff exponencial: consultas frecuentes al inicio, después como máximo cada 5 segundos
+        delay = 0.5
+        attempt = 0
 
-        for attempt in range(max_attempts):
+        while time.time() < deadline:
+            attempt += 1
             try:
                 data = self.get_status(task_id)
                 status = data.get("status")
 
                 elapsed = time.time() - start_time
-                print(f"   [{elapsed:.1f}s] Status: {status} (intento {attempt + 1}/{max_attempts})")
+                print(f"   [{elapsed:.1f}s] Status: {status} (intento {attempt})")
 
                 if status == "completed":
                     return data
@@ -95,15 +138,116 @@ class DeepResearchClient:
                     print(f"❌ La investigación falló: {error}")
                     return None
 
-                time.sleep(5)
-
             except Exception as e:
                 print(f"⚠️  Error al verificar estado: {e}")
-                time.sleep(5)
+
+            time.sleep(delay)
+            delay = min(delay * 1.5, 5.0)
 
         print("❌ Timeout: La investigación tardó demasiado")
         return None
 
+    async def monitor_research_async(self, task_ids: list[str], max_wait_minutes: int = 10) -> dict[str, dict | None]:
+        """
+        Monitorea varias investigaciones profundas a la vez. Todas las consultas comparten un único
+        httpx.AsyncClient, así que reutilizan el mismo pool de conexiones (HTTP/2 si h2 está instalado).
+
+        Returns:
+            El resultado final de cada tarea (o None si falla), por task_id
+        """
+        async with httpx.AsyncClient(
+            base_url=self.api_url,
+            http2=H2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=32),
+            timeout=httpx.Timeout(10.0),
+        ) as client:
+            results = await asyncio.gather(*(self._poll_async(client, task_id, max_wait_minutes) for task_id in task_ids))
+        return dict(zip(task_ids, results, strict=True))
+
+    async def _poll_async(self, client: httpx.AsyncClient, task_id: str, max_wait_minutes: int) -> dict | None:
+        """Consulta el estado de una tarea con backoff exponencial y GET condicional"""
+        deadline = time.time() + max_wait_minutes * 60
+        delay = 0.5
+
+        while time.time() < deadline:
+            try:
+                response = await client.get(f"/deep-research/{task_id}", headers=self._conditional_headers(task_id))
+                data = self._read_status(task_id, response)
+
+                if data.get("status") == "completed":
+                    return data
+                elif data.get("status") == "failed":
+                    print(f"❌ [{task_id}] La investigación falló: {data.get('report_md', 'Unknown error')}")
+                    return None
+
+            except httpx.HTTPError as e:
+                print(f"⚠️  [{task_id}] Error al verificar estado: {e}")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 5.0)
+
+        print(f"❌ [{task_id}] Timeout: La investigación tardó demasiado")
+        return None
+
+    def stream_events(self, task_id: str, max_wait_minutes: int = 10) -> dict | None:
+        """
+        Monitorea una investigación profunda con Server-Sent Events: el servidor escribe cada cambio
+        de estado y el reporte final en una sola respuesta HTTP. Vuelve al polling si el servidor no
+        expone el endpoint (404/406).
+        """
+        start_time = time.time()
+        deadline = start_time + max_wait_minutes * 60
+
+        # El servidor manda un keep-alive cada 15 s, así que 30 s sin datos es una conexión caída
+        response = self.session.get(
+            f"{self.api_url}/deep-research/{task_id}/events",
+            headers={"Accept": "text/event-stream"},
+            stream=True,
+            timeout=(5, 30)
+        )
+        with response:
+            if response.status_code in (404, 406):
+                print("   ⚠️  El servidor no expone eventos SSE, volviendo a polling...")
+                return self.monitor_research(task_id, max_wait_minutes)
+            response.raise_for_status()
+            response.encoding = "utf-8"
+
+            event, data_lines = "message", []
+            for line in response.iter_lines(decode_unicode=True):
+                if time.time() > deadline:
+                    print("❌ Timeout: La investigación tardó demasiado")
+                    return None
+
+                if line:
+                    # Las líneas que empiezan con ':' son comentarios (keep-alive)
+                    if not line.startswith(":"):
+                        field, _, value = line.partition(":")
+                        if field == "event":
+                            event = value.removeprefix(" ")
+                        elif field == "data":
+                            data_lines.append(value.removeprefix(" "))
+                    continue
+
+                # Una línea vacía cierra el frame
+                if data_lines:
+                    payload = json.loads("\n".join(data_lines))
+                    elapsed = time.time() - start_time
+
+                    if event == "status":
+                        print(f"   [{elapsed:.1f}s] Status: {payload.get('status')}")
+                    elif event == "progress":
+                        print(f"   [{elapsed:.1f}s] {payload.get('message', '')}")
+                    elif event == "completed":
+                        return payload
+                    elif event == "failed":
+                        print(f"❌ La investigación falló: {payload.get('report_md', 'Unknown error')}")
+                        return None
+
+                event, data_lines = "message", []
+
+        print("⚠️  El stream de eventos terminó sin un resultado final")
+        return None
+
     async def monitor_research_websocket(self, task_id: str, max_wait_minutes: int = 10) -> dict | None:
         """
         Monitorea el progreso de una investigación profunda usando WebSocket para actualizaciones en tiempo real.
@@ -192,8 +336,8 @@ class DeepResearchClient:
 
         except websockets.exceptions.WebSocketException as e:
             print(f"\n⚠️  Error de WebSocket: {e}")
-            print("   Volviendo a polling tradicional...")
-            return self.monitor_research(task_id, max_wait_minutes)
+            print("   Volviendo a Server-Sent Events...")
+            return await asyncio.to_thread(self.stream_events, task_id, max_wait_minutes)
 
         except Exception as e:
             print(f"\n⚠️  Error inesperado: {e}")
@@ -347,7 +491,8 @@ async def async_main():
 
         # Preview
         print("\n📄 Preview del reporte:")
-        lines = report_md.split("\n")
+        # Solo se separan las líneas del preview; el resto queda en un único fragmento
+        lines = report_md.split("\n", 15)
         for line in lines[:15]:
             print(line)
         if len(lines) > 15:
@@ -40,11 +40,19 @@ def start_research(api_url: str, query: str) -> str:
 
 def monitor_task(api_url: str, task_id: str, max_attempts: int = 60) -> bool:
     """Monitorea el estado de una tarea hasta que complete o falle"""
+    # GET condicional: mientras el estado no cambie, el servidor responde 304 sin cuerpo
+    etag, data = None, None
     for attempt in range(max_attempts):
-        response = requests.get(f"{api_url}/tasks/{task_id}/status", timeout=5)
-        response.raise_for_status()
+        response = requests.get(
+            f"{api_url}/tasks/{task_id}/status",
+            headers={"If-None-Match": etag} if etag else None,
+            timeout=5
+        )
+        if response.status_code != 304:
+            response.raise_for_status()
+            data = response.json()
+            etag = response.headers.get("ETag")
 
-        data = response.json()
         status = data["status"]
 
         print(f"   Status: {status} (intento {attempt + 1}/{max_attempts})")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import asyncio
 from typing import Any
 
 from domain.models.evidence import Evidence
@@ -22,6 +23,23 @@ class SearchPort(ABC):
         """
         pass
 
+    async def asearch(self, query: str, max_results: int = 10, **kwargs: Any) -> list[Evidence]:
+        """
+        Perform a web search from the event loop.
+
+        Adapters with an async HTTP client should override this; the default runs
+        search in a worker thread.
+
+        Args:
+            query: Search query text
+            max_results: Maximum number of results to return
+            **kwargs: Additional search parameters (domain filters, date ranges, etc.)
+
+        Returns:
+            List of Evidence objects from search results
+        """
+        return await asyncio.to_thread(self.search, query, max_results, **kwargs)
+
     @abstractmethod
     def search_news(self, query: str, max_results: int = 10, days: int = 30) -> list[Evidence]:
         """
@@ -20,6 +20,22 @@ class VectorStorePort(ABC):
         """
         pass
 
+    def store_evidence_batch(self, evidence_list: list[Evidence], collection_name: str = "default") -> int:
+        """
+        Store several evidence items in the vector database.
+
+        Adapters whose backend has a bulk insert should override this; the default
+        stores the items one by one.
+
+        Args:
+            evidence_list: Evidence objects to store
+            collection_name: Name of the collection/index
+
+        Returns:
+            Number of items stored
+        """
+        return sum(1 for evidence in evidence_list if self.store_evidence(evidence, collection_name))
+
     @abstractmethod
     def search_similar(self, query: str, collection_name: str = "default", limit: int = 5) -> list[Evidence]:
         """
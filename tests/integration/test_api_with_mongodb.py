@@ -1,7 +1,10 @@
 """Integration tests for API with MongoDB."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
 
+from cachetools import TTLCache
 from fastapi.testclient import TestClient
 import pytest
 
@@ -43,6 +46,13 @@ def mock_mongodb():
     return mock_db
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty report response cache."""
+    with patch.dict("apps.api.main._RESPONSE_CACHE", clear=True):
+        yield
+
+
 @pytest.fixture
 def client_with_mongodb(mock_mongodb):
     """Create test client with MongoDB mocked."""
@@ -74,6 +84,19 @@ class TestAPIWithMongoDB:
         assert data["status"] == "healthy"
         assert "api_keys" in data
 
+    def test_health_endpoint_serves_cached_snapshot(self, client_with_mongodb):
+        """Test a probe within the TTL gets the cached status without recomputing it."""
+        with patch("apps.api.main._health_snapshot", (0.0, b"")), patch("apps.api.main.get_api_keys_status") as mock_status:
+            mock_status.return_value = {"saptiva_available": True, "tavily_available": False}
+            fresh = client_with_mongodb.get("/health").json()
+            cached = client_with_mongodb.get("/health").json()
+
+        mock_status.assert_called_once()
+        assert fresh.pop("cached") is False
+        assert cached.pop("cached") is True
+        fresh.pop("timestamp")
+        assert cached == fresh
+
     def test_create_research_task_with_mongodb(self, client_with_mongodb, mock_mongodb):
         """Test creating research task with MongoDB."""
         response = client_with_mongodb.post(
@@ -90,6 +113,18 @@ class TestAPIWithMongoDB:
         # Note: MongoDB call happens in background task
         # This test verifies the endpoint works, actual persistence is tested elsewhere
 
+    def test_identical_in_flight_research_shares_task(self, client_with_mongodb, mock_mongodb):
+        """Test an identical request while a run is in flight returns that run's task id."""
+        with patch("apps.api.main._in_flight_research", {}), patch("apps.api.main.run_real_research_pipeline", AsyncMock()) as mock_pipeline:
+            first = client_with_mongodb.post("/research", json={"query": "Shared query"}).json()
+            second = client_with_mongodb.post("/research", json={"query": "Shared query"}).json()
+            scoped = client_with_mongodb.post("/research", json={"query": "Shared query", "scope": "Mexico"}).json()
+
+        assert second["task_id"] == first["task_id"]
+        assert scoped["task_id"] != first["task_id"]
+        assert mock_mongodb.create_task.call_count == 2
+        assert mock_pipeline.call_count == 2
+
     def test_get_task_status_with_mongodb(self, client_with_mongodb, mock_mongodb):
         """Test getting task status with MongoDB."""
         # Mock a task in MongoDB
@@ -111,6 +146,23 @@ class TestAPIWithMongoDB:
         # Verify MongoDB was called
         mock_mongodb.get_task.assert_called_with(task_id)
 
+    def test_get_task_status_unchanged_returns_304(self, client_with_mongodb, mock_mongodb):
+        """Test a status poll echoing the ETag gets an empty 304 until the status changes."""
+        mock_mongodb.get_task.return_value = {"task_id": "etag-task", "status": "running"}
+
+        first = client_with_mongodb.get("/tasks/etag-task/status")
+        etag = first.headers["ETag"]
+        unchanged = client_with_mongodb.get("/tasks/etag-task/status", headers={"If-None-Match": etag})
+        mock_mongodb.get_task.return_value = {"task_id": "etag-task", "status": "completed"}
+        changed = client_with_mongodb.get("/tasks/etag-task/status", headers={"If-None-Match": etag})
+
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert unchanged.headers["ETag"] == etag
+        assert changed.status_code == 200
+        assert changed.json()["status"] == "completed"
+        assert changed.headers["ETag"] != etag
+
     def test_get_task_status_not_found(self, client_with_mongodb, mock_mongodb):
         """Test getting status for nonexistent task."""
         mock_mongodb.get_task.return_value = None
@@ -154,6 +206,27 @@ class TestAPIWithMongoDB:
 
         assert response.status_code == 404
 
+    def test_get_report_raw_streams_markdown(self, client_with_mongodb, mock_mongodb):
+        """Test raw report endpoint streams gzip-compressible markdown."""
+        content = "# Test Report\n\n" + "Content here. " * 200
+        mock_mongodb.get_report.return_value = {"task_id": "test-task-123", "content": content}
+
+        response = client_with_mongodb.get("/reports/test-task-123/raw", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/markdown")
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == content
+
+    def test_get_report_raw_not_completed(self, client_with_mongodb, mock_mongodb):
+        """Test raw report endpoint returns 404 until the task completes."""
+        mock_mongodb.get_task.return_value = {"task_id": "test-task-123", "status": "running"}
+
+        response = client_with_mongodb.get("/reports/test-task-123/raw")
+
+        assert response.status_code == 404
+        mock_mongodb.get_report.assert_not_called()
+
 
 class TestAPIWithoutMongoDB:
     """Test suite for API without MongoDB (in-memory mode)."""
@@ -193,6 +266,28 @@ class TestAPIWithoutMongoDB:
 
         assert status_response.status_code == 200
 
+    def test_get_traces_without_mongodb(self, client_without_mongodb):
+        """Test trace artifacts are returned for a known task and 404 otherwise."""
+        with patch("apps.api.main.tasks", {"trace-task": {"status": "completed"}}):
+            response = client_without_mongodb.get("/traces/trace-task")
+            missing = client_without_mongodb.get("/traces/unknown-task")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert set(response.json()) == {"manifest_json", "events_ndjson", "otel_export_json"}
+        assert missing.status_code == 404
+
+    def test_expired_task_without_mongodb_not_found(self, client_without_mongodb):
+        """Test the in-memory store forgets tasks after their TTL and reports them as missing."""
+        now = [0.0]
+        store = TTLCache(maxsize=10, ttl=60, timer=lambda: now[0])
+        store["old-task"] = {"status": "completed", "report": "# Report"}
+
+        with patch("apps.api.main.db", None), patch("apps.api.main.tasks", store):
+            assert client_without_mongodb.get("/tasks/old-task/status").status_code == 200
+            now[0] = 61.0
+            assert client_without_mongodb.get("/tasks/old-task/status").status_code == 404
+
 
 class TestDeepResearch:
     """Test suite for deep research endpoints."""
@@ -217,6 +312,33 @@ class TestDeepResearch:
 
         # Note: MongoDB call happens in background task
 
+    def test_create_deep_research_burst_beyond_cap_rejected(self, client_with_mongodb, mock_mongodb):
+        """Test requests beyond the in-process concurrency cap get 429 instead of queueing."""
+        with patch("apps.api.main._deep_research_slots", asyncio.Semaphore(1)), patch(
+            "apps.api.main.run_deep_research_pipeline", AsyncMock()
+        ) as mock_pipeline:
+            first = client_with_mongodb.post("/deep-research", json={"query": "Deep research query"})
+            second = client_with_mongodb.post("/deep-research", json={"query": "Deep research query"})
+
+        assert first.status_code == 202
+        assert second.status_code == 429
+        mock_mongodb.create_task.assert_called_once()
+        assert mock_pipeline.call_args.kwargs["holds_slot"] is True
+
+    async def test_deep_research_pipeline_releases_slot(self, mock_mongodb):
+        """Test the pipeline frees the slot claimed at ingress even when the run fails."""
+        from apps.api import main
+
+        slots = asyncio.Semaphore(1)
+        await slots.acquire()
+
+        with patch("apps.api.main._deep_research_slots", slots), patch("apps.api.main.db", mock_mongodb), patch(
+            "apps.api.main.IterativeResearchOrchestrator", side_effect=RuntimeError("boom")
+        ), patch("apps.api.main.services", Mock()):
+            await main.run_deep_research_pipeline("slot-task", main.DeepResearchRequest(query="q"), holds_slot=True)
+
+        assert not slots.locked()
+
     def test_get_deep_research_report(self, client_with_mongodb, mock_mongodb):
         """Test getting deep research report."""
         # Mock the report with deep research structure
@@ -232,6 +354,126 @@ class TestDeepResearch:
         # Should return appropriate structure (may be 200 or 404 depending on task status)
         assert response.status_code in [200, 404]
 
+    def test_completed_deep_research_report_is_memoized(self, client_with_mongodb, mock_mongodb):
+        """Test completed deep research reports are served from cache on later polls."""
+        mock_mongodb.get_task.return_value = {"task_id": "memo-deep-task", "status": "completed", "summary": {"iterations": 2}}
+        mock_mongodb.get_report.return_value = {"task_id": "memo-deep-task", "content": "# Deep Research Report"}
+
+        first = client_with_mongodb.get("/deep-research/memo-deep-task")
+        second = client_with_mongodb.get("/deep-research/memo-deep-task")
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert first.json()["report_md"] == "# Deep Research Report"
+        mock_mongodb.get_task.assert_called_once_with("memo-deep-task")
+
+    def test_deep_research_report_matching_etag_returns_304(self, client_with_mongodb, mock_mongodb):
+        """Test deep research polls revalidate against the cached body's ETag, with or without a weak prefix."""
+        mock_mongodb.get_task.return_value = {"task_id": "etag-deep-task", "status": "completed", "summary": {}}
+        mock_mongodb.get_report.return_value = {"task_id": "etag-deep-task", "content": "# Deep Research Report"}
+
+        first = client_with_mongodb.get("/deep-research/etag-deep-task")
+        etag = first.headers["ETag"]
+        strong = client_with_mongodb.get("/deep-research/etag-deep-task", headers={"If-None-Match": etag.removeprefix("W/")})
+        stale = client_with_mongodb.get("/deep-research/etag-deep-task", headers={"If-None-Match": 'W/"0000000000000000"'})
+
+        assert first.status_code == 200
+        assert strong.status_code == 304
+        assert strong.content == b""
+        assert stale.status_code == 200
+        assert stale.json() == first.json()
+
+    def test_deep_research_events_stream_final_report(self, client_with_mongodb, mock_mongodb):
+        """Test the event stream of a finished task sends its status and the report, then ends."""
+        mock_mongodb.get_task.return_value = {"task_id": "sse-task", "status": "completed", "summary": {}}
+        mock_mongodb.get_report.return_value = {"task_id": "sse-task", "content": "# Deep Research Report"}
+
+        response = client_with_mongodb.get("/deep-research/sse-task/events")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = response.text.strip().split("\n\n")
+        assert frames[0] == 'event: status\ndata: {"status": "completed"}'
+        event, data = frames[1].split("\n")
+        assert event == "event: completed"
+        assert json.loads(data.removeprefix("data: "))["report_md"] == "# Deep Research Report"
+
+    def test_deep_research_events_rereads_store_when_idle(self, client_with_mongodb, mock_mongodb):
+        """Test an idle stream re-reads the task store, so runs finishing in another process still end it."""
+        mock_mongodb.get_task.side_effect = [{"status": "running"}, {"status": "failed", "error": "boom"}, {"status": "failed", "error": "boom"}]
+
+        with patch("apps.api.main.SSE_KEEPALIVE_SECONDS", 0.01):
+            response = client_with_mongodb.get("/deep-research/idle-task/events")
+
+        events = [line for line in response.text.splitlines() if line.startswith("event:")]
+        assert events == ["event: status", "event: status", "event: failed"]
+        assert "Deep research failed: boom" in response.text
+
+    def test_deep_research_events_not_found(self, client_with_mongodb, mock_mongodb):
+        """Test the event stream of an unknown task is a 404 and leaves no subscriber behind."""
+        from adapters.websocket.progress_manager import get_progress_manager
+
+        mock_mongodb.get_task.return_value = None
+
+        response = client_with_mongodb.get("/deep-research/missing-task/events")
+
+        assert response.status_code == 404
+        assert not get_progress_manager().has_listeners("missing-task")
+
+    async def test_deep_research_events_not_buffered_by_gzip(self, mock_mongodb):
+        """Test each frame reaches the client as it is written, uncompressed, when the client accepts gzip."""
+        from adapters.websocket.progress_manager import ProgressUpdate, get_progress_manager
+        from apps.api import main
+
+        mock_mongodb.get_task.return_value = {"task_id": "gzip-task", "status": "running"}
+        sent = []
+        frame_sent = asyncio.Event()
+
+        async def send(message):
+            sent.append(message)
+            frame_sent.set()
+
+        async def receive():
+            await asyncio.Event().wait()  # the client never disconnects
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/deep-research/gzip-task/events",
+            "raw_path": b"/deep-research/gzip-task/events",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver"), (b"accept-encoding", b"gzip, deflate")],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+
+        async def next_body() -> bytes:
+            while True:
+                await asyncio.wait_for(frame_sent.wait(), timeout=2)
+                frame_sent.clear()
+                if sent[-1]["type"] == "http.response.body":
+                    return sent[-1]["body"]
+
+        with patch("apps.api.main.db", mock_mongodb):
+            stream = asyncio.create_task(main.app(scope, receive, send))
+            try:
+                first = await next_body()
+                await get_progress_manager().broadcast(ProgressUpdate.create("gzip-task", "iteration", "Starting iteration 1/2"))
+                second = await next_body()
+            finally:
+                mock_mongodb.get_task.return_value = {"task_id": "gzip-task", "status": "failed", "error": "boom"}
+                await get_progress_manager().broadcast(ProgressUpdate.create("gzip-task", "status", "Task failed", {"status": "failed"}))
+                await asyncio.wait_for(stream, timeout=2)
+
+        assert first == b'event: status\ndata: {"status": "running"}\n\n'
+        assert second.startswith(b"event: progress\n")
+        assert b"Starting iteration 1/2" in second
+        assert dict(sent[0]["headers"])[b"content-encoding"] == b"identity"
+
 
 class TestErrorHandling:
     """Test suite for error handling."""
@@ -316,6 +558,21 @@ class TestDataPersistence:
         # Verify report was retrieved from MongoDB
         mock_mongodb.get_report.assert_called_with(task_id)
 
+    def test_in_progress_report_cached_briefly(self, client_with_mongodb, mock_mongodb):
+        """Test in-progress report polls are served from cache until the short TTL expires."""
+        mock_mongodb.get_task.return_value = {"task_id": "poll-task", "status": "running"}
+
+        with patch("apps.api.main._now", side_effect=[100.0, 100.5, 101.5]):
+            first = client_with_mongodb.get("/reports/poll-task")
+            second = client_with_mongodb.get("/reports/poll-task")
+            mock_mongodb.get_task.return_value = {"task_id": "poll-task", "status": "failed", "error": "boom"}
+            third = client_with_mongodb.get("/reports/poll-task")
+
+        assert first.json() == second.json()
+        assert first.json()["status"] == "running"
+        assert third.json()["status"] == "failed"
+        assert mock_mongodb.get_task.call_count == 2
+
     def test_logs_are_created(self, client_with_mongodb, mock_mongodb):
         """Test that logs are created during research."""
         # This test verifies the integration creates logs
@@ -328,3 +585,45 @@ class TestDataPersistence:
         assert create_response.status_code in [200, 202]
         # Logs are created during background task execution
         # Actual logging is tested in unit tests
+
+    async def test_pipeline_stores_report_before_marking_completed(self, mock_mongodb):
+        """Test the completed status is written only after the report and log entry."""
+        from apps.api import main
+        from domain.models.plan import ResearchPlan
+
+        calls = []
+        mock_mongodb.create_report.side_effect = lambda *args: calls.append("create_report")
+        mock_mongodb.create_log.side_effect = lambda *args: calls.append("create_log")
+        mock_mongodb.update_task.side_effect = lambda task_id, data: calls.append(data["status"])
+
+        services = main.PipelineServices(planner=AsyncMock(), researcher=AsyncMock(), evaluator=AsyncMock(), writer=AsyncMock())
+        services.planner.create_plan = lambda query: ResearchPlan(main_query=query, sub_tasks=[])
+        services.researcher.stream_evidence = lambda plan, collection_name=None: _empty_stream()
+        services.researcher.delete_collection = Mock()
+        services.writer.write_report = lambda query, evidence, collection_name=None: "# Report"
+
+        with patch("apps.api.main.db", mock_mongodb), patch("apps.api.main.services", services):
+            await main.run_real_research_pipeline("task-order", "Order query")
+
+        assert calls[0] == "running"
+        assert set(calls[1:3]) == {"create_report", "create_log"}
+        assert calls[3] == "completed"
+        services.researcher.delete_collection.assert_called_once_with("research_task-order")
+
+    async def test_pipeline_releases_dedupe_key(self, mock_mongodb):
+        """Test a finished run, even a failed one, stops absorbing identical requests."""
+        from apps.api import main
+
+        services = main.PipelineServices(planner=Mock(), researcher=Mock(), evaluator=Mock(), writer=Mock())
+        services.planner.create_plan.side_effect = RuntimeError("planner down")
+        in_flight = {("Failing query", None): "task-dedupe"}
+
+        with patch("apps.api.main.db", mock_mongodb), patch("apps.api.main.services", services), patch("apps.api.main._in_flight_research", in_flight):
+            await main.run_real_research_pipeline("task-dedupe", "Failing query", dedupe_key=("Failing query", None))
+
+        assert in_flight == {}
+
+
+async def _empty_stream():
+    return
+    yield
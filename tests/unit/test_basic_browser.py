@@ -0,0 +1,81 @@
+"""
+Unit tests for BasicBrowserAdapter.
+"""
+import io
+from unittest.mock import patch
+
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from adapters.web_surfer.basic_browser import _WS_RE, BasicBrowserAdapter
+
+
+@pytest.mark.unit
+class TestBasicBrowserTextExtraction:
+    """Test cases for page text extraction."""
+
+    def test_whitespace_regex_collapses_real_whitespace_only(self):
+        """Test newlines, tabs and space runs collapse while a literal backslash-n is kept."""
+        # Act
+        result = _WS_RE.sub(" ", "Hello\n\n\tworld  \r\n again \\n literal")
+
+        # Assert
+        assert result == "Hello world again \\n literal"
+
+    def test_extract_text_collapses_whitespace(self):
+        """Test extracted page text is stripped and has whitespace collapsed."""
+        # Arrange
+        pytest.importorskip("bs4")
+        browser = BasicBrowserAdapter()
+        html = b"<html><body>\n  <p>First\tline</p>\n\n<script>ignored()</script><p>Second\\nline</p>\n</body></html>"
+
+        # Act
+        with patch.object(browser, "_fetch_content", return_value=html):
+            result = browser.extract_text("https://example.com")
+
+        # Assert
+        assert result == "First line Second\\nline"
+
+
+def _streamed_response(body: bytes, status_code: int = 200) -> requests.Response:
+    """Build an unread streamed response over body, as session.get(..., stream=True) returns it."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://example.com"
+    response.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    return response
+
+
+@pytest.mark.unit
+class TestBasicBrowserFetch:
+    """Test cases for streamed page fetching."""
+
+    def test_fetch_content_stops_at_size_cap(self):
+        """Test a body over the cap is streamed, truncated to max_content_bytes and closed."""
+        # Arrange
+        browser = BasicBrowserAdapter()
+        response = _streamed_response(b"x" * (browser.max_content_bytes + 500_000))
+
+        # Act
+        with patch.object(browser.session, "get", return_value=response) as mock_get:
+            content = browser._fetch_content("https://example.com")
+
+        # Assert
+        assert len(content) == browser.max_content_bytes
+        mock_get.assert_called_once_with("https://example.com", timeout=browser.timeout, stream=True)
+        assert response.raw.closed
+
+    def test_fetch_content_closes_response_on_http_error(self):
+        """Test an error status raises without reading the body and still closes the response."""
+        # Arrange
+        browser = BasicBrowserAdapter()
+        response = _streamed_response(b"server error", status_code=500)
+
+        # Act
+        with patch.object(browser.session, "get", return_value=response):
+            with pytest.raises(requests.HTTPError):
+                browser._fetch_content("https://example.com")
+
+        # Assert
+        assert response.raw.closed
@@ -111,6 +111,18 @@ def test_evidence():
     assert evidence.tags == []
 
 
+def test_evidence_is_slotted_with_independent_defaults():
+    """Test Evidence instances carry no per-instance dict and never share default tags."""
+    source = EvidenceSource(url="http://example.com", title="Example")
+    first = Evidence(id="1", source=source, excerpt="a")
+    second = Evidence(id="2", source=source, excerpt="b")
+
+    first.tags.append("web")
+
+    assert second.tags == []
+    assert not hasattr(first, "__dict__")
+
+
 def test_research_sub_task():
     """Test the ResearchSubTask model."""
     sub_task = ResearchSubTask(
@@ -2,6 +2,7 @@
 Tests for IterativeResearchOrchestrator - the main orchestrator for deep research.
 """
 from datetime import datetime
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -52,6 +53,16 @@ class TestResearchIteration:
         assert iteration.timestamp == timestamp
         assert iteration.completion_score == completion_score
 
+    def test_is_slotted(self):
+        """Test iterations carry no per-instance dict but still accept the gaps filled in after evaluation."""
+        iteration = ResearchIteration(iteration_number=1, queries_executed=[], evidence_collected=[])
+
+        iteration.gaps_identified = []
+
+        assert not hasattr(iteration, "__dict__")
+        with pytest.raises(AttributeError):
+            iteration.unexpected = True
+
 
 class TestDeepResearchResult:
     """Test suite for DeepResearchResult dataclass."""
@@ -103,6 +114,19 @@ class TestIterativeResearchOrchestrator:
         assert orchestrator.min_completion_score == 0.9
         assert orchestrator.budget == 200
 
+    @patch("domain.services.iterative_research_svc.PlannerService")
+    def test_init_with_shared_services(self, mock_planner_cls):
+        """Test injected agent services are reused instead of constructing new ones."""
+        planner, researcher, evaluator, writer = Mock(), Mock(), Mock(), Mock()
+
+        orchestrator = IterativeResearchOrchestrator(planner=planner, researcher=researcher, evaluator=evaluator, writer=writer)
+
+        assert orchestrator.planner is planner
+        assert orchestrator.researcher is researcher
+        assert orchestrator.evaluator is evaluator
+        assert orchestrator.writer is writer
+        mock_planner_cls.assert_not_called()
+
     @pytest.mark.asyncio
     @patch("domain.services.iterative_research_svc.get_event_logger")
     async def test_execute_deep_research_single_iteration_success(self, mock_get_logger):
@@ -142,6 +166,7 @@ class TestIterativeResearchOrchestrator:
         )
 
         orchestrator.evaluator.evaluate_research_completeness = Mock(return_value=mock_completion_score)
+        orchestrator.evaluator.identify_information_gaps = Mock(return_value=[])
         orchestrator.writer.write_report = Mock(return_value="Final report content")
 
         # Execute
@@ -240,7 +265,7 @@ class TestIterativeResearchOrchestrator:
         orchestrator.writer.write_report = Mock(return_value="Multi-iteration report")
 
         # Execute
-        result = await orchestrator.execute_deep_research("test query")
+        result = await orchestrator.execute_deep_research("test query", collection_name="research_run1")
 
         # Assertions
         assert result.original_query == "test query"
@@ -256,6 +281,11 @@ class TestIterativeResearchOrchestrator:
         assert result.iterations[1].iteration_number == 2
         assert result.iterations[1].completion_score == high_score
 
+        # Every iteration and the writer share the run's collection
+        assert orchestrator.researcher.execute_plan_parallel.call_args.kwargs["collection_name"] == "research_run1"
+        assert orchestrator._execute_refinement_queries_parallel.call_args.kwargs["collection_name"] == "research_run1"
+        assert orchestrator.writer.write_report.call_args.args[2] == "research_run1"
+
     @pytest.mark.asyncio
     @patch("domain.services.iterative_research_svc.get_event_logger")
     async def test_execute_deep_research_max_iterations_reached(self, mock_get_logger):
@@ -307,6 +337,109 @@ class TestIterativeResearchOrchestrator:
         assert result.research_quality_score == 0.7
         assert result.completion_level == CompletionLevel.PARTIAL
 
+    @pytest.mark.asyncio
+    @patch("domain.services.iterative_research_svc.get_event_logger")
+    async def test_execute_deep_research_stops_when_score_plateaus(self, mock_get_logger):
+        """Test iterations stop early once a flat score can no longer reach the threshold."""
+        # Arrange
+        orchestrator = IterativeResearchOrchestrator(max_iterations=5, min_completion_score=0.9)
+        orchestrator.planner.create_plan = Mock(
+            return_value=ResearchPlan(main_query="test query", sub_tasks=[ResearchSubTask(id="task1", query="subquery1", sources=["web"])])
+        )
+        orchestrator.researcher.execute_plan_parallel = AsyncMock(return_value=[])
+        orchestrator._execute_refinement_queries_parallel = AsyncMock(return_value=[])
+        flat_score = CompletionScore(
+            overall_score=0.5,
+            completion_level=CompletionLevel.PARTIAL,
+            coverage_areas={},
+            identified_gaps=[],
+            confidence=0.8,
+            reasoning="No new coverage",
+        )
+        orchestrator.evaluator.evaluate_research_completeness = Mock(return_value=flat_score)
+        orchestrator.evaluator.identify_information_gaps = Mock(return_value=[])
+        orchestrator.evaluator.generate_refinement_queries = Mock(return_value=[])
+        orchestrator.writer.write_report = Mock(return_value="Plateau report")
+
+        # Act
+        result = await orchestrator.execute_deep_research("test query")
+
+        # Assert: 0.5 + 3 remaining iterations * 0.05 < 0.9, so the second flat score ends the research
+        assert len(result.iterations) == 2
+        assert orchestrator.evaluator.evaluate_research_completeness.call_count == 2
+        assert orchestrator.evaluator.generate_refinement_queries.call_count == 1
+        assert result.final_report == "Plateau report"
+
+    @pytest.mark.asyncio
+    @patch("domain.services.iterative_research_svc.get_event_logger")
+    async def test_execute_deep_research_continues_while_threshold_reachable(self, mock_get_logger):
+        """Test a flat score keeps iterating while the remaining iterations could still reach the threshold."""
+        # Arrange
+        orchestrator = IterativeResearchOrchestrator(max_iterations=4, min_completion_score=0.8)
+        orchestrator.planner.create_plan = Mock(
+            return_value=ResearchPlan(main_query="test query", sub_tasks=[ResearchSubTask(id="task1", query="subquery1", sources=["web"])])
+        )
+        orchestrator.researcher.execute_plan_parallel = AsyncMock(return_value=[])
+        orchestrator._execute_refinement_queries_parallel = AsyncMock(return_value=[])
+        near_score = CompletionScore(
+            overall_score=0.75,
+            completion_level=CompletionLevel.ADEQUATE,
+            coverage_areas={},
+            identified_gaps=[],
+            confidence=0.8,
+            reasoning="Close to complete",
+        )
+        orchestrator.evaluator.evaluate_research_completeness = Mock(return_value=near_score)
+        orchestrator.evaluator.identify_information_gaps = Mock(return_value=[])
+        orchestrator.evaluator.generate_refinement_queries = Mock(return_value=[])
+        orchestrator.writer.write_report = Mock(return_value="Report")
+
+        # Act
+        result = await orchestrator.execute_deep_research("test query")
+
+        # Assert: 0.75 + remaining * 0.05 reaches 0.8 until the final iteration
+        assert len(result.iterations) == 4
+
+    @pytest.mark.asyncio
+    @patch("domain.services.iterative_research_svc.get_event_logger")
+    async def test_gap_analysis_runs_alongside_evaluation(self, mock_get_logger):
+        """Test gap identification starts before the completeness evaluation returns."""
+        orchestrator = IterativeResearchOrchestrator(max_iterations=2, min_completion_score=0.9)
+        orchestrator.planner.create_plan = Mock(
+            return_value=ResearchPlan(main_query="test query", sub_tasks=[ResearchSubTask(id="task1", query="subquery1", sources=["web"])])
+        )
+        orchestrator.researcher.execute_plan_parallel = AsyncMock(return_value=[])
+
+        low_score = CompletionScore(
+            overall_score=0.5,
+            completion_level=CompletionLevel.PARTIAL,
+            coverage_areas={},
+            identified_gaps=[],
+            confidence=0.8,
+            reasoning="Needs more",
+        )
+        gaps_started = threading.Event()
+
+        def evaluate(query, evidence):
+            # Only returns once gap identification is already running in parallel
+            assert gaps_started.wait(timeout=5)
+            return low_score
+
+        def identify_gaps(query, evidence):
+            gaps_started.set()
+            return []
+
+        orchestrator.evaluator.evaluate_research_completeness = Mock(side_effect=evaluate)
+        orchestrator.evaluator.identify_information_gaps = Mock(side_effect=identify_gaps)
+        orchestrator.evaluator.generate_refinement_queries = Mock(return_value=[])
+        orchestrator.writer.write_report = Mock(return_value="Report")
+
+        result = await orchestrator.execute_deep_research("test query")
+
+        assert len(result.iterations) == 2
+        # Gap analysis is skipped on the last iteration, where no refinement could follow
+        orchestrator.evaluator.identify_information_gaps.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_execute_refinement_queries_parallel_empty_list(self):
         """Test _execute_refinement_queries_parallel with empty query list."""
@@ -0,0 +1,47 @@
+"""
+Unit tests for the progress manager.
+"""
+import asyncio
+
+import pytest
+
+from adapters.websocket.progress_manager import ProgressUpdate, get_progress_manager
+
+
+@pytest.mark.unit
+class TestProgressSubscribers:
+    """Test cases for the SSE subscriber queues."""
+
+    async def test_broadcast_reaches_subscriber_queue(self):
+        """Test a broadcast update is queued for every subscriber of its task only."""
+        # Arrange
+        manager = get_progress_manager()
+        queue = await manager.subscribe("task-a")
+        other = await manager.subscribe("task-b")
+        update = ProgressUpdate.create("task-a", "status", "Task running", {"status": "running"})
+
+        try:
+            # Act
+            await manager.broadcast(update)
+
+            # Assert
+            assert await asyncio.wait_for(queue.get(), timeout=1) is update
+            assert other.empty()
+        finally:
+            await manager.unsubscribe(queue, "task-a")
+            await manager.unsubscribe(other, "task-b")
+
+    async def test_unsubscribe_removes_listener(self):
+        """Test an unsubscribed queue no longer counts as a listener."""
+        # Arrange
+        manager = get_progress_manager()
+        queue = await manager.subscribe("task-c")
+        assert manager.has_listeners("task-c")
+        assert manager.get_connection_count("task-c") == 1
+
+        # Act
+        await manager.unsubscribe(queue, "task-c")
+
+        # Assert
+        assert not manager.has_listeners("task-c")
+        assert manager.get_connection_count("task-c") == 0
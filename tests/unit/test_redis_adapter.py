@@ -0,0 +1,119 @@
+"""Unit tests for Redis adapter."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from fakeredis.aioredis import FakeConnection  # noqa: E402
+from redis.asyncio import BlockingConnectionPool  # noqa: E402
+
+from adapters.redis.redis_database import RedisDatabase  # noqa: E402
+
+
+def _fake_pool_from_url(url, **kwargs):
+    """Build the adapter's blocking pool on fakeredis connections."""
+    return BlockingConnectionPool(connection_class=FakeConnection, server=fakeredis.FakeServer(), **kwargs)
+
+
+@pytest.fixture
+async def redis_adapter():
+    """Create Redis adapter instance backed by fakeredis."""
+    with patch("adapters.redis.redis_database.BlockingConnectionPool.from_url", side_effect=_fake_pool_from_url):
+        adapter = RedisDatabase(connection_url="redis://localhost:6379", ttl_seconds=60, max_connections=2)
+        await adapter.initialize()
+        yield adapter
+        await adapter.close()
+
+
+@pytest.mark.asyncio
+class TestRedisDatabase:
+    """Test suite for Redis database adapter."""
+
+    async def test_create_and_get_task(self, redis_adapter):
+        """Test task round trip with nested values and TTL."""
+        await redis_adapter.create_task("task-1", {"status": "accepted", "started_at": 1234567890.0})
+        await redis_adapter.update_task("task-1", {"status": "completed", "summary": {"iterations": 2}})
+
+        task = await redis_adapter.get_task("task-1")
+
+        assert task["task_id"] == "task-1"
+        assert task["status"] == "completed"
+        assert task["started_at"] == 1234567890.0
+        assert task["summary"] == {"iterations": 2}
+        assert 0 < await redis_adapter.client.ttl("task:task-1") <= 60
+
+    async def test_get_missing_task(self, redis_adapter):
+        """Test missing tasks return None and are not updated."""
+        assert await redis_adapter.get_task("missing") is None
+        assert await redis_adapter.update_task("missing", {"status": "running"}) is False
+
+    async def test_list_and_delete_tasks(self, redis_adapter):
+        """Test listing newest first with status filter, and deletion."""
+        with patch("adapters.redis.redis_database.time") as mock_time:
+            mock_time.time.side_effect = [1000.0, 1001.0, 1002.0]
+            await redis_adapter.create_task("a", {"status": "completed"})
+            await redis_adapter.create_task("b", {"status": "running"})
+            await redis_adapter.create_task("c", {"status": "completed"})
+
+        assert [t["task_id"] for t in await redis_adapter.list_tasks()] == ["c", "b", "a"]
+        assert [t["task_id"] for t in await redis_adapter.list_tasks(status="completed", limit=1, skip=1)] == ["a"]
+
+        assert await redis_adapter.delete_task("b") is True
+        assert await redis_adapter.delete_task("b") is False
+        assert [t["task_id"] for t in await redis_adapter.list_tasks()] == ["c", "a"]
+
+    async def test_create_and_get_report(self, redis_adapter):
+        """Test report upsert and retrieval."""
+        await redis_adapter.create_report("task-1", {"content": "# Report", "query": "q"})
+        await redis_adapter.create_report("task-1", {"content": "# Report v2"})
+
+        report = await redis_adapter.get_report("task-1")
+
+        assert report["content"] == "# Report v2"
+        assert report["query"] == "q"
+        assert len(await redis_adapter.list_reports()) == 1
+
+    async def test_logs_filtering(self, redis_adapter):
+        """Test logs are returned newest first and filtered."""
+        await redis_adapter.create_log({"task_id": "t1", "level": "INFO", "message": "one"})
+        await redis_adapter.create_log({"task_id": "t2", "level": "ERROR", "message": "two"})
+        await redis_adapter.create_log({"task_id": "t1", "level": "ERROR", "message": "three"})
+
+        assert [log["message"] for log in await redis_adapter.get_logs(task_id="t1")] == ["three", "one"]
+        assert [log["message"] for log in await redis_adapter.get_logs(level="ERROR", limit=1)] == ["three"]
+        assert await redis_adapter.get_logs(start_time=datetime.utcnow() + timedelta(minutes=1)) == []
+
+    async def test_health_check(self, redis_adapter):
+        """Test health check pings Redis."""
+        assert await redis_adapter.health_check() is True
+
+    async def test_exhausted_pool_waits_for_connection(self, redis_adapter):
+        """Test commands wait for a pooled connection instead of failing when the pool is full."""
+        await redis_adapter.create_task("task-1", {"status": "running"})
+        pool = redis_adapter.client.connection_pool
+        held = [await pool.get_connection("GET") for _ in range(redis_adapter.max_connections)]
+
+        async def release_later():
+            await asyncio.sleep(0.05)
+            for connection in held:
+                await pool.release(connection)
+
+        release = asyncio.create_task(release_later())
+        task = await redis_adapter.get_task("task-1")
+        await release
+
+        assert task["status"] == "running"
+
+    async def test_close_disconnects_pool(self, redis_adapter):
+        """Test close() disconnects the pooled connections instead of leaving their sockets open."""
+        await redis_adapter.create_task("task-1", {"status": "running"})
+        pool = redis_adapter.client.connection_pool
+
+        with patch.object(pool, "disconnect", wraps=pool.disconnect) as mock_disconnect:
+            await redis_adapter.close()
+
+        mock_disconnect.assert_awaited_once()
@@ -1,15 +1,36 @@
 """
 Unit tests for ResearchService.
 """
+from dataclasses import replace
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from domain.models.evidence import Evidence, EvidenceSource
+from domain.models.plan import ResearchPlan, ResearchSubTask
 from domain.services.research_svc import ResearchService
 
 
+@pytest.fixture
+def parallel_research():
+    """ResearchService with mocked search and vector adapters; each search returns three evidence items."""
+    mock_evidence = Evidence(
+        id="test_evidence",
+        source=EvidenceSource(url="https://example.com", title="Test Result", fetched_at=datetime.utcnow()),
+        excerpt="Test content",
+    )
+    mock_search = Mock()
+    mock_search.asearch = AsyncMock(side_effect=lambda query: [replace(mock_evidence) for _ in range(3)])
+    mock_vector = Mock()
+    mock_vector.store_evidence_batch.side_effect = lambda batch, collection_name: len(batch)
+
+    with patch("domain.services.research_svc.TavilySearchAdapter", return_value=mock_search), patch(
+        "domain.services.research_svc.WeaviateVectorAdapter", return_value=mock_vector
+    ):
+        yield ResearchService(), mock_search, mock_vector, mock_evidence
+
+
 @pytest.mark.unit
 class TestResearchService:
     """Test cases for ResearchService."""
@@ -71,7 +92,7 @@ class TestResearchService:
 
         mock_vector_instance = Mock()
         mock_vector_instance.health_check.return_value = True
-        mock_vector_instance.store_evidence.return_value = True
+        mock_vector_instance.store_evidence_batch.return_value = 2
         mock_vector.return_value = mock_vector_instance
 
         service = ResearchService()
@@ -83,7 +104,120 @@ class TestResearchService:
         assert len(result) == 2  # Two tasks with web sources
         assert all(isinstance(evidence, Evidence) for evidence in result)
         mock_vector_instance.create_collection.assert_called_once()
-        mock_vector_instance.store_evidence.assert_called()
+        mock_vector_instance.store_evidence_batch.assert_called_once_with(result, mock_vector_instance.create_collection.call_args.args[0])
+
+    async def test_execute_plan_parallel_pipeline(self, parallel_research, sample_research_plan):
+        """Test parallel plan execution stores every evidence item and survives a failed sub-task."""
+        # Arrange
+        service, mock_search, mock_vector, mock_evidence = parallel_research
+        mock_search.asearch.side_effect = [[mock_evidence, replace(mock_evidence)], RuntimeError("search failed")]
+
+        # Act
+        result = await service.execute_plan_parallel(sample_research_plan)
+
+        # Assert
+        assert len(result) == 2
+        assert mock_search.asearch.await_count == 2
+        mock_vector.store_evidence_batch.assert_called_once()
+        assert len(mock_vector.store_evidence_batch.call_args.args[0]) == 2
+
+    async def test_execute_plan_parallel_stops_at_evidence_budget(self, parallel_research, sample_research_plan):
+        """Test parallel plan execution truncates evidence and stops once max_evidence is reached."""
+        # Arrange
+        service, _, mock_vector, _ = parallel_research
+
+        # Act
+        result = await service.execute_plan_parallel(sample_research_plan, max_evidence=2)
+
+        # Assert
+        assert len(result) == 2
+        assert sum(len(call.args[0]) for call in mock_vector.store_evidence_batch.call_args_list) == 2
+
+    @patch.dict("os.environ", {"VECTOR_BATCH_SIZE": "2", "VECTOR_BATCH_CONCURRENCY": "1"})
+    async def test_execute_plan_parallel_splits_vector_batches(self, parallel_research, sample_research_plan):
+        """Test each sub-task's evidence is stored in batches no larger than VECTOR_BATCH_SIZE."""
+        # Arrange
+        _, mock_search, mock_vector, _ = parallel_research
+        with patch("domain.services.research_svc.TavilySearchAdapter", return_value=mock_search), patch(
+            "domain.services.research_svc.WeaviateVectorAdapter", return_value=mock_vector
+        ):
+            service = ResearchService()
+
+        # Act
+        result = await service.execute_plan_parallel(sample_research_plan)
+
+        # Assert: two sub-tasks of three items each become batches of 2 and 1
+        assert len(result) == 6
+        assert sorted(len(call.args[0]) for call in mock_vector.store_evidence_batch.call_args_list) == [1, 1, 2, 2]
+
+    async def test_repeated_queries_reuse_cached_search(self, parallel_research):
+        """Test sub-tasks with the same normalized query search once and get their own evidence copies."""
+        # Arrange
+        service, mock_search, _, _ = parallel_research
+        plan = ResearchPlan(
+            main_query="Cache test",
+            sub_tasks=[
+                ResearchSubTask(id="t1", query="Fintech in Mexico", sources=["web"]),
+                ResearchSubTask(id="t2", query="  fintech IN mexico ", sources=["web"]),
+            ],
+        )
+
+        # Act
+        result = await service.execute_plan_parallel(plan)
+
+        # Assert
+        assert mock_search.asearch.await_count == 1
+        assert len(result) == 6
+        assert len({id(evidence) for evidence in result}) == 6
+        assert {evidence.tool_call_id for evidence in result} == {"tavily:t1", "tavily:t2"}
+
+    @patch.dict("os.environ", {"SEARCH_CACHE_TTL": "0"})
+    async def test_search_cache_can_be_disabled(self, parallel_research):
+        """Test SEARCH_CACHE_TTL=0 sends every query to the search adapter."""
+        # Arrange
+        _, mock_search, mock_vector, _ = parallel_research
+        with patch("domain.services.research_svc.TavilySearchAdapter", return_value=mock_search), patch(
+            "domain.services.research_svc.WeaviateVectorAdapter", return_value=mock_vector
+        ):
+            service = ResearchService()
+        plan = ResearchPlan(
+            main_query="Cache test",
+            sub_tasks=[ResearchSubTask(id=f"t{i}", query="Fintech in Mexico", sources=["web"]) for i in range(2)],
+        )
+
+        # Act
+        await service.execute_plan_parallel(plan)
+
+        # Assert
+        assert mock_search.asearch.await_count == 2
+
+    async def test_stream_evidence_consumer_stops_early(self, parallel_research, sample_research_plan):
+        """Test closing the evidence stream early cancels searches and still drains storage."""
+        # Arrange
+        service, _, mock_vector, _ = parallel_research
+
+        # Act
+        stream = service.stream_evidence(sample_research_plan)
+        first = await anext(stream)
+        await stream.aclose()
+
+        # Assert
+        assert first.excerpt == "Test content"
+        assert mock_vector.store_evidence_batch.call_count >= 1
+
+    async def test_stream_evidence_uses_given_collection(self, parallel_research, sample_research_plan):
+        """Test evidence goes to the caller's collection, which delete_collection then drops."""
+        # Arrange
+        service, _, mock_vector, _ = parallel_research
+
+        # Act
+        await service.execute_plan_parallel(sample_research_plan, collection_name="research_run1")
+        service.delete_collection("research_run1")
+
+        # Assert
+        mock_vector.create_collection.assert_called_once_with("research_run1")
+        assert all(call.args[1] == "research_run1" for call in mock_vector.store_evidence_batch.call_args_list)
+        mock_vector.delete_collection.assert_called_once_with("research_run1")
 
     @patch("domain.services.research_svc.TavilySearchAdapter")
     @patch("domain.services.research_svc.WeaviateVectorAdapter")
@@ -3,7 +3,7 @@ Unit tests for TavilySearchAdapter.
 """
 from datetime import datetime
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -16,7 +16,7 @@ class TestTavilySearchAdapter:
     """Test cases for TavilySearchAdapter."""
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_init_success(self, mock_tavily_client):
         """Test successful initialization with valid API key."""
         # Arrange
@@ -29,7 +29,7 @@ class TestTavilySearchAdapter:
         # Assert
         assert adapter.api_key == "test_api_key"
         assert adapter.client == mock_client_instance
-        mock_tavily_client.assert_called_once_with(api_key="test_api_key")
+        assert mock_tavily_client.call_args.kwargs["base_url"] == "https://api.tavily.com"
 
     @patch.dict(os.environ, {}, clear=True)
     def test_init_no_api_key(self):
@@ -48,12 +48,12 @@ class TestTavilySearchAdapter:
         assert "TAVILY_API_KEY environment variable not set" in str(excinfo.value)
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_search_success(self, mock_tavily_client):
         """Test successful web search."""
         # Arrange
         mock_client_instance = Mock()
-        mock_client_instance.search.return_value = {
+        mock_client_instance.post.return_value.json.return_value = {
             "results": [
                 {"title": "Test Result 1", "url": "https://example.com/1", "content": "Test content 1", "score": 0.95},
                 {"title": "Test Result 2", "url": "https://example.com/2", "content": "Test content 2", "score": 0.85},
@@ -77,15 +77,17 @@ class TestTavilySearchAdapter:
         assert results[0].score == 0.95
 
         # Verify API call
-        mock_client_instance.search.assert_called_once_with(query="test query", search_depth="advanced", max_results=5)
+        mock_client_instance.post.assert_called_once_with(
+            "/search", json={"api_key": "test_api_key", "query": "test query", "search_depth": "advanced", "max_results": 5}
+        )
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_search_with_custom_depth(self, mock_tavily_client):
         """Test search with custom search depth."""
         # Arrange
         mock_client_instance = Mock()
-        mock_client_instance.search.return_value = {"results": []}
+        mock_client_instance.post.return_value.json.return_value = {"results": []}
         mock_tavily_client.return_value = mock_client_instance
 
         adapter = TavilySearchAdapter()
@@ -94,15 +96,17 @@ class TestTavilySearchAdapter:
         adapter.search("test query", search_depth="basic")
 
         # Assert
-        mock_client_instance.search.assert_called_once_with(query="test query", search_depth="basic", max_results=10)
+        mock_client_instance.post.assert_called_once_with(
+            "/search", json={"api_key": "test_api_key", "query": "test query", "search_depth": "basic", "max_results": 10}
+        )
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_search_error_handling(self, mock_tavily_client):
         """Test search error handling."""
         # Arrange
         mock_client_instance = Mock()
-        mock_client_instance.search.side_effect = Exception("API Error")
+        mock_client_instance.post.side_effect = Exception("API Error")
         mock_tavily_client.return_value = mock_client_instance
 
         adapter = TavilySearchAdapter()
@@ -114,12 +118,76 @@ class TestTavilySearchAdapter:
         assert results == []
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
+    def test_searches_share_pooled_client(self, mock_tavily_client):
+        """Test repeated searches reuse one keep-alive client that close() shuts down."""
+        # Arrange
+        mock_client_instance = Mock()
+        mock_client_instance.post.return_value.json.return_value = {"results": []}
+        mock_tavily_client.return_value = mock_client_instance
+
+        adapter = TavilySearchAdapter()
+
+        # Act
+        adapter.search("first query")
+        adapter.search_news("second query")
+        adapter.close()
+
+        # Assert
+        mock_tavily_client.assert_called_once()
+        assert mock_client_instance.post.call_count == 2
+        mock_client_instance.close.assert_called_once()
+
+    @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
+    @patch("adapters.tavily_search.tavily_client.httpx.AsyncClient")
+    async def test_asearch_success(self, mock_async_client):
+        """Test async search posts over the pooled async client and converts results."""
+        # Arrange
+        mock_client_instance = Mock()
+        mock_client_instance.post = AsyncMock(return_value=Mock())
+        mock_client_instance.post.return_value.json.return_value = {
+            "results": [{"title": "Test Result 1", "url": "https://example.com/1", "content": "Test content 1", "score": 0.95}]
+        }
+        mock_client_instance.aclose = AsyncMock()
+        mock_async_client.return_value = mock_client_instance
+
+        adapter = TavilySearchAdapter()
+
+        # Act
+        results = await adapter.asearch("test query", max_results=5)
+        await adapter.aclose()
+
+        # Assert
+        assert [evidence.source.url for evidence in results] == ["https://example.com/1"]
+        mock_client_instance.post.assert_awaited_once_with(
+            "/search", json={"api_key": "test_api_key", "query": "test query", "search_depth": "advanced", "max_results": 5}
+        )
+        mock_client_instance.aclose.assert_awaited_once()
+
+    @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
+    @patch("adapters.tavily_search.tavily_client.httpx.AsyncClient")
+    async def test_asearch_error_handling(self, mock_async_client):
+        """Test async search returns no evidence when the request fails."""
+        # Arrange
+        mock_client_instance = Mock()
+        mock_client_instance.post = AsyncMock(side_effect=Exception("API Error"))
+        mock_async_client.return_value = mock_client_instance
+
+        adapter = TavilySearchAdapter()
+
+        # Act
+        results = await adapter.asearch("test query")
+
+        # Assert
+        assert results == []
+
+    @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_search_news_success(self, mock_tavily_client):
         """Test successful news search."""
         # Arrange
         mock_client_instance = Mock()
-        mock_client_instance.search.return_value = {
+        mock_client_instance.post.return_value.json.return_value = {
             "results": [{"title": "News Article 1", "url": "https://news.com/1", "content": "News content 1", "score": 0.9}]
         }
         mock_tavily_client.return_value = mock_client_instance
@@ -134,15 +202,18 @@ class TestTavilySearchAdapter:
         assert results[0].source.title == "News Article 1"
 
         # Verify API call
-        mock_client_instance.search.assert_called_once_with(query="test news query", search_depth="advanced", max_results=5, topic="news")
+        mock_client_instance.post.assert_called_once_with(
+            "/search",
+            json={"api_key": "test_api_key", "query": "test news query", "search_depth": "advanced", "max_results": 5, "topic": "news"},
+        )
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_search_news_error_handling(self, mock_tavily_client):
         """Test news search error handling."""
         # Arrange
         mock_client_instance = Mock()
-        mock_client_instance.search.side_effect = Exception("News API Error")
+        mock_client_instance.post.side_effect = Exception("News API Error")
         mock_tavily_client.return_value = mock_client_instance
 
         adapter = TavilySearchAdapter()
@@ -154,12 +225,12 @@ class TestTavilySearchAdapter:
         assert results == []
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_search_academic_success(self, mock_tavily_client):
         """Test successful academic search."""
         # Arrange
         mock_client_instance = Mock()
-        mock_client_instance.search.return_value = {
+        mock_client_instance.post.return_value.json.return_value = {
             "results": [{"title": "Academic Paper 1", "url": "https://academic.com/1", "content": "Academic content 1", "score": 0.88}]
         }
         mock_tavily_client.return_value = mock_client_instance
@@ -174,17 +245,23 @@ class TestTavilySearchAdapter:
         assert results[0].source.title == "Academic Paper 1"
 
         # Verify API call includes academic sites in query
-        mock_client_instance.search.assert_called_once_with(
-            query="research query site:arxiv.org OR site:scholar.google.com OR site:pubmed.ncbi.nlm.nih.gov", search_depth="advanced", max_results=10
+        mock_client_instance.post.assert_called_once_with(
+            "/search",
+            json={
+                "api_key": "test_api_key",
+                "query": "research query site:arxiv.org OR site:scholar.google.com OR site:pubmed.ncbi.nlm.nih.gov",
+                "search_depth": "advanced",
+                "max_results": 10,
+            },
         )
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_search_academic_error_handling(self, mock_tavily_client):
         """Test academic search error handling."""
         # Arrange
         mock_client_instance = Mock()
-        mock_client_instance.search.side_effect = Exception("Academic API Error")
+        mock_client_instance.post.side_effect = Exception("Academic API Error")
         mock_tavily_client.return_value = mock_client_instance
 
         adapter = TavilySearchAdapter()
@@ -196,7 +273,7 @@ class TestTavilySearchAdapter:
         assert results == []
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_convert_to_evidence(self, mock_tavily_client):
         """Test conversion of search results to Evidence objects."""
         # Arrange
@@ -230,7 +307,7 @@ class TestTavilySearchAdapter:
         assert ev1.hash is None
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_convert_to_evidence_missing_fields(self, mock_tavily_client):
         """Test conversion handles missing fields gracefully."""
         # Arrange
@@ -259,7 +336,7 @@ class TestTavilySearchAdapter:
         assert ev.excerpt == "Content without title"
 
     @patch.dict(os.environ, {"TAVILY_API_KEY": "test_api_key"})
-    @patch("adapters.tavily_search.tavily_client.TavilyClient")
+    @patch("adapters.tavily_search.tavily_client.httpx.Client")
     def test_evidence_id_generation(self, mock_tavily_client):
         """Test evidence ID generation method."""
         # Arrange
@@ -1,10 +1,13 @@
 """
 Tests for the telemetry adapter, including tracing and event logging.
 """
+import json
 import os
 from unittest.mock import MagicMock, patch
 
 from opentelemetry import trace
+from opentelemetry.sdk.trace.sampling import ParentBased
+from opentelemetry.util.http import parse_excluded_urls
 import pytest
 
 from adapters.telemetry.events import (
@@ -49,6 +52,40 @@ class TestTelemetryManager:
         mock_console_exporter.assert_called_once()
         assert len(manager.tracer_provider._active_span_processor._span_processors) == 2
 
+    @patch("adapters.telemetry.tracing.ConsoleSpanExporter")
+    @patch.dict(os.environ, {"ENVIRONMENT": "development", "OTEL_BSP_MAX_QUEUE_SIZE": "1000"}, clear=True)
+    def test_setup_tracing_batch_processor_settings(self, mock_console_exporter):
+        """Test batch processors use burst-friendly defaults with OTEL_BSP_* overrides."""
+        manager = TelemetryManager()
+        manager.setup_tracing()
+
+        processor = manager.tracer_provider._active_span_processor._span_processors[0]
+        assert processor.max_queue_size == 1000
+        assert processor.max_export_batch_size == 256
+        assert processor.schedule_delay_millis == 1000
+        assert processor.export_timeout_millis == 10000
+
+    @patch("adapters.telemetry.tracing.ConsoleSpanExporter")
+    @patch.dict(os.environ, {"ENVIRONMENT": "development", "OTEL_BSP_MAX_QUEUE_SIZE": "100"}, clear=True)
+    def test_setup_tracing_small_queue_clamps_batch_size(self, mock_console_exporter):
+        """Test a queue override below the default batch size shrinks the batch instead of failing."""
+        manager = TelemetryManager()
+        manager.setup_tracing()
+
+        processor = manager.tracer_provider._active_span_processor._span_processors[0]
+        assert processor.max_queue_size == 100
+        assert processor.max_export_batch_size == 100
+
+    @patch.dict(os.environ, {"OTEL_TRACES_SAMPLER_ARG": "0.25"}, clear=True)
+    def test_setup_tracing_parent_based_sampler(self):
+        """Test the tracer provider samples root spans by ratio and children by parent."""
+        manager = TelemetryManager()
+        manager.setup_tracing()
+
+        sampler = manager.tracer_provider.sampler
+        assert isinstance(sampler, ParentBased)
+        assert "TraceIdRatioBased{0.25}" in sampler.get_description()
+
     @patch.dict(os.environ, {}, clear=True)
     def test_setup_tracing_no_exporters(self):
         """Test setup_tracing with no exporters configured."""
@@ -58,6 +95,22 @@ class TestTelemetryManager:
         assert manager.initialized
         assert len(manager.tracer_provider._active_span_processor._span_processors) == 0
 
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("adapters.telemetry.tracing.FastAPIInstrumentor")
+    def test_instrument_fastapi_excludes_polling_endpoints(self, mock_instrumentor):
+        """Test FastAPI instrumentation skips health checks and status polls."""
+        manager = TelemetryManager()
+        app = MagicMock()
+
+        manager.instrument_fastapi(app)
+
+        excluded = parse_excluded_urls(mock_instrumentor.instrument_app.call_args.kwargs["excluded_urls"])
+        assert excluded.url_disabled("http://api/health")
+        assert excluded.url_disabled("http://api/tasks/abc123/status")
+        assert excluded.url_disabled("http://api/deep-research/abc123")
+        assert not excluded.url_disabled("http://api/deep-research")
+        assert not excluded.url_disabled("http://api/reports/abc123")
+
     @patch.object(TelemetryManager, "setup_tracing")
     def test_get_tracer_uninitialized(self, mock_setup):
         """Test that get_tracer calls setup_tracing when not initialized."""
@@ -76,6 +129,20 @@ class TestTelemetryManager:
         mock_setup.assert_called_once()
         assert isinstance(tracer, trace.NoOpTracer)
 
+    @patch.dict(os.environ, {}, clear=True)
+    def test_setup_tracing_is_idempotent(self):
+        """Test repeated setup keeps one tracer provider and shutdown stops it."""
+        manager = TelemetryManager()
+        manager.setup_tracing()
+        provider = manager.tracer_provider
+
+        manager.setup_tracing()
+        with patch.object(provider, "shutdown") as mock_shutdown:
+            manager.shutdown()
+
+        assert manager.tracer_provider is provider
+        mock_shutdown.assert_called_once()
+
     def test_get_tracer_initialized(self):
         """Test that get_tracer returns a real tracer after initialization."""
         manager = TelemetryManager()
@@ -118,6 +185,24 @@ def test_trace_sync_operation_decorator():
     assert status_arg.status_code == trace.StatusCode.OK
 
 
+@pytest.mark.asyncio
+async def test_trace_async_operation_links_parent_context():
+    """Test link_kwarg is consumed by the decorator and becomes a span link."""
+    parent_ctx = trace.SpanContext(trace_id=0x1234, span_id=0x5678, is_remote=True, trace_flags=trace.TraceFlags(trace.TraceFlags.SAMPLED))
+    mock_tracer = MagicMock()
+
+    @trace_async_operation("test_linked_op", link_kwarg="parent_ctx")
+    async def my_async_func(x):
+        return x
+
+    with patch("adapters.telemetry.tracing.get_tracer", return_value=mock_tracer):
+        result = await my_async_func(1, parent_ctx=parent_ctx)
+
+    assert result == 1
+    links = mock_tracer.start_as_current_span.call_args.kwargs["links"]
+    assert [link.context for link in links] == [parent_ctx]
+
+
 @pytest.mark.asyncio
 async def test_trace_async_operation_exception():
     """Test that the decorator properly propagates exceptions."""
@@ -146,6 +231,7 @@ class TestEventLogger:
             data={"query": "test"},
             duration_ms=10.5,
         )
+        logger.close()
 
         assert len(logger.events) == 1
         assert event.event_type == EventType.RESEARCH_STARTED
@@ -194,3 +280,24 @@ class TestEventLogger:
         assert len(lines) == 2
         assert '"event_type": "research.started"' in lines[0]
         assert '"event_type": "plan.created"' in lines[1]
+
+    def test_events_written_in_background_and_flushed_on_close(self, tmp_path):
+        """Test log_event queues the NDJSON write and close() appends every queued event in order."""
+        # Arrange
+        with patch.dict(os.environ, {"ARTIFACTS_DIR": str(tmp_path)}):
+            logger = EventLogger()
+
+        # Act
+        for i in range(50):
+            logger.log_event(EventType.SEARCH_EXECUTED, data={"n": i}, task_id="task-1")
+        logger.close()
+        logger.log_event(EventType.RESEARCH_COMPLETED, task_id="task-1")
+        logger.close()
+
+        # Assert
+        with open(logger.events_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 51
+        assert [json.loads(line)["data"].get("n") for line in lines[:50]] == list(range(50))
+        assert json.loads(lines[-1])["event_type"] == "research.completed"
+        assert logger._writer is None
@@ -0,0 +1,210 @@
+"""
+Unit tests for WeaviateVectorAdapter mock mode.
+"""
+from datetime import datetime
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from weaviate.util import generate_uuid5
+
+from adapters.weaviate_vector.weaviate_adapter import WeaviateVectorAdapter
+from domain.models.evidence import Evidence, EvidenceSource
+
+
+def _evidence(evidence_id: str, excerpt: str) -> Evidence:
+    return Evidence(
+        id=evidence_id,
+        source=EvidenceSource(url=f"https://example.com/{evidence_id}", title=evidence_id, fetched_at=datetime(2025, 1, 2, 3, 4, 5)),
+        excerpt=excerpt,
+    )
+
+
+@pytest.mark.unit
+class TestWeaviateVectorAdapterMock:
+    """Test cases for the in-memory mock store."""
+
+    def test_search_matches_all_query_tokens(self):
+        """Test mock search returns rows containing every query token, in insertion order."""
+        # Arrange
+        adapter = WeaviateVectorAdapter(force_mock=True)
+        adapter.store_evidence(_evidence("e1", "Digital banking in Mexico"), "col")
+        adapter.store_evidence(_evidence("e2", "Mexico fintech regulation"), "col")
+        adapter.store_evidence(_evidence("e3", "Banking regulation in Mexico"), "col")
+
+        # Act
+        results = adapter.search_similar("mexico BANKING", "col", limit=5)
+
+        # Assert
+        assert [ev.id for ev in results] == ["e1", "e3"]
+
+    def test_search_respects_limit_and_unknown_tokens(self):
+        """Test mock search honours limit and returns nothing for unseen tokens."""
+        # Arrange
+        adapter = WeaviateVectorAdapter(force_mock=True)
+        for i in range(5):
+            adapter.store_evidence(_evidence(f"e{i}", "market analysis"), "col")
+
+        # Act & Assert
+        assert len(adapter.search_similar("market", "col", limit=2)) == 2
+        assert adapter.search_similar("competitors", "col") == []
+        assert adapter.search_similar("", "col") == []
+
+    def test_search_ignores_punctuation(self):
+        """Test mock search matches words next to punctuation in both excerpts and queries."""
+        # Arrange
+        adapter = WeaviateVectorAdapter(force_mock=True)
+        adapter.store_evidence(_evidence("e1", "Fintech adoption grew in Mexico."), "col")
+        adapter.store_evidence(_evidence("e2", "Regulation (banking, payments) tightened"), "col")
+
+        # Act & Assert
+        assert [ev.id for ev in adapter.search_similar("mexico", "col")] == ["e1"]
+        assert [ev.id for ev in adapter.search_similar("banking?", "col")] == ["e2"]
+
+    def test_round_trips_fetched_at(self):
+        """Test fetched_at survives the epoch round trip."""
+        # Arrange
+        adapter = WeaviateVectorAdapter(force_mock=True)
+        adapter.store_evidence(_evidence("e1", "market analysis"), "col")
+
+        # Act
+        results = adapter.search_similar("market", "col")
+
+        # Assert
+        assert results[0].source.fetched_at == datetime(2025, 1, 2, 3, 4, 5)
+
+    def test_store_evidence_batch_indexes_every_item(self):
+        """Test a mock batch store counts and indexes each item like single stores."""
+        # Arrange
+        adapter = WeaviateVectorAdapter(force_mock=True)
+
+        # Act
+        stored = adapter.store_evidence_batch([_evidence("e1", "market analysis"), _evidence("e2", "market size")], "col")
+
+        # Assert
+        assert stored == 2
+        assert [ev.id for ev in adapter.search_similar("market", "col")] == ["e1", "e2"]
+
+    def test_delete_collection_drops_index(self):
+        """Test deleting a collection clears mock rows and index."""
+        # Arrange
+        adapter = WeaviateVectorAdapter(force_mock=True)
+        adapter.store_evidence(_evidence("e1", "market analysis"), "col")
+
+        # Act
+        adapter.delete_collection("col")
+
+        # Assert
+        assert adapter.search_similar("market", "col") == []
+        assert "col" not in adapter._mock_index
+
+
+@pytest.mark.unit
+class TestWeaviateVectorAdapterSchema:
+    """Test cases for fetched_at storage against existing Weaviate classes."""
+
+    def _adapter_with_schema(self, fetched_at_type: str) -> WeaviateVectorAdapter:
+        adapter = WeaviateVectorAdapter(force_mock=True)
+        adapter.mock_mode = False
+        adapter.client = MagicMock()
+        adapter.client.schema.get.return_value = {
+            "classes": [{"class": "col", "properties": [{"name": "fetched_at", "dataType": [fetched_at_type]}]}]
+        }
+        return adapter
+
+    def test_legacy_text_schema_stores_iso_fetched_at(self):
+        """Test classes created with a text fetched_at keep receiving ISO strings."""
+        # Arrange
+        adapter = self._adapter_with_schema("text")
+
+        # Act
+        stored = adapter.store_evidence(_evidence("e1", "market analysis"), "col")
+
+        # Assert
+        assert stored is True
+        data_object = adapter.client.data_object.create.call_args.kwargs["data_object"]
+        assert data_object["fetched_at"] == "2025-01-02T03:04:05"
+
+    def test_int_schema_stores_epoch_and_reads_schema_once(self):
+        """Test current classes receive epoch seconds and the schema is only read once."""
+        # Arrange
+        adapter = self._adapter_with_schema("int")
+
+        # Act
+        adapter.store_evidence(_evidence("e1", "market analysis"), "col")
+        adapter.store_evidence(_evidence("e2", "market analysis"), "col")
+
+        # Assert
+        data_object = adapter.client.data_object.create.call_args.kwargs["data_object"]
+        assert data_object["fetched_at"] == 1735787045
+        adapter.client.schema.get.assert_called_once()
+
+    def test_store_evidence_batch_sends_one_request(self):
+        """Test a batch is sent as one /batch/objects request and rejected objects are not counted."""
+        # Arrange
+        adapter = self._adapter_with_schema("text")
+        response = adapter.client._connection.post.return_value
+        response.json.return_value = [
+            {"properties": {"evidence_id": "e1"}, "result": {}},
+            {"properties": {"evidence_id": "e2"}, "result": {"errors": {"error": [{"message": "rejected"}]}}},
+        ]
+
+        # Act
+        stored = adapter.store_evidence_batch([_evidence("e1", "market analysis"), _evidence("e2", "market size")], "col")
+
+        # Assert
+        assert stored == 1
+        adapter.client._connection.post.assert_called_once()
+        body = adapter.client._connection.post.call_args.kwargs["weaviate_object"]
+        assert [obj["properties"]["evidence_id"] for obj in body["objects"]] == ["e1", "e2"]
+        assert body["objects"][0]["id"] == generate_uuid5("e1")
+        assert body["objects"][0]["properties"]["fetched_at"] == "2025-01-02T03:04:05"
+        adapter.client.data_object.create.assert_not_called()
+
+
+@pytest.mark.unit
+class TestWeaviateVectorAdapterSearch:
+    """Test cases for semantic search against a live client."""
+
+    def test_failed_grpc_search_retries_over_graphql(self):
+        """Test a gRPC search returning errors is retried over GraphQL instead of yielding no results."""
+        # Arrange
+        adapter = WeaviateVectorAdapter(force_mock=True)
+        adapter.mock_mode = False
+        adapter.grpc_port = 50051
+        adapter.client = MagicMock()
+        query_builder = adapter.client.query.get.return_value
+        query_builder.with_near_vector.return_value = query_builder
+        query_builder.with_limit.return_value = query_builder
+        query_builder.with_additional.return_value = query_builder
+        query_builder.do.return_value = {"errors": ["connection refused"]}
+        payload = {
+            "data": {
+                "Get": {
+                    "col": [
+                        {
+                            "evidence_id": "e1",
+                            "source_url": "https://example.com/e1",
+                            "source_title": "e1",
+                            "fetched_at": 1735787045,
+                            "excerpt": "market analysis",
+                            "_additional": {"score": "0.8"},
+                        }
+                    ]
+                }
+            }
+        }
+        response = adapter.client._connection.post.return_value
+        response.content = json.dumps(payload).encode()
+        response.json.return_value = payload
+
+        # Act
+        with patch.object(adapter, "_embed", return_value=[[0.1, 0.2]]):
+            results = adapter.search_similar("market", "col")
+
+        # Assert
+        assert [ev.id for ev in results] == ["e1"]
+        assert results[0].score == 0.8
+        query_builder.do.assert_called_once()
+        query_builder.with_additional.assert_called_once_with(["score"])
+        assert adapter.client._connection.post.call_args.kwargs["path"] == "/graphql"
@@ -0,0 +1,118 @@
+"""
+Unit tests for the arq research worker.
+"""
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+pytest.importorskip("arq")
+
+from apps.api import main as api  # noqa: E402
+from apps.worker import main as worker  # noqa: E402
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+@pytest.fixture(autouse=True)
+def isolate_api_globals():
+    """Keep the worker hooks from leaking process state into other tests."""
+    with patch.object(api, "db", None), patch.object(api, "TRACER", api.TRACER), patch.object(api, "telemetry_manager", None):
+        yield
+
+
+@pytest.mark.unit
+class TestWorkerLifecycle:
+    """Test cases for worker startup and shutdown hooks."""
+
+    @patch("apps.worker.main.setup_telemetry")
+    @patch("apps.worker.main.setup_logging")
+    async def test_startup_initializes_shared_state(self, mock_setup_logging, mock_setup_telemetry):
+        """Test startup wires logging, telemetry, the task store and the agent services."""
+        # Arrange
+        mock_db = Mock()
+        ctx = {}
+
+        # Act
+        with patch.object(api, "init_database", AsyncMock(return_value=mock_db)), patch.object(api, "get_services") as mock_get_services:
+            await worker.startup(ctx)
+
+            # Assert
+            assert ctx["log_listener"] is mock_setup_logging.return_value
+            assert api.db is mock_db
+            assert api.TRACER is mock_setup_telemetry.return_value.get_tracer.return_value
+            mock_get_services.assert_called_once()
+
+    @patch("apps.worker.main.setup_telemetry")
+    @patch("apps.worker.main.setup_logging")
+    async def test_startup_requires_shared_task_store(self, mock_setup_logging, mock_setup_telemetry):
+        """Test startup refuses to run without a task store the API can read."""
+        with patch.object(api, "init_database", AsyncMock(return_value=None)):
+            with pytest.raises(RuntimeError, match="shared task store"):
+                await worker.startup({})
+
+    @patch("apps.worker.main.get_event_logger")
+    async def test_shutdown_closes_database_and_listener(self, mock_get_event_logger):
+        """Test shutdown closes the task store and search connections and flushes pending events and log records."""
+        # Arrange
+        mock_db = Mock()
+        mock_db.close = AsyncMock()
+        listener = Mock()
+        mock_services = Mock()
+        mock_services.researcher.aclose = AsyncMock()
+        mock_telemetry = Mock()
+
+        # Act
+        with patch.object(api, "db", mock_db), patch.object(api, "services", mock_services), patch.object(api, "telemetry_manager", mock_telemetry):
+            await worker.shutdown({"log_listener": listener})
+
+        # Assert
+        mock_db.close.assert_awaited_once()
+        mock_services.researcher.close.assert_called_once()
+        mock_services.researcher.aclose.assert_awaited_once()
+        mock_get_event_logger.return_value.close.assert_called_once()
+        mock_telemetry.shutdown.assert_called_once()
+        listener.stop.assert_called_once()
+
+
+@pytest.mark.unit
+class TestWorkerJobs:
+    """Test cases for the enqueued job functions."""
+
+    async def test_run_research_job_links_enqueuing_request(self):
+        """Test the research job runs the pipeline linked to the request's trace context."""
+        with patch.object(api, "run_real_research_pipeline", AsyncMock()) as mock_pipeline:
+            await worker.run_research_job({}, "task-1", "query", trace_carrier={"traceparent": TRACEPARENT})
+
+        args, kwargs = mock_pipeline.call_args
+        assert args == ("task-1", "query")
+        assert kwargs["parent_ctx"].trace_id == 0x0AF7651916CD43DD8448EB211C80319C
+        assert kwargs["parent_ctx"].is_valid
+
+    async def test_run_deep_research_job_rebuilds_request(self):
+        """Test the deep research job rebuilds the request model and tolerates a missing carrier."""
+        with patch.object(api, "run_deep_research_pipeline", AsyncMock()) as mock_pipeline:
+            await worker.run_deep_research_job({}, "task-2", {"query": "deep query", "max_iterations": 2})
+
+        args, kwargs = mock_pipeline.call_args
+        assert args[0] == "task-2"
+        assert args[1] == api.DeepResearchRequest(query="deep query", max_iterations=2)
+        assert not kwargs["parent_ctx"].is_valid
+
+
+@pytest.mark.unit
+class TestJobQueueOptIn:
+    """Test cases for enabling the job queue in the API."""
+
+    @patch.dict("os.environ", {"REDIS_URL": "redis://localhost:6379"}, clear=True)
+    async def test_redis_url_alone_keeps_research_in_process(self):
+        """Test a Redis task store does not switch the API to enqueue-only mode."""
+        with patch.object(api, "db", Mock()), patch.object(api, "create_pool", AsyncMock()) as mock_create_pool:
+            assert await api.init_job_queue() is None
+
+        mock_create_pool.assert_not_called()
+
+    @patch.dict("os.environ", {"REDIS_URL": "redis://localhost:6379", "ALETHEIA_JOB_QUEUE": "arq"}, clear=True)
+    async def test_explicit_opt_in_connects_queue(self):
+        """Test ALETHEIA_JOB_QUEUE=arq connects the queue when a shared task store exists."""
+        with patch.object(api, "db", Mock()), patch.object(api, "create_pool", AsyncMock()) as mock_create_pool:
+            assert await api.init_job_queue() is mock_create_pool.return_value
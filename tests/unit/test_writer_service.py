@@ -68,3 +68,27 @@ def test_enhance_with_rag(mock_weaviate_adapter, mock_saptiva_adapter):
     # Assert
     assert len(enhanced_list) == 2
     mock_weaviate_adapter.return_value.search_similar.assert_called_once_with(query, "collection_name", limit=10)
+
+
+@patch("domain.services.writer_svc.SaptivaModelAdapter")
+@patch("domain.services.writer_svc.WeaviateVectorAdapter")
+def test_enhance_with_rag_skips_duplicate_ids_and_hashes(mock_weaviate_adapter, mock_saptiva_adapter):
+    """Test RAG results already present by id or content hash are dropped and the caller's list is untouched."""
+    # Arrange
+    source = EvidenceSource(url="http://example.com", title="Example")
+    evidence_list = [Evidence(id="1", source=source, excerpt="a", hash="h1")]
+    mock_weaviate_adapter.return_value.search_similar.return_value = [
+        Evidence(id="1", source=source, excerpt="a", hash="h1"),
+        Evidence(id="2", source=source, excerpt="a copy", hash="h1"),
+        Evidence(id="3", source=source, excerpt="b"),
+        Evidence(id="3", source=source, excerpt="b again"),
+        Evidence(id="4", source=source, excerpt="c", hash="h4"),
+    ]
+    writer_service = WriterService()
+
+    # Act
+    enhanced_list = writer_service._enhance_with_rag("Test query", evidence_list, "collection_name")
+
+    # Assert
+    assert [ev.id for ev in enhanced_list] == ["1", "3", "4"]
+    assert len(evidence_list) == 1